@@ -0,0 +1,250 @@
+"""
+Build Pipeline
+Headless exports of the project in src/ (Godot, Unity WebGL, Phaser/vite).
+Sources are fingerprinted from per-file hashes cached by mtime, unchanged
+inputs reuse the previous artifact, and artifacts are stored in builds/ by
+content hash.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from disk_cache import DiskCache
+from project_index import SKIP_DIRS as PROJECT_SKIP_DIRS
+
+# Engine caches, editor state and build outputs that never affect a build's inputs
+SKIP_DIRS = PROJECT_SKIP_DIRS | {'.import', 'obj', 'UserSettings', 'Build', 'Builds', 'dist'}
+
+# Bump when the fingerprint or index layout changes
+INDEX_VERSION = 1
+
+# Threads used to hash changed source files
+HASH_WORKERS = 8
+
+# Lines of build output returned when a build fails
+OUTPUT_TAIL_LINES = 40
+
+# Default per-engine options
+DEFAULT_OPTIONS = {
+    "godot": {"preset": "Web", "output": "index.html"},
+    "unity": {"target": "WebGL", "method": "BuildScript.Build"},
+    "phaser": {},
+}
+
+# Runs an argv in a directory with a timeout; returns a run_shell-style result dict
+CommandRunner = Callable[[list[str], str, float], Awaitable[dict]]
+
+
+def detect_engine(src: Path) -> Optional[str]:
+    """Guess the engine from the project files in src/."""
+    if (src / "project.godot").exists():
+        return "godot"
+    if (src / "ProjectSettings" / "ProjectVersion.txt").exists():
+        return "unity"
+    if (src / "package.json").exists():
+        return "phaser"
+    return None
+
+
+def build_command(engine: str, executable: str, src: Path, out: Path, options: dict) -> list[str]:
+    """Headless export command writing into the out directory."""
+    if engine == "godot":
+        return [executable, "--headless", "--path", str(src),
+                "--export-release", options["preset"], str(out / options["output"])]
+    if engine == "unity":
+        return [executable, "-batchmode", "-quit", "-nographics", "-projectPath", str(src),
+                "-buildTarget", options["target"], "-executeMethod", options["method"],
+                "-buildOutput", str(out), "-logFile", "-"]
+    if engine == "phaser":
+        return [executable, "run", "build", "--", "--outDir", str(out), "--emptyOutDir"]
+    raise ValueError(f"Unknown engine: {engine}")
+
+
+class BuildPipeline:
+    """Fingerprinted, content-addressed builds of one source tree."""
+
+    def __init__(self, project_root: Path, src_dir: str = "src", builds_dir: str = "builds", cache: DiskCache = None):
+        self.project_root = project_root
+        self.src = project_root / src_dir
+        self.builds = project_root / builds_dir
+        self.cache = cache
+        self._lock: Optional[asyncio.Lock] = None
+
+    # -------------------------------------------------------------------------
+    # Fingerprinting
+    # -------------------------------------------------------------------------
+
+    def fingerprint(self, engine: str, options: dict) -> tuple[str, dict]:
+        """Digest of every source file's content plus the build settings."""
+        cached = self.cache.load("build-files", INDEX_VERSION) if self.cache else {}
+        files, stale = {}, []
+
+        for dirpath, dirnames, filenames in os.walk(self.src):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+            for filename in filenames:
+                path = Path(dirpath) / filename
+                rel = path.relative_to(self.project_root).as_posix()
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entry = cached.get(rel)
+                if entry and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                    files[rel] = entry[2]
+                else:
+                    stale.append((rel, path, stat.st_mtime_ns, stat.st_size))
+
+        if stale:
+            with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+                digests = list(pool.map(lambda item: _hash_file(item[1]), stale))
+            for (rel, _, _, _), digest in zip(stale, digests):
+                files[rel] = digest
+            if self.cache is not None:
+                self.cache.put_many("build-files", ((rel, mtime_ns, size, digest)
+                                                    for (rel, _, mtime_ns, size), digest in zip(stale, digests)), INDEX_VERSION)
+
+        prefix = self.src.relative_to(self.project_root).as_posix() + "/"
+        removed = [rel for rel in cached if rel.startswith(prefix) and rel not in files]
+        if removed and self.cache is not None:
+            self.cache.delete("build-files", removed)
+
+        manifest = json.dumps({"engine": engine, "options": options, "files": sorted(files.items())}, sort_keys=True)
+        digest = hashlib.sha256(manifest.encode()).hexdigest()
+        return digest, {"files": len(files), "rehashed": len(stale)}
+
+    # -------------------------------------------------------------------------
+    # Building
+    # -------------------------------------------------------------------------
+
+    async def build(self, engine: str, options: dict, resolve: Callable[[str], Awaitable],
+                    run: CommandRunner, timeout: float, force: bool = False) -> dict:
+        """Export a build unless an artifact for the same inputs already exists."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            return await self._build(engine, options, resolve, run, timeout, force)
+
+    async def _build(self, engine: str, options: dict, resolve: Callable[[str], Awaitable],
+                     run: CommandRunner, timeout: float, force: bool) -> dict:
+        stages = {}
+        started = time.perf_counter()
+        options = {**DEFAULT_OPTIONS[engine], **{k: v for k, v in options.items() if v is not None}}
+
+        clock = time.perf_counter()
+        fingerprint, source = await asyncio.to_thread(self.fingerprint, engine, options)
+        stages["fingerprint"] = _elapsed(clock)
+
+        result = {"engine": engine, "fingerprint": fingerprint[:16], "sources": source, "stages": stages}
+        index = self._load_index()
+        previous = index.get(fingerprint)
+        if previous and not force and (self.project_root / previous["artifact"]).is_dir():
+            result.update(success=True, skipped=True, artifact=previous["artifact"],
+                          files=previous["files"], bytes=previous["bytes"], built_at=previous["built_at"])
+            result["total_s"] = _elapsed(started)
+            return result
+
+        clock = time.perf_counter()
+        tool_name = "npm" if engine == "phaser" else engine
+        executable = await resolve(tool_name)
+        stages["resolve"] = _elapsed(clock)
+        if executable is None:
+            result.update(success=False, error=f"{tool_name} executable not found")
+            return result
+
+        staging = self.builds / ".staging" / uuid.uuid4().hex[:12]
+        staging.mkdir(parents=True)
+        try:
+            clock = time.perf_counter()
+            output = await run(build_command(engine, executable.path, self.src, staging, options), str(self.src), timeout)
+            stages["build"] = _elapsed(clock)
+            log = self._write_log(engine, output)
+            result["log"] = log
+
+            if not output.get("success") or not any(staging.iterdir()):
+                text = (output.get("stdout", "") + output.get("stderr", "")).splitlines()
+                error = output.get("error") or (f"Build exited with code {output.get('returncode')}"
+                                                if not output.get("success") else "Build produced no output")
+                result.update(success=False, error=error,
+                              returncode=output.get("returncode"), output_tail=text[-OUTPUT_TAIL_LINES:])
+                return result
+
+            clock = time.perf_counter()
+            artifact = await asyncio.to_thread(self._store, engine, staging)
+            stages["store"] = _elapsed(clock)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        artifact["built_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        artifact["build_s"] = stages["build"]
+        index[fingerprint] = artifact
+        self._save_index(index)
+
+        result.update(success=True, skipped=False, version=executable.version, **artifact)
+        result["total_s"] = _elapsed(started)
+        return result
+
+    def _store(self, engine: str, staging: Path) -> dict:
+        """Move a finished build to builds/<engine>/<content hash>/, reusing an identical one."""
+        digest = hashlib.sha256()
+        count, total = 0, 0
+        for path in sorted(p for p in staging.rglob("*") if p.is_file()):
+            digest.update(path.relative_to(staging).as_posix().encode() + b"\0" + _hash_file(path).encode())
+            count += 1
+            total += path.stat().st_size
+        content_hash = digest.hexdigest()
+
+        target = self.builds / engine / content_hash[:16]
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(staging, target)
+        return {
+            "artifact": target.relative_to(self.project_root).as_posix(),
+            "content_hash": content_hash[:16],
+            "files": count,
+            "bytes": total,
+        }
+
+    # -------------------------------------------------------------------------
+    # Index and logs
+    # -------------------------------------------------------------------------
+
+    def _load_index(self) -> dict:
+        """Fingerprint -> artifact entries from builds/index.json."""
+        try:
+            data = json.loads((self.builds / "index.json").read_text())
+        except (OSError, ValueError):
+            return {}
+        return data.get("builds", {}) if data.get("version") == INDEX_VERSION else {}
+
+    def _save_index(self, index: dict) -> None:
+        path = self.builds / "index.json"
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "builds": index}, indent=2))
+        os.replace(tmp, path)
+
+    def _write_log(self, engine: str, output: dict) -> str:
+        """Keep the full output of the latest build per engine in builds/logs/."""
+        path = self.builds / "logs" / f"{engine}.log"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(output.get("stdout", "") + output.get("stderr", "") + output.get("error", ""))
+        return path.relative_to(self.project_root).as_posix()
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _elapsed(since: float) -> float:
+    return round(time.perf_counter() - since, 3)
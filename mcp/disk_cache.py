@@ -0,0 +1,97 @@
+"""
+Persistent Cache
+SQLite-backed store shared by the server's indexes so restarts start warm.
+Entries are keyed by (namespace, key) and stamped with the source file's
+mtime and size plus a per-namespace version.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+# Bump when the table layout changes; older databases are rebuilt
+SCHEMA_VERSION = 1
+
+
+class DiskCache:
+    """Namespaced key/value cache with (mtime, size, version) invalidation."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+
+    def _migrate(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT)")
+            row = self._db.execute("SELECT value FROM info WHERE key = 'schema'").fetchone()
+            if row is None or int(row[0]) != SCHEMA_VERSION:
+                self._db.execute("DROP TABLE IF EXISTS entries")
+                self._db.execute("INSERT OR REPLACE INTO info VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " namespace TEXT, key TEXT, mtime_ns INTEGER, size INTEGER, version INTEGER, value TEXT,"
+                " PRIMARY KEY (namespace, key))"
+            )
+
+    def get(self, namespace: str, key: str, mtime_ns: int, size: int, version: int = 1) -> Optional[Any]:
+        """Cached value if its stamp still matches, else None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT mtime_ns, size, version, value FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+        if row is None or tuple(row[:3]) != (mtime_ns, size, version):
+            return None
+        return json.loads(row[3])
+
+    def put(self, namespace: str, key: str, mtime_ns: int, size: int, value: Any, version: int = 1) -> None:
+        self.put_many(namespace, [(key, mtime_ns, size, value)], version)
+
+    def put_many(self, namespace: str, items: Iterable[tuple[str, int, int, Any]], version: int = 1) -> None:
+        """Store (key, mtime_ns, size, value) entries in a single transaction."""
+        rows = [(namespace, key, mtime_ns, size, version, json.dumps(value)) for key, mtime_ns, size, value in items]
+        if not rows:
+            return
+        with self._lock, self._db:
+            self._db.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def load(self, namespace: str, version: int = 1) -> dict[str, tuple[int, int, Any]]:
+        """All current-version entries of a namespace as key -> (mtime_ns, size, value)."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT key, mtime_ns, size, value FROM entries WHERE namespace = ? AND version = ?",
+                (namespace, version)
+            ).fetchall()
+        return {key: (mtime_ns, size, json.loads(value)) for key, mtime_ns, size, value in rows}
+
+    def delete(self, namespace: str, keys: Iterable[str]) -> None:
+        rows = [(namespace, key) for key in keys]
+        if not rows:
+            return
+        with self._lock, self._db:
+            self._db.executemany("DELETE FROM entries WHERE namespace = ? AND key = ?", rows)
+
+    def clear(self, namespace: str = None) -> None:
+        """Drop one namespace, or everything."""
+        with self._lock, self._db:
+            if namespace is None:
+                self._db.execute("DELETE FROM entries")
+            else:
+                self._db.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+
+    def stats(self) -> dict:
+        """Entry counts per namespace."""
+        with self._lock:
+            rows = self._db.execute("SELECT namespace, COUNT(*) FROM entries GROUP BY namespace").fetchall()
+        return {"path": str(self.path), "namespaces": dict(rows)}
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,132 @@
+"""
+Engine Executable Resolver
+Finds engine binaries on PATH and in per-platform install locations without
+running them, verifies each once with --version, and caches the result in the
+DiskCache keyed by the binary's mtime and size. Probes that time out are not
+cached, so a slow cold start is retried on the next lookup.
+"""
+
+import asyncio
+import glob
+import os
+import shutil
+import sys
+from typing import NamedTuple, Optional
+
+from disk_cache import DiskCache
+
+# Bump when the cached entry layout changes
+INDEX_VERSION = 1
+
+# Seconds allowed for a --version probe
+VERSION_TIMEOUT = 10.0
+
+# Candidate locations per engine: PATH names, absolute paths and globs, by platform.
+# An environment variable pointing at the binary is always tried first.
+ENGINES = {
+    "godot": {
+        "env": "GAMEDEV_GODOT_PATH",
+        "version_args": ["--version"],
+        "candidates": {
+            "all": ["godot", "godot4"],
+            "linux": ["~/.local/bin/godot*", "/usr/local/bin/godot*", "/opt/godot/godot*", "/snap/bin/godot*",
+                      "/var/lib/flatpak/exports/bin/org.godotengine.Godot"],
+            "win32": [r"C:\Program Files\Godot\Godot*.exe", r"C:\Godot\Godot*.exe", r"~\scoop\shims\godot.exe"],
+            "darwin": ["/Applications/Godot.app/Contents/MacOS/Godot", "~/Applications/Godot.app/Contents/MacOS/Godot"],
+        },
+    },
+    "unity": {
+        "env": "GAMEDEV_UNITY_PATH",
+        "version_args": ["-version"],
+        "candidates": {
+            "all": ["Unity", "unity-editor"],
+            "linux": ["~/Unity/Hub/Editor/*/Editor/Unity", "/opt/unity/Editor/Unity", "/opt/Unity/Hub/Editor/*/Editor/Unity"],
+            "win32": [r"C:\Program Files\Unity\Hub\Editor\*\Editor\Unity.exe", r"C:\Program Files\Unity\Editor\Unity.exe"],
+            "darwin": ["/Applications/Unity/Hub/Editor/*/Unity.app/Contents/MacOS/Unity"],
+        },
+    },
+    "npm": {
+        "env": "GAMEDEV_NPM_PATH",
+        "version_args": ["--version"],
+        "candidates": {"all": ["npm"]},
+    },
+}
+
+
+class Executable(NamedTuple):
+    """A verified engine binary."""
+    path: str
+    version: str
+
+
+def candidate_paths(engine: str) -> list[str]:
+    """Existing executable paths for an engine, in preference order. Nothing is run."""
+    spec = ENGINES[engine]
+    platform = "linux" if sys.platform.startswith("linux") else sys.platform
+    patterns = spec["candidates"]["all"] + spec["candidates"].get(platform, [])
+    override = os.environ.get(spec["env"])
+    if override:
+        patterns = [override] + patterns
+
+    found, seen = [], set()
+    for pattern in patterns:
+        pattern = os.path.expanduser(pattern)
+        if glob.has_magic(pattern):
+            # Install folders are named by version; try the newest first
+            matches = sorted(glob.glob(pattern), reverse=True)
+        else:
+            matches = [pattern]
+        for match in matches:
+            path = shutil.which(match)
+            if path and os.path.realpath(path) not in seen:
+                seen.add(os.path.realpath(path))
+                found.append(path)
+    return found
+
+
+async def resolve(engine: str, cache: DiskCache = None) -> Optional[Executable]:
+    """First candidate whose --version check passes; each binary is probed once per mtime."""
+    spec = ENGINES[engine]
+    for path in candidate_paths(engine):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        cached = cache.get("executables", path, stat.st_mtime_ns, stat.st_size, INDEX_VERSION) if cache else None
+        if cached is None:
+            try:
+                cached = {"version": await _probe_version(path, spec["version_args"])}
+            except asyncio.TimeoutError:
+                # A slow cold start is not a verdict on the binary; probe it again next time
+                continue
+            if cache is not None:
+                cache.put("executables", path, stat.st_mtime_ns, stat.st_size, cached, INDEX_VERSION)
+        if cached["version"] is not None:
+            return Executable(path, cached["version"])
+    return None
+
+
+async def _probe_version(path: str, version_args: list[str]) -> Optional[str]:
+    """Run the binary once with its version flag; None if it cannot start or exits non-zero.
+
+    Raises asyncio.TimeoutError (after killing it) when it does not answer within VERSION_TIMEOUT.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            path, *version_args,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+        )
+    except OSError:
+        return None
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=VERSION_TIMEOUT)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    if proc.returncode != 0:
+        return None
+    lines = stdout.decode(errors="replace").strip().splitlines()
+    return lines[-1].strip() if lines else ""
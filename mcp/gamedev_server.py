@@ -5,23 +5,50 @@ Provides tools for Godot, Unity, and Phaser game development.
 """
 
 import asyncio
+import importlib
+import inspect
 import json
 import os
+import shlex
 import shutil
+import signal
 import subprocess
 import sys
+import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, NamedTuple, Optional
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+from processes import STREAM_PAGE_BYTES, OutputLogStore, ProcessRegistry
+from project_index import TreeIndex, flatten_tree, render_tree
+
 # Get the project root (parent of mcp folder)
 PROJECT_ROOT = Path(__file__).parent.parent.absolute()
 
+# Indexes persisted between server runs
+CACHE_DIR = Path(__file__).parent.absolute() / ".cache"
+
+# Skill helper scripts (skills/<skill>/scripts/*.py) exposed as tools
+SKILLS_DIR = PROJECT_ROOT / "skills"
+
+# Project and script scaffolds rendered by the *_create_* tools
+TEMPLATES_DIR = Path(__file__).parent.absolute() / "templates"
+
 server = Server("gamedev-server")
 
+# Long-lived children (dev server, game runs) outlive the tool call that started them
+background = ProcessRegistry()
+
+# Output of streamed run_command calls, paged with command_output cursors
+output_logs = OutputLogStore()
+
+# Directory listings for project_structure, rescanned only where mtimes changed
+tree_index = TreeIndex(PROJECT_ROOT)
+
 
 # =============================================================================
 # UTILITY FUNCTIONS
@@ -32,835 +59,1186 @@ def get_project_root() -> Path:
     return PROJECT_ROOT
 
 
-def run_shell(cmd: str, cwd: str = None) -> dict:
-    """Run a shell command and return result."""
-    try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            cwd=cwd or str(PROJECT_ROOT),
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-        return {
-            "success": result.returncode == 0,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "returncode": result.returncode
-        }
-    except subprocess.TimeoutExpired:
-        return {"success": False, "error": "Command timed out after 60s"}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+# Heavier subsystems are imported and built on first use so startup stays fast
 
+@lru_cache(maxsize=None)
+def get_disk_cache():
+    """Persistent cache shared by every index; entries keyed by path, mtime and size."""
+    from disk_cache import DiskCache
+    return DiskCache(CACHE_DIR / "server.db")
 
-# =============================================================================
-# TOOL DEFINITIONS
-# =============================================================================
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available tools."""
-    return [
-        # Project Tools
-        Tool(
-            name="project_structure",
-            description="Get the current project file/folder structure as a tree",
-            inputSchema={"type": "object", "properties": {}, "required": []}
-        ),
-        Tool(
-            name="project_todo",
-            description="Read or update the TASKS.md file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "action": {"type": "string", "enum": ["read", "write", "append"]},
-                    "content": {"type": "string", "description": "Content to write (for write/append)"}
-                },
-                "required": ["action"]
-            }
-        ),
-        Tool(
-            name="project_design",
-            description="Read or update the GAME_DESIGN.md file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "action": {"type": "string", "enum": ["read", "write"]},
-                    "content": {"type": "string", "description": "Content to write"}
-                },
-                "required": ["action"]
-            }
-        ),
-        Tool(
-            name="run_command",
-            description="Execute a shell command in the project directory",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "command": {"type": "string", "description": "The command to run"}
-                },
-                "required": ["command"]
-            }
-        ),
+@lru_cache(maxsize=None)
+def get_unity_assets():
+    """Objects in Unity YAML files under src/Assets, rescanned per file on change."""
+    from unity_yaml import UnityAssetIndex
+    return UnityAssetIndex(PROJECT_ROOT, cache=get_disk_cache())
 
-        # Godot Tools
-        Tool(
-            name="godot_create_project",
-            description="Create a new Godot 4 project with starter template",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Project name"}
-                },
-                "required": ["name"]
-            }
-        ),
-        Tool(
-            name="godot_create_script",
-            description="Create a new GDScript file with boilerplate",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Script name (without .gd)"},
-                    "type": {"type": "string", "enum": ["node", "player", "enemy", "ui", "manager"], "description": "Script type for boilerplate"}
-                },
-                "required": ["name", "type"]
-            }
-        ),
-        Tool(
-            name="godot_run",
-            description="Launch the Godot project for testing",
-            inputSchema={"type": "object", "properties": {}, "required": []}
-        ),
-
-        # Unity Tools
-        Tool(
-            name="unity_create_project",
-            description="Create a new Unity project",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Project name"}
-                },
-                "required": ["name"]
-            }
-        ),
-        Tool(
-            name="unity_create_script",
-            description="Create a new C# script with boilerplate",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Script name (without .cs)"},
-                    "type": {"type": "string", "enum": ["monobehaviour", "scriptableobject", "manager"], "description": "Script type"}
-                },
-                "required": ["name", "type"]
-            }
-        ),
 
-        # Phaser Tools
-        Tool(
-            name="phaser_create_project",
-            description="Create a new Phaser.js project with npm",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Project name"}
-                },
-                "required": ["name"]
-            }
-        ),
-        Tool(
-            name="phaser_dev_server",
-            description="Start or stop the Phaser development server",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "action": {"type": "string", "enum": ["start", "stop", "status"]}
-                },
-                "required": ["action"]
-            }
-        ),
-    ]
+@lru_cache(maxsize=None)
+def get_guid_graph():
+    """GUID -> path map and reference graph from .meta files."""
+    from guid_graph import GuidGraph
+    return GuidGraph(PROJECT_ROOT, cache=get_disk_cache())
 
 
-# =============================================================================
-# TOOL IMPLEMENTATIONS
-# =============================================================================
+@lru_cache(maxsize=None)
+def get_scene_analyzer():
+    """Streaming .unity scene analyses, cached per scene by mtime."""
+    from unity_scene import SceneAnalyzer
+    return SceneAnalyzer(PROJECT_ROOT, cache=get_disk_cache())
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-    """Handle tool calls."""
 
-    result = None
+@lru_cache(maxsize=None)
+def get_project_doc(name: str):
+    """A docs/ markdown file with a cached heading index."""
+    from markdown_sections import MarkdownDoc
+    return MarkdownDoc(PROJECT_ROOT / "docs" / name)
 
-    # ----- PROJECT TOOLS -----
-    if name == "project_structure":
-        result = get_project_structure()
 
-    elif name == "project_todo":
-        result = handle_todo(arguments)
+@lru_cache(maxsize=None)
+def get_templates():
+    """Scaffold templates under mcp/templates/, compiled on first use."""
+    from scaffolds import TemplateStore
+    return TemplateStore(TEMPLATES_DIR)
 
-    elif name == "project_design":
-        result = handle_design(arguments)
 
-    elif name == "run_command":
-        result = run_shell(arguments["command"])
+@lru_cache(maxsize=None)
+def load_skill_script(skill: str, module: str):
+    """Import skills/<skill>/scripts/<module>.py on first use (scripts may need numpy/Pillow)."""
+    scripts_dir = str(SKILLS_DIR / skill / "scripts")
+    if scripts_dir not in sys.path:
+        sys.path.append(scripts_dir)
+    return importlib.import_module(module)
 
-    # ----- GODOT TOOLS -----
-    elif name == "godot_create_project":
-        result = create_godot_project(arguments["name"])
 
-    elif name == "godot_create_script":
-        result = create_godot_script(arguments["name"], arguments["type"])
+@lru_cache(maxsize=None)
+def get_build_pipeline():
+    """Fingerprinted headless builds of src/ into builds/."""
+    from build_pipeline import BuildPipeline
+    return BuildPipeline(PROJECT_ROOT, cache=get_disk_cache())
 
-    elif name == "godot_run":
-        result = run_godot()
 
-    # ----- UNITY TOOLS -----
-    elif name == "unity_create_project":
-        result = create_unity_project(arguments["name"])
+async def find_engine(engine: str):
+    """Resolve an engine binary once per binary mtime (see executables.py)."""
+    from executables import resolve
+    return await resolve(engine, get_disk_cache())
 
-    elif name == "unity_create_script":
-        result = create_unity_script(arguments["name"], arguments["type"])
 
-    # ----- PHASER TOOLS -----
-    elif name == "phaser_create_project":
-        result = create_phaser_project(arguments["name"])
+def render_script_template(engine: str, script_type: str, default: str, suffix: str, params: dict) -> str:
+    """Render templates/<engine>/scripts/<type><suffix>, falling back to the default type."""
+    store = get_templates()
+    rel = f"{engine}/scripts/{script_type}{suffix}"
+    if not store.exists(rel):
+        rel = f"{engine}/scripts/{default}{suffix}"
+    return store.render(rel, params)
 
-    elif name == "phaser_dev_server":
-        result = handle_phaser_server(arguments["action"])
 
-    else:
-        result = {"error": f"Unknown tool: {name}"}
+def pool_params(args: dict) -> dict:
+    """Capacity and growth parameters shared by the templates/*/scripts/pool.* object pools."""
+    growth = args.get("growth", DEFAULT_POOL_GROWTH)
+    if growth not in POOL_GROWTH:
+        raise ValueError(f"Unknown growth policy '{growth}'. Options: {', '.join(POOL_GROWTH)}")
+    capacity, max_size = int(args.get("capacity", DEFAULT_POOL_CAPACITY)), int(args.get("max_size", 0))
+    if capacity < 0 or max_size < 0:
+        raise ValueError("capacity and max_size must not be negative")
+    return {"capacity": capacity, "growth": growth, "max_size": max_size}
 
-    return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
+def write_files(base: Path, files: dict[str, str], dirs: list[str] = ()) -> dict[str, str]:
+    """Write rendered files below base in one parallel pass, skipping identical ones."""
+    from scaffolds import write_files as write_all
+    return write_all(base, files, dirs)
 
-# =============================================================================
-# PROJECT TOOL IMPLEMENTATIONS
-# =============================================================================
 
-def get_project_structure() -> dict:
-    """Get project file tree."""
-    def tree(path: Path, prefix: str = "") -> list[str]:
-        lines = []
-        items = sorted(path.iterdir(), key=lambda x: (x.is_file(), x.name))
+# Object pool scripts: instances created up front and what to do when they run out
+DEFAULT_POOL_CAPACITY = 32
+DEFAULT_POOL_GROWTH = "grow"
+POOL_GROWTH = ["fixed", "grow", "recycle"]
+
+# Shell execution limits (override via environment)
+DEFAULT_COMMAND_TIMEOUT = float(os.environ.get("GAMEDEV_COMMAND_TIMEOUT", "60"))
+MAX_CONCURRENT_COMMANDS = int(os.environ.get("GAMEDEV_MAX_CONCURRENT_COMMANDS", "4"))
+
+# Lines (or JSON entries) returned per project_structure page
+STRUCTURE_PAGE_SIZE = 500
+
+# Seconds a headless engine export may run before it is killed
+BUILD_TIMEOUT = float(os.environ.get("GAMEDEV_BUILD_TIMEOUT", "1800"))
+
+# Most calls accepted by one batch request
+MAX_BATCH_CALLS = 50
+
+# Longest a streamed run_command waits for its first page of output
+STREAM_FIRST_PAGE_WAIT = 2.0
 
-        # Skip certain directories
-        skip = {'.git', 'node_modules', '__pycache__', '.godot', 'Library', 'Temp', 'Logs'}
-        items = [i for i in items if i.name not in skip]
+# Created lazily so it binds to the running event loop
+_command_slots: Optional[asyncio.Semaphore] = None
 
-        for i, item in enumerate(items):
-            is_last = i == len(items) - 1
-            connector = "└── " if is_last else "├── "
-            lines.append(f"{prefix}{connector}{item.name}")
+# In-flight commands by call id, so they can be cancelled individually
+_inflight_commands: dict[str, asyncio.subprocess.Process] = {}
+_cancelled_commands: set[str] = set()
 
-            if item.is_dir():
-                extension = "    " if is_last else "│   "
-                lines.extend(tree(item, prefix + extension))
 
-        return lines
+def _get_command_slots() -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent shell commands."""
+    global _command_slots
+    if _command_slots is None:
+        _command_slots = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
+    return _command_slots
 
+
+async def _terminate_process(proc: asyncio.subprocess.Process) -> None:
+    """Kill a shell process together with any children it spawned."""
+    if proc.returncode is not None:
+        return
     try:
-        lines = [str(PROJECT_ROOT.name) + "/"]
-        lines.extend(tree(PROJECT_ROOT))
-        return {"success": True, "tree": "\n".join(lines)}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+        if sys.platform != "win32":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+    await proc.wait()
+
+
+async def run_shell(cmd: str, cwd: str = None, timeout: float = None, call_id: str = None) -> dict:
+    """Run a shell command without blocking the event loop and return result."""
+    timeout = timeout or DEFAULT_COMMAND_TIMEOUT
+    call_id = call_id or uuid.uuid4().hex[:8]
+
+    async with _get_command_slots():
+        try:
+            proc = await asyncio.create_subprocess_shell(
+                cmd,
+                cwd=cwd or str(PROJECT_ROOT),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=sys.platform != "win32"
+            )
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+        _inflight_commands[call_id] = proc
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            await _terminate_process(proc)
+            return {"success": False, "error": f"Command timed out after {timeout:g}s"}
+        except asyncio.CancelledError:
+            await _terminate_process(proc)
+            raise
+        finally:
+            _inflight_commands.pop(call_id, None)
+
+    if call_id in _cancelled_commands:
+        _cancelled_commands.discard(call_id)
+        return {"success": False, "cancelled": True, "error": f"Command {call_id} was cancelled"}
 
+    return {
+        "success": proc.returncode == 0,
+        "stdout": stdout.decode(errors="replace"),
+        "stderr": stderr.decode(errors="replace"),
+        "returncode": proc.returncode
+    }
 
-def handle_todo(args: dict) -> dict:
-    """Handle TASKS.md operations."""
-    todo_path = PROJECT_ROOT / "docs" / "TASKS.md"
 
-    if args["action"] == "read":
-        if todo_path.exists():
-            return {"success": True, "content": todo_path.read_text()}
-        return {"success": False, "error": "TASKS.md not found"}
+async def run_shell_streaming(cmd: str, cwd: str = None, timeout: float = None,
+                              call_id: str = None, max_bytes: int = STREAM_PAGE_BYTES) -> dict:
+    """Start a shell command and return its first page of output plus a cursor for the rest."""
+    log = output_logs.create(cmd)
+    log.task = asyncio.create_task(_stream_command(log, cmd, cwd, timeout or DEFAULT_COMMAND_TIMEOUT, call_id))
+    await log.wait_for(max_bytes, STREAM_FIRST_PAGE_WAIT)
+    return output_logs.page(f"{log.id}:0", max_bytes)
+
+
+async def _stream_command(log, cmd: str, cwd: str, timeout: float, call_id: str) -> None:
+    """Copy a command's combined output into its log chunk by chunk as it arrives."""
+    call_id = call_id or log.id
+    deadline = asyncio.get_running_loop().time() + timeout
+
+    async with _get_command_slots():
+        try:
+            proc = await asyncio.create_subprocess_shell(
+                cmd,
+                cwd=cwd or str(PROJECT_ROOT),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                start_new_session=sys.platform != "win32"
+            )
+        except Exception as e:
+            log.finish(None, str(e))
+            return
+
+        _inflight_commands[call_id] = proc
+        try:
+            while True:
+                remaining = deadline - asyncio.get_running_loop().time()
+                chunk = await asyncio.wait_for(proc.stdout.read(65536), max(remaining, 0))
+                if not chunk:
+                    break
+                log.write(chunk)
+            await proc.wait()
+        except asyncio.TimeoutError:
+            await _terminate_process(proc)
+            log.finish(proc.returncode, f"Command timed out after {timeout:g}s")
+            return
+        except asyncio.CancelledError:
+            await _terminate_process(proc)
+            log.finish(proc.returncode, "cancelled")
+            raise
+        finally:
+            _inflight_commands.pop(call_id, None)
+
+    if call_id in _cancelled_commands:
+        _cancelled_commands.discard(call_id)
+        log.finish(proc.returncode, f"Command {call_id} was cancelled")
+        return
+    log.finish(proc.returncode)
+
+
+async def read_command_output(cursor: str, max_bytes: int = STREAM_PAGE_BYTES, wait: float = 0) -> dict:
+    """Read the next page of a streamed command, optionally waiting for it to fill."""
+    log_id, _, offset = cursor.partition(":")
+    log = output_logs.get(log_id)
+    if log is not None and wait > 0 and offset.isdigit():
+        await log.wait_for(int(offset) + max_bytes, wait)
+    return output_logs.page(cursor, max_bytes)
+
+
+def _page_size(args: dict) -> int:
+    """Clamp a requested page size so every page makes progress."""
+    return max(int(args.get("max_bytes") or STREAM_PAGE_BYTES), 256)
+
+
+async def cancel_command(call_id: str) -> dict:
+    """Cancel an in-flight run_command call by its call id."""
+    proc = _inflight_commands.get(call_id)
+    if proc is None:
+        return {"success": False, "error": f"No running command with id '{call_id}'"}
+
+    _cancelled_commands.add(call_id)
+    await _terminate_process(proc)
+    return {"success": True, "message": f"Cancelled command {call_id}"}
 
-    elif args["action"] == "write":
-        todo_path.parent.mkdir(parents=True, exist_ok=True)
-        todo_path.write_text(args.get("content", ""))
-        return {"success": True, "message": "TASKS.md updated"}
 
-    elif args["action"] == "append":
-        todo_path.parent.mkdir(parents=True, exist_ok=True)
-        existing = todo_path.read_text() if todo_path.exists() else ""
-        todo_path.write_text(existing + "\n" + args.get("content", ""))
-        return {"success": True, "message": "Appended to TASKS.md"}
+# =============================================================================
+# TOOL REGISTRY
+# =============================================================================
 
-    return {"success": False, "error": "Invalid action"}
+class ToolSpec(NamedTuple):
+    """A registered tool: its schema (built once) and its handler."""
+    tool: Tool
+    handler: Callable[[dict], Any]
 
 
-def handle_design(args: dict) -> dict:
-    """Handle GAME_DESIGN.md operations."""
-    design_path = PROJECT_ROOT / "docs" / "GAME_DESIGN.md"
+# Tool name -> spec, filled by @tool as the implementations below are defined
+TOOLS: dict[str, ToolSpec] = {}
 
-    if args["action"] == "read":
-        if design_path.exists():
-            return {"success": True, "content": design_path.read_text()}
-        return {"success": False, "error": "GAME_DESIGN.md not found"}
 
-    elif args["action"] == "write":
-        design_path.parent.mkdir(parents=True, exist_ok=True)
-        design_path.write_text(args.get("content", ""))
-        return {"success": True, "message": "GAME_DESIGN.md updated"}
+def tool(name: str, description: str, properties: dict = None, required: list[str] = None):
+    """Register a handler taking the tool's arguments dict (sync or async)."""
+    def register(handler: Callable[[dict], Any]) -> Callable[[dict], Any]:
+        schema = {"type": "object", "properties": properties or {}, "required": required or []}
+        TOOLS[name] = ToolSpec(Tool(name=name, description=description, inputSchema=schema), handler)
+        return handler
+    return register
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available tools."""
+    return [spec.tool for spec in TOOLS.values()]
 
-    return {"success": False, "error": "Invalid action"}
+
+async def dispatch(name: str, arguments: dict) -> dict:
+    """Run a registered tool handler."""
+    spec = TOOLS.get(name)
+    if spec is None:
+        return {"error": f"Unknown tool: {name}"}
+    result = spec.handler(arguments or {})
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+    """Handle tool calls."""
+    result = await dispatch(name, arguments)
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
 
 # =============================================================================
-# GODOT TOOL IMPLEMENTATIONS
+# PROJECT TOOL IMPLEMENTATIONS
 # =============================================================================
 
-def create_godot_project(name: str) -> dict:
-    """Create a Godot 4 project."""
-    src_dir = PROJECT_ROOT / "src"
-    src_dir.mkdir(exist_ok=True)
-
-    # Create project.godot
-    project_file = src_dir / "project.godot"
-    project_content = f'''[gd_resource type="Resource" script_class="ProjectSettings" load_steps=1 format=3]
-
-config_version=5
-
-[application]
-config/name="{name}"
-run/main_scene="res://scenes/main.tscn"
-config/features=PackedStringArray("4.2", "Forward Plus")
-
-[display]
-window/size/viewport_width=1280
-window/size/viewport_height=720
-
-[input]
-move_left={{
-"deadzone": 0.5,
-"events": [Object(InputEventKey,"resource_local_to_scene":false,"resource_name":"","device":-1,"window_id":0,"alt_pressed":false,"shift_pressed":false,"ctrl_pressed":false,"meta_pressed":false,"pressed":false,"keycode":65,"physical_keycode":0,"key_label":0,"unicode":97,"echo":false,"script":null), Object(InputEventKey,"resource_local_to_scene":false,"resource_name":"","device":-1,"window_id":0,"alt_pressed":false,"shift_pressed":false,"ctrl_pressed":false,"meta_pressed":false,"pressed":false,"keycode":4194319,"physical_keycode":0,"key_label":0,"unicode":0,"echo":false,"script":null)]
-}}
-move_right={{
-"deadzone": 0.5,
-"events": [Object(InputEventKey,"resource_local_to_scene":false,"resource_name":"","device":-1,"window_id":0,"alt_pressed":false,"shift_pressed":false,"ctrl_pressed":false,"meta_pressed":false,"pressed":false,"keycode":68,"physical_keycode":0,"key_label":0,"unicode":100,"echo":false,"script":null), Object(InputEventKey,"resource_local_to_scene":false,"resource_name":"","device":-1,"window_id":0,"alt_pressed":false,"shift_pressed":false,"ctrl_pressed":false,"meta_pressed":false,"pressed":false,"keycode":4194321,"physical_keycode":0,"key_label":0,"unicode":0,"echo":false,"script":null)]
-}}
-move_up={{
-"deadzone": 0.5,
-"events": [Object(InputEventKey,"resource_local_to_scene":false,"resource_name":"","device":-1,"window_id":0,"alt_pressed":false,"shift_pressed":false,"ctrl_pressed":false,"meta_pressed":false,"pressed":false,"keycode":87,"physical_keycode":0,"key_label":0,"unicode":119,"echo":false,"script":null), Object(InputEventKey,"resource_local_to_scene":false,"resource_name":"","device":-1,"window_id":0,"alt_pressed":false,"shift_pressed":false,"ctrl_pressed":false,"meta_pressed":false,"pressed":false,"keycode":4194320,"physical_keycode":0,"key_label":0,"unicode":0,"echo":false,"script":null)]
-}}
-move_down={{
-"deadzone": 0.5,
-"events": [Object(InputEventKey,"resource_local_to_scene":false,"resource_name":"","device":-1,"window_id":0,"alt_pressed":false,"shift_pressed":false,"ctrl_pressed":false,"meta_pressed":false,"pressed":false,"keycode":83,"physical_keycode":0,"key_label":0,"unicode":115,"echo":false,"script":null), Object(InputEventKey,"resource_local_to_scene":false,"resource_name":"","device":-1,"window_id":0,"alt_pressed":false,"shift_pressed":false,"ctrl_pressed":false,"meta_pressed":false,"pressed":false,"keycode":4194322,"physical_keycode":0,"key_label":0,"unicode":0,"echo":false,"script":null)]
-}}
-jump={{
-"deadzone": 0.5,
-"events": [Object(InputEventKey,"resource_local_to_scene":false,"resource_name":"","device":-1,"window_id":0,"alt_pressed":false,"shift_pressed":false,"ctrl_pressed":false,"meta_pressed":false,"pressed":false,"keycode":32,"physical_keycode":0,"key_label":0,"unicode":32,"echo":false,"script":null)]
-}}
-'''
-    project_file.write_text(project_content)
-
-    # Create directories
-    (src_dir / "scenes").mkdir(exist_ok=True)
-    (src_dir / "scripts").mkdir(exist_ok=True)
-    (src_dir / "assets").mkdir(exist_ok=True)
-
-    # Create main scene
-    main_scene = src_dir / "scenes" / "main.tscn"
-    main_scene.write_text('''[gd_scene load_steps=1 format=3]
-
-[node name="Main" type="Node2D"]
-''')
-
-    # Create game manager script
-    game_manager = src_dir / "scripts" / "game_manager.gd"
-    game_manager.write_text('''extends Node
-
-## Game Manager - Central game state and logic
-
-var score: int = 0
-var is_paused: bool = false
-
-func _ready() -> void:
-    print("Game started!")
-
-func add_score(amount: int) -> void:
-    score += amount
-    print("Score: ", score)
-
-func pause_game() -> void:
-    is_paused = true
-    get_tree().paused = true
-
-func resume_game() -> void:
-    is_paused = false
-    get_tree().paused = false
-''')
-
-    return {
-        "success": True,
-        "message": f"Created Godot project '{name}'",
-        "files_created": [
-            "src/project.godot",
-            "src/scenes/main.tscn",
-            "src/scripts/game_manager.gd"
-        ]
+@tool(
+    "project_structure",
+    "Get the current project file/folder structure as a tree",
+    {
+        "path": {"type": "string", "description": "Subdirectory to show, relative to the project root (e.g. src/Assets/Scripts)"},
+        "depth": {"type": "integer", "description": "Maximum directory depth to expand; deeper directories show a file count (default: unlimited)"},
+        "include": {"type": "array", "items": {"type": "string"}, "description": "Only show files matching these globs, e.g. ['*.cs']"},
+        "exclude": {"type": "array", "items": {"type": "string"}, "description": "Hide files and directories matching these globs"},
+        "hide_meta": {"type": "boolean", "description": "Hide Unity .meta files"},
+        "format": {"type": "string", "enum": ["tree", "json"], "description": "ASCII tree (default) or compact JSON entries"},
+        "offset": {"type": "integer", "description": "First line/entry to return (default 0)"},
+        "limit": {"type": "integer", "description": f"Maximum lines/entries to return (default {STRUCTURE_PAGE_SIZE})"}
     }
+)
+def get_project_structure(args: dict) -> dict:
+    """Get a filtered, paged project file tree from the incremental tree index."""
+    subpath = args.get("path", "")
+    try:
+        rel = tree_index.resolve(subpath)
+    except ValueError:
+        return {"success": False, "error": f"Path is outside the project: {subpath}"}
 
+    if tree_index.listing(rel) is None:
+        return {"success": False, "error": f"Directory not found: {subpath}"}
 
-def create_godot_script(name: str, script_type: str) -> dict:
-    """Create a GDScript file with boilerplate."""
-    scripts_dir = PROJECT_ROOT / "src" / "scripts"
-    scripts_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        nodes = tree_index.query(
+            rel,
+            depth=args.get("depth"),
+            include=args.get("include"),
+            exclude=args.get("exclude"),
+            hide_meta=args.get("hide_meta", False)
+        )
+        offset = max(args.get("offset", 0), 0)
+        limit = max(args.get("limit", STRUCTURE_PAGE_SIZE), 1)
+
+        if args.get("format") == "json":
+            rows = flatten_tree(nodes)
+        else:
+            rows = render_tree(nodes)
+        page = rows[offset:offset + limit]
+
+        result = {"success": True, "total": len(rows), "offset": offset, "returned": len(page)}
+        if offset + limit < len(rows):
+            result["next_offset"] = offset + limit
+
+        if args.get("format") == "json":
+            result["root"] = rel
+            result["entries"] = page
+        else:
+            header = [(rel or str(PROJECT_ROOT.name)) + "/"] if offset == 0 else []
+            result["tree"] = "\n".join(header + page)
+        return result
+    except Exception as e:
+        return {"success": False, "error": str(e)}
 
-    script_path = scripts_dir / f"{name}.gd"
 
-    templates = {
-        "node": '''extends Node
+# Shared by project_todo and project_design: whole-document or per-heading access
+MARKDOWN_DOC_PROPERTIES = {
+    "action": {"type": "string", "enum": ["read", "write", "append", "outline", "replace", "toggle"]},
+    "content": {"type": "string", "description": "Content to write (write/append), or the new section body (replace)"},
+    "section": {"type": "string", "description": "Heading title or '## Heading' line; limits read/append/toggle to that section"},
+    "item": {"type": "string", "description": "Checklist item text to tick or untick (toggle)"},
+    "checked": {"type": "boolean", "description": "State to set for toggle (default: flip)"}
+}
 
-func _ready() -> void:
-    pass
 
-func _process(delta: float) -> void:
-    pass
-''',
-        "player": '''extends CharacterBody2D
+@tool(
+    "project_todo",
+    "Read or update the TASKS.md file, whole or by heading",
+    MARKDOWN_DOC_PROPERTIES,
+    required=["action"]
+)
+def handle_todo(args: dict) -> dict:
+    """Handle TASKS.md operations."""
+    return handle_markdown_doc("TASKS.md", args)
 
-@export var speed: float = 200.0
-@export var jump_force: float = 400.0
 
-var gravity: float = ProjectSettings.get_setting("physics/2d/default_gravity")
+@tool(
+    "project_design",
+    "Read or update the GAME_DESIGN.md file, whole or by heading",
+    MARKDOWN_DOC_PROPERTIES,
+    required=["action"]
+)
+def handle_design(args: dict) -> dict:
+    """Handle GAME_DESIGN.md operations."""
+    return handle_markdown_doc("GAME_DESIGN.md", args)
 
-func _physics_process(delta: float) -> void:
-    # Gravity
-    if not is_on_floor():
-        velocity.y += gravity * delta
 
-    # Jump
-    if Input.is_action_just_pressed("jump") and is_on_floor():
-        velocity.y = -jump_force
+def handle_markdown_doc(name: str, args: dict) -> dict:
+    """Section-addressed operations on a docs/ markdown file."""
+    doc = get_project_doc(name)
+    action = args["action"]
+    content = args.get("content", "")
 
-    # Movement
-    var direction := Input.get_axis("move_left", "move_right")
-    velocity.x = direction * speed
+    try:
+        if action == "write":
+            status = doc.write(content)
+            return {"success": True, "message": f"{name} {'unchanged' if status == 'unchanged' else 'updated'}", "status": status}
+
+        if not doc.path.exists():
+            if action != "append":
+                return {"success": False, "error": f"{name} not found"}
+            doc.path.parent.mkdir(parents=True, exist_ok=True)
+            doc.path.touch()
+
+        # Sections are resolved under the file lock by each operation, so offsets never go stale
+        heading = args.get("section") or None
+
+        if action == "read":
+            return {"success": True, "content": doc.read(heading)}
+
+        elif action == "outline":
+            return {"success": True, "sections": doc.outline()}
+
+        elif action == "append":
+            title = doc.append(content, heading)
+            return {"success": True, "message": f"Appended to {title or name}"}
+
+        elif action == "replace":
+            if heading is None:
+                return {"success": False, "error": "replace requires a section"}
+            status = doc.replace(heading, content)
+            return {"success": True, "message": f"Replaced section '{heading}'", "status": status}
+
+        elif action == "toggle":
+            if not args.get("item"):
+                return {"success": False, "error": "toggle requires an item"}
+            return doc.toggle(args["item"], args.get("checked"), heading)
+
+        return {"success": False, "error": "Invalid action"}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
 
-    move_and_slide()
-''',
-        "enemy": '''extends CharacterBody2D
 
-@export var speed: float = 100.0
-@export var health: int = 3
+@tool(
+    "run_command",
+    "Execute a shell command in the project directory",
+    {
+        "command": {"type": "string", "description": "The command to run"},
+        "timeout": {"type": "number", "description": f"Seconds before the command is killed (default {DEFAULT_COMMAND_TIMEOUT:g})"},
+        "call_id": {"type": "string", "description": "Optional id so the call can be stopped with cancel_command"},
+        "stream": {"type": "boolean", "description": "Return the first page of output as it arrives plus a cursor for command_output"},
+        "max_bytes": {"type": "integer", "description": f"Bytes of output per page when streaming (default {STREAM_PAGE_BYTES})"}
+    },
+    required=["command"]
+)
+async def handle_run_command(args: dict) -> dict:
+    """Run a shell command, optionally streaming its output in pages."""
+    if args.get("stream"):
+        return await run_shell_streaming(
+            args["command"],
+            timeout=args.get("timeout"),
+            call_id=args.get("call_id"),
+            max_bytes=_page_size(args)
+        )
+    return await run_shell(
+        args["command"],
+        timeout=args.get("timeout"),
+        call_id=args.get("call_id")
+    )
 
-signal died
 
-func _physics_process(delta: float) -> void:
-    # Basic patrol or chase logic here
-    move_and_slide()
+@tool(
+    "command_output",
+    "Page through the output of a streamed run_command call using its cursor",
+    {
+        "cursor": {"type": "string", "description": "Cursor returned by run_command or a previous command_output call"},
+        "max_bytes": {"type": "integer", "description": f"Bytes of output to return (default {STREAM_PAGE_BYTES})"},
+        "wait": {"type": "number", "description": "Seconds to wait for more output if the command is still running (default 0)"}
+    },
+    required=["cursor"]
+)
+async def handle_command_output(args: dict) -> dict:
+    """Read the next page of a streamed command."""
+    return await read_command_output(args["cursor"], _page_size(args), args.get("wait", 0))
 
-func take_damage(amount: int) -> void:
-    health -= amount
-    if health <= 0:
-        die()
 
-func die() -> void:
-    died.emit()
-    queue_free()
-''',
-        "ui": '''extends Control
+@tool(
+    "cancel_command",
+    "Cancel a running run_command call by its call_id",
+    {
+        "call_id": {"type": "string", "description": "The call_id passed to run_command"}
+    },
+    required=["call_id"]
+)
+async def handle_cancel_command(args: dict) -> dict:
+    """Cancel an in-flight run_command call."""
+    return await cancel_command(args["call_id"])
 
-func _ready() -> void:
-    pass
 
-func update_display() -> void:
-    pass
-''',
-        "manager": '''extends Node
+@tool(
+    "batch",
+    "Run several tool calls in one round-trip. Calls without depends_on run concurrently; a call waits for the ids it depends on",
+    {
+        "calls": {
+            "type": "array",
+            "description": f"Up to {MAX_BATCH_CALLS} calls",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string", "description": "Name for this call (default: its index)"},
+                    "tool": {"type": "string", "description": "Tool to call"},
+                    "arguments": {"type": "object", "description": "Arguments for the tool"},
+                    "depends_on": {"type": "array", "items": {"type": "string"}, "description": "Ids that must succeed before this call runs"}
+                },
+                "required": ["tool"]
+            }
+        },
+        "sequential": {"type": "boolean", "description": "Run every call in order, each depending on the previous one"}
+    },
+    required=["calls"]
+)
+async def handle_batch(args: dict) -> dict:
+    """Run a dependency-ordered batch of tool calls and aggregate the results."""
+    calls = args["calls"]
+    if len(calls) > MAX_BATCH_CALLS:
+        return {"success": False, "error": f"A batch is limited to {MAX_BATCH_CALLS} calls"}
+
+    ids = [str(call.get("id", i)) for i, call in enumerate(calls)]
+    if len(set(ids)) != len(ids):
+        return {"success": False, "error": "Batch call ids must be unique"}
+
+    deps = {}
+    for i, (call_id, call) in enumerate(zip(ids, calls)):
+        if call.get("tool") == "batch":
+            return {"success": False, "error": "Batches cannot be nested"}
+        deps[call_id] = [str(d) for d in call.get("depends_on", [])]
+        if args.get("sequential") and i > 0:
+            deps[call_id].append(ids[i - 1])
+        unknown = [d for d in deps[call_id] if d not in ids]
+        if unknown:
+            return {"success": False, "error": f"Call '{call_id}' depends on unknown ids: {unknown}"}
+
+    if _has_cycle(deps):
+        return {"success": False, "error": "Batch dependencies contain a cycle"}
+
+    done: dict[str, asyncio.Future] = {call_id: asyncio.get_running_loop().create_future() for call_id in ids}
+
+    async def run(call_id: str, call: dict) -> dict:
+        entry = {"id": call_id, "tool": call["tool"]}
+        outcomes = [await done[d] for d in deps[call_id]]
+        if not all(outcomes):
+            done[call_id].set_result(False)
+            return {**entry, "status": "skipped", "reason": "a dependency failed"}
+        try:
+            result = await dispatch(call["tool"], call.get("arguments", {}))
+        except Exception as e:
+            result = {"success": False, "error": f"{type(e).__name__}: {e}"}
+        ok = "error" not in result and result.get("success", True) is not False
+        done[call_id].set_result(ok)
+        return {**entry, "status": "ok" if ok else "error", "result": result}
+
+    results = await asyncio.gather(*(run(call_id, call) for call_id, call in zip(ids, calls)))
+    counts = {status: sum(r["status"] == status for r in results) for status in ("ok", "error", "skipped")}
+    return {"success": counts["ok"] == len(results), **counts, "results": list(results)}
+
+
+def _has_cycle(deps: dict[str, list[str]]) -> bool:
+    """Detect a cycle in the batch dependency graph."""
+    state: dict[str, int] = {}
+
+    def visit(node: str) -> bool:
+        if state.get(node) == 1:
+            return True
+        if state.get(node) == 2:
+            return False
+        state[node] = 1
+        if any(visit(dep) for dep in deps.get(node, [])):
+            return True
+        state[node] = 2
+        return False
+
+    return any(visit(node) for node in deps)
 
-## Manager for handling game subsystem
 
-func _ready() -> void:
-    pass
+# =============================================================================
+# GODOT TOOL IMPLEMENTATIONS
+# =============================================================================
 
-func initialize() -> void:
-    pass
+@tool(
+    "godot_create_project",
+    "Create a new Godot 4 project with starter template",
+    {
+        "name": {"type": "string", "description": "Project name"}
+    },
+    required=["name"]
+)
+def create_godot_project(args: dict) -> dict:
+    """Create a Godot 4 project."""
+    name = args["name"]
+    files, dirs = get_templates().render_scaffold("godot/project", {"name": name})
+    statuses = write_files(PROJECT_ROOT / "src", files, dirs)
 
-func cleanup() -> void:
-    pass
-'''
+    return {
+        "success": True,
+        "message": f"Created Godot project '{name}'",
+        "files": {f"src/{rel}": status for rel, status in statuses.items()}
     }
 
-    content = templates.get(script_type, templates["node"])
-    script_path.write_text(content)
+
+@tool(
+    "godot_create_script",
+    "Create a new GDScript file with boilerplate",
+    {
+        "name": {"type": "string", "description": "Script name (without .gd); also the class_name of a pool"},
+        "type": {"type": "string", "enum": ["node", "player", "enemy", "ui", "manager", "pool"], "description": "Script type for boilerplate"},
+        "scene": {"type": "string", "description": "pool: scene to pool (res:// or src/-relative .tscn path)"},
+        "capacity": {"type": "integer", "description": f"pool: instances created in _ready (default {DEFAULT_POOL_CAPACITY})"},
+        "growth": {"type": "string", "enum": POOL_GROWTH, "description": f"pool: when empty return null, instantiate more, or reuse the oldest (default {DEFAULT_POOL_GROWTH})"},
+        "max_size": {"type": "integer", "description": "pool: most instances when growing (default 0 = unbounded)"}
+    },
+    required=["name", "type"]
+)
+def create_godot_script(args: dict) -> dict:
+    """Create a GDScript file with boilerplate."""
+    name, script_type = args["name"], args["type"]
+    scripts_dir = PROJECT_ROOT / "src" / "scripts"
+    script_path = scripts_dir / f"{name}.gd"
+
+    params = {"name": name}
+    if script_type == "pool":
+        try:
+            params.update(pool_params(args))
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+        params["growth"] = params["growth"].upper()
+        scene = args.get("scene", "")
+        if scene and not scene.startswith("res://"):
+            scene = "res://" + scene.replace("\\", "/").removeprefix("src/")
+        params["scene_init"] = f' = preload("{scene}")' if scene else ""
+    content = render_script_template("godot", script_type, "node", ".gd", params)
+    status = write_files(scripts_dir, {script_path.name: content})[script_path.name]
 
     return {
         "success": True,
         "message": f"Created {script_type} script: {name}.gd",
-        "path": str(script_path)
+        "path": str(script_path),
+        "status": status
     }
 
 
-def run_godot() -> dict:
-    """Run the Godot project."""
-    # Try to find Godot executable
-    godot_paths = [
-        "godot",
-        "godot4",
-        r"C:\Program Files\Godot\Godot.exe",
-        r"C:\Godot\Godot_v4.2-stable_win64.exe",
-        "/Applications/Godot.app/Contents/MacOS/Godot"
-    ]
+@tool(
+    "godot_run",
+    "Launch the Godot project for testing as a background process, or manage the running game",
+    {
+        "action": {"type": "string", "enum": ["start", "stop", "status", "restart", "tail"], "description": "Default: start"},
+        "lines": {"type": "integer", "description": "Output lines to return for tail (default 50)"}
+    }
+)
+async def run_godot(args: dict) -> dict:
+    """Run the Godot project as a supervised background process."""
+    action = args.get("action", "start")
+    if action != "start":
+        return await manage_background("godot", action, args.get("lines", 50))
 
     project_file = PROJECT_ROOT / "src" / "project.godot"
     if not project_file.exists():
         return {"success": False, "error": "No Godot project found in src/"}
 
-    for godot_path in godot_paths:
-        result = run_shell(f'"{godot_path}" --path "{PROJECT_ROOT / "src"}"')
-        if result.get("success") or "not found" not in result.get("stderr", "").lower():
-            return {"success": True, "message": "Godot launched", "output": result}
+    godot = await find_engine("godot")
+    if godot is None:
+        return {
+            "success": False,
+            "error": "Godot not found. Install Godot 4 and add to PATH (or set GAMEDEV_GODOT_PATH), or open project manually."
+        }
 
-    return {
-        "success": False,
-        "error": "Godot not found. Install Godot 4 and add to PATH, or open project manually."
-    }
+    result = await background.start("godot", [godot.path, "--path", str(PROJECT_ROOT / "src")], cwd=str(PROJECT_ROOT / "src"))
+    result["godot_version"] = godot.version
+    return result
 
 
 # =============================================================================
 # UNITY TOOL IMPLEMENTATIONS
 # =============================================================================
 
-def create_unity_project(name: str) -> dict:
-    """Create a Unity project structure (manual Unity opening required)."""
-    src_dir = PROJECT_ROOT / "src"
-    src_dir.mkdir(exist_ok=True)
-
-    # Create Unity-style folder structure
-    (src_dir / "Assets" / "Scripts").mkdir(parents=True, exist_ok=True)
-    (src_dir / "Assets" / "Scenes").mkdir(parents=True, exist_ok=True)
-    (src_dir / "Assets" / "Prefabs").mkdir(parents=True, exist_ok=True)
-    (src_dir / "Assets" / "Materials").mkdir(parents=True, exist_ok=True)
-
-    # Create a basic GameManager script
-    game_manager = src_dir / "Assets" / "Scripts" / "GameManager.cs"
-    game_manager.write_text(f'''using UnityEngine;
-
-public class GameManager : MonoBehaviour
-{{
-    public static GameManager Instance {{ get; private set; }}
-
-    public int Score {{ get; private set; }}
-    public bool IsPaused {{ get; private set; }}
-
-    void Awake()
-    {{
-        if (Instance == null)
-        {{
-            Instance = this;
-            DontDestroyOnLoad(gameObject);
-        }}
-        else
-        {{
-            Destroy(gameObject);
-        }}
-    }}
-
-    void Start()
-    {{
-        Debug.Log("{name} started!");
-    }}
-
-    public void AddScore(int amount)
-    {{
-        Score += amount;
-        Debug.Log($"Score: {{Score}}");
-    }}
-
-    public void TogglePause()
-    {{
-        IsPaused = !IsPaused;
-        Time.timeScale = IsPaused ? 0f : 1f;
-    }}
-}}
-''')
-
-    # Create PlayerController
-    player_controller = src_dir / "Assets" / "Scripts" / "PlayerController.cs"
-    player_controller.write_text('''using UnityEngine;
-
-public class PlayerController : MonoBehaviour
-{
-    [Header("Movement")]
-    public float moveSpeed = 5f;
-    public float jumpForce = 10f;
-
-    private Rigidbody2D rb;
-    private bool isGrounded;
-
-    void Start()
-    {
-        rb = GetComponent<Rigidbody2D>();
-    }
-
-    void Update()
+@tool(
+    "unity_create_project",
+    "Create a new Unity project",
     {
-        // Horizontal movement
-        float horizontal = Input.GetAxisRaw("Horizontal");
-        rb.velocity = new Vector2(horizontal * moveSpeed, rb.velocity.y);
-
-        // Jump
-        if (Input.GetButtonDown("Jump") && isGrounded)
-        {
-            rb.velocity = new Vector2(rb.velocity.x, jumpForce);
-        }
-    }
-
-    void OnCollisionEnter2D(Collision2D collision)
-    {
-        if (collision.gameObject.CompareTag("Ground"))
-        {
-            isGrounded = true;
-        }
-    }
-
-    void OnCollisionExit2D(Collision2D collision)
-    {
-        if (collision.gameObject.CompareTag("Ground"))
-        {
-            isGrounded = false;
-        }
-    }
-}
-''')
+        "name": {"type": "string", "description": "Project name"}
+    },
+    required=["name"]
+)
+def create_unity_project(args: dict) -> dict:
+    """Create a Unity project structure (manual Unity opening required)."""
+    name = args["name"]
+    files, dirs = get_templates().render_scaffold("unity/project", {"name": name})
+    statuses = write_files(PROJECT_ROOT / "src", files, dirs)
 
     return {
         "success": True,
         "message": f"Created Unity project structure for '{name}'",
         "note": "Open Unity Hub and create new project at src/ folder, or open existing project there",
-        "files_created": [
-            "src/Assets/Scripts/GameManager.cs",
-            "src/Assets/Scripts/PlayerController.cs"
-        ]
+        "files": {f"src/{rel}": status for rel, status in statuses.items()}
     }
 
 
-def create_unity_script(name: str, script_type: str) -> dict:
+@tool(
+    "unity_create_script",
+    "Create a new C# script with boilerplate",
+    {
+        "name": {"type": "string", "description": "Script name (without .cs)"},
+        "type": {"type": "string", "enum": ["monobehaviour", "scriptableobject", "manager"], "description": "Script type"}
+    },
+    required=["name", "type"]
+)
+def create_unity_script(args: dict) -> dict:
     """Create a C# script for Unity."""
+    name, script_type = args["name"], args["type"]
     scripts_dir = PROJECT_ROOT / "src" / "Assets" / "Scripts"
-    scripts_dir.mkdir(parents=True, exist_ok=True)
-
     script_path = scripts_dir / f"{name}.cs"
 
-    templates = {
-        "monobehaviour": f'''using UnityEngine;
-
-public class {name} : MonoBehaviour
-{{
-    void Start()
-    {{
-
-    }}
-
-    void Update()
-    {{
-
-    }}
-}}
-''',
-        "scriptableobject": f'''using UnityEngine;
-
-[CreateAssetMenu(fileName = "{name}", menuName = "Game/{name}")]
-public class {name} : ScriptableObject
-{{
-    public string displayName;
-    public int value;
-}}
-''',
-        "manager": f'''using UnityEngine;
-
-public class {name} : MonoBehaviour
-{{
-    public static {name} Instance {{ get; private set; }}
-
-    void Awake()
-    {{
-        if (Instance == null)
-        {{
-            Instance = this;
-            DontDestroyOnLoad(gameObject);
-        }}
-        else
-        {{
-            Destroy(gameObject);
-        }}
-    }}
-
-    void Start()
-    {{
-        Initialize();
-    }}
-
-    void Initialize()
-    {{
-
-    }}
-}}
-'''
+    content = render_script_template("unity", script_type, "monobehaviour", ".cs", {"name": name})
+    status = write_files(scripts_dir, {script_path.name: content})[script_path.name]
+
+    return {
+        "success": True,
+        "message": f"Created {script_type} script: {name}.cs",
+        "path": str(script_path),
+        "status": status
     }
 
-    content = templates.get(script_type, templates["monobehaviour"])
-    script_path.write_text(content)
+
+@tool(
+    "unity_create_pool",
+    "Create a prewarmed object pool MonoBehaviour for a prefab's component (Get/Release instead of "
+    "Instantiate/Destroy) with a capacity and growth policy",
+    {
+        "component": {"type": "string", "description": "Pooled type: a component on the prefab (e.g. Bullet) or GameObject"},
+        "name": {"type": "string", "description": "Pool class name (default <component>Pool)"},
+        "capacity": {"type": "integer", "description": f"Instances created in Awake (default {DEFAULT_POOL_CAPACITY})"},
+        "growth": {"type": "string", "enum": POOL_GROWTH, "description": f"When empty: return null, instantiate more, or reuse the oldest (default {DEFAULT_POOL_GROWTH})"},
+        "max_size": {"type": "integer", "description": "Most instances when growing (default 0 = unbounded)"}
+    },
+    required=["component"]
+)
+def create_unity_pool(args: dict) -> dict:
+    """Create a typed object pool script for Unity."""
+    component = args["component"]
+    name = args.get("name") or f"{component.rsplit('.', 1)[-1]}Pool"
+    try:
+        params = pool_params(args)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    params.update(name=name, component=component, growth=params["growth"].capitalize())
+    scripts_dir = PROJECT_ROOT / "src" / "Assets" / "Scripts"
+    script_path = scripts_dir / f"{name}.cs"
+
+    content = render_script_template("unity", "pool", "pool", ".cs", params)
+    status = write_files(scripts_dir, {script_path.name: content})[script_path.name]
 
     return {
         "success": True,
-        "message": f"Created {script_type} script: {name}.cs",
-        "path": str(script_path)
+        "message": f"Created pool script: {name}.cs",
+        "path": str(script_path),
+        "status": status,
+        "usage": f"Add {name} to a scene object, assign the prefab, then {name}.Instance.Get(position, rotation) "
+                 f"and {name}.Instance.Release(item) in place of Instantiate/Destroy"
     }
 
 
 # =============================================================================
-# PHASER TOOL IMPLEMENTATIONS
+# UNITY ASSET INDEX IMPLEMENTATIONS
 # =============================================================================
 
-def create_phaser_project(name: str) -> dict:
-    """Create a Phaser.js project."""
-    src_dir = PROJECT_ROOT / "src"
-    src_dir.mkdir(exist_ok=True)
-
-    # Create package.json
-    package_json = src_dir / "package.json"
-    package_json.write_text(json.dumps({
-        "name": name.lower().replace(" ", "-"),
-        "version": "1.0.0",
-        "description": f"{name} - Game Jam Project",
-        "scripts": {
-            "dev": "npx vite",
-            "build": "npx vite build",
-            "preview": "npx vite preview"
-        },
-        "dependencies": {
-            "phaser": "^3.70.0"
-        },
-        "devDependencies": {
-            "vite": "^5.0.0"
-        }
-    }, indent=2))
-
-    # Create index.html
-    index_html = src_dir / "index.html"
-    index_html.write_text(f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{name}</title>
-    <style>
-        body {{
-            margin: 0;
-            padding: 0;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            min-height: 100vh;
-            background: #1a1a2e;
-        }}
-    </style>
-</head>
-<body>
-    <script type="module" src="/main.js"></script>
-</body>
-</html>
-''')
-
-    # Create main.js
-    main_js = src_dir / "main.js"
-    main_js.write_text('''import Phaser from 'phaser';
-import { GameScene } from './scenes/GameScene.js';
-
-const config = {
-    type: Phaser.AUTO,
-    width: 800,
-    height: 600,
-    backgroundColor: '#2d2d2d',
-    physics: {
-        default: 'arcade',
-        arcade: {
-            gravity: { y: 300 },
-            debug: false
-        }
+@tool(
+    "unity_asset_summary",
+    "Summarize the Unity YAML objects under src/Assets: object counts per class and per file"
+)
+def handle_unity_summary(args: dict) -> dict:
+    """Summarize indexed Unity objects."""
+    unity_assets = get_unity_assets()
+    refresh = unity_assets.refresh()
+    return {"success": True, "refresh": refresh, **unity_assets.summary()}
+
+
+@tool(
+    "unity_find_objects",
+    "Find objects in Unity .asset/.unity/.prefab files by class, script, name or file, optionally returning selected fields",
+    {
+        "class": {"type": "string", "description": "Unity class name or ID, e.g. MonoBehaviour, SpriteRenderer, 114"},
+        "script": {"type": "string", "description": "Script class (e.g. BossData) or m_Script GUID"},
+        "name": {"type": "string", "description": "Substring of m_Name"},
+        "file": {"type": "string", "description": "Glob on the file path, e.g. *.unity or src/Assets/Data/*"},
+        "fields": {"type": "array", "items": {"type": "string"}, "description": "Dotted field paths to return for each match, e.g. ['bossName', 'phases']"},
+        "offset": {"type": "integer", "description": "First match to return (default 0)"},
+        "limit": {"type": "integer", "description": "Maximum matches to return (default 50)"}
+    }
+)
+def handle_unity_find(args: dict) -> dict:
+    """Find indexed Unity objects, parsing only the matches that need fields."""
+    from unity_yaml import select_fields
+
+    unity_assets = get_unity_assets()
+    unity_assets.refresh()
+    matches = unity_assets.find(
+        class_name=args.get("class"),
+        script=args.get("script"),
+        name=args.get("name"),
+        file=args.get("file")
+    )
+    offset = max(args.get("offset", 0), 0)
+    limit = max(args.get("limit", 50), 1)
+
+    objects = []
+    for record in matches[offset:offset + limit]:
+        entry = record.summary()
+        if args.get("fields"):
+            entry["fields"] = select_fields(unity_assets.load(record), args["fields"])
+        objects.append(entry)
+
+    result = {"success": True, "total": len(matches), "offset": offset, "objects": objects}
+    if offset + limit < len(matches):
+        result["next_offset"] = offset + limit
+    return result
+
+
+@tool(
+    "unity_get_object",
+    "Read one parsed object from a Unity YAML file by fileID",
+    {
+        "file": {"type": "string", "description": "File path relative to the project root"},
+        "fileID": {"type": "integer", "description": "Object fileID (the &anchor in the document header)"},
+        "fields": {"type": "array", "items": {"type": "string"}, "description": "Dotted field paths to return instead of the whole object"}
     },
-    scene: [GameScene]
-};
+    required=["file", "fileID"]
+)
+def handle_unity_get(args: dict) -> dict:
+    """Read one parsed Unity object."""
+    from unity_yaml import select_fields
+
+    unity_assets = get_unity_assets()
+    unity_assets.refresh()
+    record = unity_assets.get(args["file"], int(args["fileID"]))
+    if record is None:
+        return {"success": False, "error": f"No object {args['fileID']} in {args['file']}"}
+
+    data = unity_assets.load(record)
+    if args.get("fields"):
+        data = select_fields(data, args["fields"])
+    return {"success": True, **record.summary(), "data": data}
+
+
+@tool(
+    "scene_inspect",
+    "Summarize a .unity scene without reading its YAML: GameObject hierarchy outline, component counts and "
+    "cost flags (unbatched sprites, colliders without rigidbodies on non-static objects, missing scripts)",
+    {
+        "scene": {"type": "string", "description": "Scene path relative to the project root (default: every scene under src/Assets, without hierarchy)"},
+        "max_depth": {"type": "integer", "description": "Deepest hierarchy level to outline (default 3)"},
+        "hierarchy": {"type": "boolean", "description": "Include the hierarchy outline (default true for a single scene)"},
+        "limit": {"type": "integer", "description": "Examples listed per issue (default 20)"}
+    }
+)
+def handle_scene_inspect(args: dict) -> dict:
+    """Streamed, cached scene analysis reduced to a compact summary."""
+    from unity_scene import summarize
+
+    if args.get("scene"):
+        scenes = [args["scene"]]
+    else:
+        scenes = sorted(p.relative_to(PROJECT_ROOT).as_posix() for p in (PROJECT_ROOT / "src" / "Assets").rglob("*.unity"))
+    missing = [scene for scene in scenes if not (PROJECT_ROOT / scene).is_file()]
+    if missing:
+        return {"success": False, "error": f"Scene not found: {', '.join(missing)}"}
+
+    guid_graph = get_guid_graph()
+    guid_graph.refresh()
+    known_guids = set(guid_graph.guid_to_path)
+
+    analyzer = get_scene_analyzer()
+    results = {}
+    for scene in scenes:
+        analysis, cached = analyzer.analyze(scene)
+        results[scene] = summarize(
+            analysis, known_guids,
+            max_depth=args.get("max_depth", 3),
+            limit=max(args.get("limit", 20), 1),
+            hierarchy=args.get("hierarchy", len(scenes) == 1)
+        )
+        results[scene]["cached"] = cached
+
+    if len(scenes) == 1:
+        return {"success": True, "scene": scenes[0], **results[scenes[0]]}
+    return {"success": True, "count": len(results), "scenes": results}
 
-const game = new Phaser.Game(config);
-''')
 
-    # Create scenes folder and GameScene
-    scenes_dir = src_dir / "scenes"
-    scenes_dir.mkdir(exist_ok=True)
+def _resolve_asset(asset: str) -> tuple[Optional[str], Optional[dict]]:
+    """Refresh the GUID graph and resolve an asset path or GUID."""
+    guid_graph = get_guid_graph()
+    guid_graph.refresh()
+    guid = guid_graph.resolve(asset)
+    if guid is None:
+        return None, {"success": False, "error": f"Unknown asset or GUID: {asset}"}
+    return guid, None
 
-    game_scene = scenes_dir / "GameScene.js"
-    game_scene.write_text('''import Phaser from 'phaser';
 
-export class GameScene extends Phaser.Scene {
-    constructor() {
-        super({ key: 'GameScene' });
-        this.score = 0;
+@tool(
+    "asset_references",
+    "List the assets that reference a Unity asset (by path or GUID)",
+    {
+        "asset": {"type": "string", "description": "Asset path (e.g. Assets/Data/Bosses/Boss_BronzeMask.asset) or GUID"}
+    },
+    required=["asset"]
+)
+def handle_asset_references(args: dict) -> dict:
+    """What references an asset."""
+    guid, error = _resolve_asset(args["asset"])
+    if error:
+        return error
+    guid_graph = get_guid_graph()
+    referrers = guid_graph.references(guid)
+    return {"success": True, "asset": guid_graph.guid_to_path[guid], "guid": guid, "count": len(referrers), "referenced_by": referrers}
+
+
+@tool(
+    "asset_dependencies",
+    "List the assets a Unity asset depends on (by path or GUID)",
+    {
+        "asset": {"type": "string", "description": "Asset path or GUID"},
+        "recursive": {"type": "boolean", "description": "Follow dependencies transitively"}
+    },
+    required=["asset"]
+)
+def handle_asset_dependencies(args: dict) -> dict:
+    """What an asset depends on."""
+    guid, error = _resolve_asset(args["asset"])
+    if error:
+        return error
+    guid_graph = get_guid_graph()
+    deps = guid_graph.dependencies(guid, args.get("recursive", False))
+    return {"success": True, "asset": guid_graph.guid_to_path[guid], "guid": guid, **deps}
+
+
+@tool(
+    "unused_assets",
+    "List assets under src/Assets that nothing references (build scenes, Resources and Editor folders count as used)",
+    {
+        "include_scripts": {"type": "boolean", "description": "Also list .cs scripts with no GUID references (default false)"}
     }
+)
+def handle_unused_assets(args: dict) -> dict:
+    """Assets with no incoming references."""
+    guid_graph = get_guid_graph()
+    guid_graph.refresh()
+    unused = guid_graph.unreferenced(args.get("include_scripts", False))
+    return {"success": True, "count": len(unused), "assets": unused}
+
 
-    preload() {
-        // Load assets here
-        // this.load.image('player', 'assets/player.png');
+# =============================================================================
+# ASSET PIPELINE IMPLEMENTATIONS
+# =============================================================================
+
+@tool(
+    "sprite_atlas",
+    "Pack sprite folders into power-of-two atlases (MaxRects) with a JSON/Unity rect manifest",
+    {
+        "dirs": {"type": "array", "items": {"type": "string"}, "description": "Sprite folders (default ['src/Assets/Sprites'])"},
+        "output_dir": {"type": "string", "description": "Where atlases and manifest go (default src/Assets/Art/Atlases)"},
+        "name": {"type": "string", "description": "Atlas base name (default 'sprites')"},
+        "padding": {"type": "integer", "description": "Pixels between sprites (default 2)"},
+        "bleed": {"type": "integer", "description": "Edge pixels extruded around each sprite (default 1)"},
+        "max_size": {"type": "integer", "description": "Largest atlas page side, a power of two (default 2048)"},
+        "trim": {"type": "boolean", "description": "Crop transparent borders before packing (default true)"}
     }
+)
+async def handle_sprite_atlas(args: dict) -> dict:
+    """Pack sprites with the asset-optimization skill's atlas packer."""
+    try:
+        optimizer = load_skill_script("asset-optimization", "asset_optimizer")
+        options = {key: args[key] for key in ("output_dir", "name", "padding", "bleed", "max_size", "trim") if key in args}
+        return await asyncio.to_thread(optimizer.pack_atlas, args.get("dirs"), root=PROJECT_ROOT, **options)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
 
-    create() {
-        // Create game objects
-        this.add.text(400, 300, 'Game Jam!', {
-            fontSize: '48px',
-            fill: '#fff'
-        }).setOrigin(0.5);
-
-        // Create player (placeholder rectangle)
-        this.player = this.add.rectangle(400, 500, 32, 32, 0x00ff00);
-        this.physics.add.existing(this.player);
-        this.player.body.setCollideWorldBounds(true);
-
-        // Setup controls
-        this.cursors = this.input.keyboard.createCursorKeys();
-
-        // Score text
-        this.scoreText = this.add.text(16, 16, 'Score: 0', {
-            fontSize: '24px',
-            fill: '#fff'
-        });
+@tool(
+    "optimize_textures",
+    "Trim, resize, palette-quantize and mipmap textures for a platform into builds/optimized/<platform>/ "
+    "(cached per file; reports asset_size_mb and compression_ratio)",
+    {
+        "platform": {"type": "string", "enum": ["pc", "console", "mobile", "web"], "description": "Default: pc"},
+        "dirs": {"type": "array", "items": {"type": "string"}, "description": "Texture folders (default ['src/Assets/Sprites'])"},
+        "colors": {"type": "integer", "description": "Palette size; 0 keeps full colour (default: 256 on mobile/web)"},
+        "max_size": {"type": "integer", "description": "Largest side after downscaling (default per platform)"},
+        "premultiply": {"type": "boolean", "description": "Store premultiplied alpha"},
+        "mipmaps": {"type": "boolean", "description": "Also write _mip<N>.png levels"},
+        "trim": {"type": "boolean", "description": "Crop transparent borders (default true)"}
     }
+)
+async def handle_optimize_textures(args: dict) -> dict:
+    """Run the asset-optimization skill's texture pipeline."""
+    try:
+        optimizer = load_skill_script("asset-optimization", "asset_optimizer")
+        return await asyncio.to_thread(
+            optimizer.optimize, "textures", args.get("platform", "pc"), args.get("dirs"),
+            colors=args.get("colors"), premultiply_alpha=args.get("premultiply", False),
+            mipmaps=args.get("mipmaps", False), trim=args.get("trim", True),
+            max_size=args.get("max_size"), root=PROJECT_ROOT
+        )
+    except Exception as e:
+        return {"success": False, "error": str(e)}
 
-    update() {
-        const speed = 200;
 
-        // Horizontal movement
-        if (this.cursors.left.isDown) {
-            this.player.body.setVelocityX(-speed);
-        } else if (this.cursors.right.isDown) {
-            this.player.body.setVelocityX(speed);
-        } else {
-            this.player.body.setVelocityX(0);
-        }
+@tool(
+    "psd_export",
+    "List or export PSD layers as trimmed PNGs (default into src/Assets/Art/Sprites/<psd name>/); "
+    "only layers whose pixel data changed are re-exported",
+    {
+        "file": {"type": "string", "description": "PSD path relative to the project root, e.g. 'assets/Art.psd'"},
+        "action": {"type": "string", "enum": ["list", "export"], "description": "Default: export"},
+        "layers": {"type": "array", "items": {"type": "string"}, "description": "Layer names or group paths to export (default all)"},
+        "output_dir": {"type": "string", "description": "Destination folder relative to the project root"},
+        "include_hidden": {"type": "boolean", "description": "Export hidden layers too (default true)"},
+        "trim": {"type": "boolean", "description": "Crop transparent borders (default true)"},
+        "force": {"type": "boolean", "description": "Re-export unchanged layers"}
+    },
+    required=["file"]
+)
+async def handle_psd_export(args: dict) -> dict:
+    """Read PSD layers with the asset-optimization skill's PSD reader."""
+    try:
+        psd_layers = load_skill_script("asset-optimization", "psd_layers")
+        if args.get("action") == "list":
+            return await asyncio.to_thread(psd_layers.list_layers, args["file"], root=PROJECT_ROOT)
+        return await asyncio.to_thread(
+            psd_layers.export_layers, args["file"], args.get("output_dir"), args.get("layers"),
+            args.get("include_hidden", True), args.get("trim", True), args.get("force", False), root=PROJECT_ROOT
+        )
+    except Exception as e:
+        return {"success": False, "error": str(e)}
 
-        // Jump
-        if (this.cursors.up.isDown && this.player.body.touching.down) {
-            this.player.body.setVelocityY(-330);
-        }
+
+@tool(
+    "optimize_audio",
+    "Trim silence, normalize loudness and resample WAVs per platform into builds/optimized/<platform>/ "
+    "(streams long tracks in chunks; cached per file)",
+    {
+        "platform": {"type": "string", "enum": ["pc", "console", "mobile", "web"], "description": "Default: pc"},
+        "dirs": {"type": "array", "items": {"type": "string"},
+                 "description": "Audio folders (default src/Assets/Audio/SFX and Music); folders named Music use music settings"},
+        "target_db": {"type": "number", "description": "RMS loudness target in dBFS (default -16 SFX, -20 music)"},
+        "trim": {"type": "boolean", "description": "Trim leading/trailing silence (default true)"}
     }
+)
+async def handle_optimize_audio(args: dict) -> dict:
+    """Run the audio-systems skill's WAV pipeline."""
+    try:
+        audio = load_skill_script("audio-systems", "audio_manager")
+        return await asyncio.to_thread(
+            audio.optimize, args.get("platform", "pc"), args.get("dirs"),
+            target_db=args.get("target_db"), trim=args.get("trim", True), root=PROJECT_ROOT
+        )
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
 
-    addScore(amount) {
-        this.score += amount;
-        this.scoreText.setText('Score: ' + this.score);
+@tool(
+    "bake_audio",
+    "Render the ProceduralAudio swish and impact clips to WAVs in src/Assets/Resources/Audio/SFX, "
+    "which ProceduralAudio loads instead of synthesizing them at startup",
+    {
+        "clips": {"type": "array", "items": {"type": "string"},
+                  "description": "Clip names, e.g. ['PlayerAttack1', 'BossSlam'] (default all swish/impact clips)"},
+        "output_dir": {"type": "string", "description": "Destination folder relative to the project root"}
     }
-}
-''')
+)
+async def handle_bake_audio(args: dict) -> dict:
+    """Bake procedural clips with the audio-systems skill."""
+    try:
+        audio = load_skill_script("audio-systems", "audio_manager")
+        options = {"output_dir": args["output_dir"]} if args.get("output_dir") else {}
+        return await asyncio.to_thread(audio.bake_clips, args.get("clips"), root=PROJECT_ROOT, **options)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@tool(
+    "bake_sprites",
+    "Render the DetailedSpriteGenerator hero and boss animation frames to PNG sprite sheets plus a frame "
+    "manifest in src/Assets/Resources/Sprites/Baked, which RuntimeAssetLoader loads instead of drawing them at startup",
+    {
+        "output_dir": {"type": "string", "description": "Destination folder relative to the project root"}
+    }
+)
+async def handle_bake_sprites(args: dict) -> dict:
+    """Bake procedural sprites with the asset-optimization skill."""
+    try:
+        baker = load_skill_script("asset-optimization", "sprite_baker")
+        options = {"output_dir": args["output_dir"]} if args.get("output_dir") else {}
+        return await asyncio.to_thread(baker.bake_sprites, root=PROJECT_ROOT, **options)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@tool(
+    "asset_budget",
+    "Estimate texture GPU memory and loaded audio size from .meta import settings, check them against "
+    "WebGL/mobile/PC budgets and list the largest assets (cached per file)",
+    {
+        "platform": {"type": "string", "enum": ["all", "webgl", "mobile", "pc"], "description": "Default: all"},
+        "dir": {"type": "string", "description": "Asset folder relative to the project root (default src/Assets)"},
+        "top": {"type": "integer", "description": "Largest assets to list per platform (default 10)"}
+    }
+)
+async def handle_asset_budget(args: dict) -> dict:
+    """Run the memory-management skill's asset budget report."""
+    try:
+        analyzer = load_skill_script("memory-management", "memory_analyzer")
+        options = {"asset_dir": args["dir"]} if args.get("dir") else {}
+        return await asyncio.to_thread(
+            analyzer.analyze, args.get("platform", "all"), top=args.get("top", 10), root=PROJECT_ROOT, **options
+        )
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+# =============================================================================
+# CODE ANALYSIS IMPLEMENTATIONS
+# =============================================================================
 
-    # Create assets folder
-    (src_dir / "assets").mkdir(exist_ok=True)
+@tool(
+    "perf_analyze",
+    "Lint Unity C#, GDScript and Phaser JS for hot-path costs (allocations, string building and "
+    "node/component lookups in Update/_process/update or loops, spawning and freeing without pooling) "
+    "and rank the findings by file:line (cached per file hash)",
+    {
+        "paths": {"type": "array", "items": {"type": "string"},
+                  "description": "Files or folders relative to the project root (default src)"},
+        "languages": {"type": "array", "items": {"type": "string", "enum": ["csharp", "gdscript", "javascript"]},
+                      "description": "Only analyze these languages (default all)"},
+        "rules": {"type": "array", "items": {"type": "string"}, "description": "Only report these rule ids"},
+        "top": {"type": "integer", "description": "Findings to list (default 50)"}
+    }
+)
+async def handle_perf_analyze(args: dict) -> dict:
+    """Run the optimization-performance skill's static analyzer."""
+    try:
+        analyzer = load_skill_script("optimization-performance", "perf_analyzer")
+        return await asyncio.to_thread(
+            analyzer.analyze, args.get("paths"), args.get("top", 50), args.get("rules"), args.get("languages"),
+            root=PROJECT_ROOT
+        )
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+# =============================================================================
+# PHASER TOOL IMPLEMENTATIONS
+# =============================================================================
+
+@tool(
+    "phaser_create_project",
+    "Create a new Phaser.js project with npm",
+    {
+        "name": {"type": "string", "description": "Project name"}
+    },
+    required=["name"]
+)
+def create_phaser_project(args: dict) -> dict:
+    """Create a Phaser.js project."""
+    name = args["name"]
+    params = {"name": name, "slug": name.lower().replace(" ", "-")}
+    files, dirs = get_templates().render_scaffold("phaser/project", params)
+    statuses = write_files(PROJECT_ROOT / "src", files, dirs)
 
     return {
         "success": True,
@@ -870,17 +1248,59 @@ export class GameScene extends Phaser.Scene {
             "npm run dev",
             "Open http://localhost:5173 in browser"
         ],
-        "files_created": [
-            "src/package.json",
-            "src/index.html",
-            "src/main.js",
-            "src/scenes/GameScene.js"
-        ]
+        "files": {f"src/{rel}": status for rel, status in statuses.items()}
+    }
+
+
+@tool(
+    "phaser_create_script",
+    "Create a Phaser scene or a prewarmed sprite pool class",
+    {
+        "name": {"type": "string", "description": "Class and file name (without .js)"},
+        "type": {"type": "string", "enum": ["scene", "pool"], "description": "Script type"},
+        "texture": {"type": "string", "description": "pool: texture key of the pooled sprites"},
+        "capacity": {"type": "integer", "description": f"pool: sprites created up front (default {DEFAULT_POOL_CAPACITY})"},
+        "growth": {"type": "string", "enum": POOL_GROWTH, "description": f"pool: when empty return null, create more, or reuse the oldest (default {DEFAULT_POOL_GROWTH})"},
+        "max_size": {"type": "integer", "description": "pool: most sprites when growing (default 0 = unbounded)"}
+    },
+    required=["name", "type"]
+)
+def create_phaser_script(args: dict) -> dict:
+    """Create a Phaser scene or pool module."""
+    name, script_type = args["name"], args["type"]
+    params = {"name": name}
+    if script_type == "pool":
+        try:
+            params.update(pool_params(args))
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+        params["texture"] = args.get("texture", name.removesuffix("Pool").lower())
+    scripts_dir = PROJECT_ROOT / "src" / ("pools" if script_type == "pool" else "scenes")
+    script_path = scripts_dir / f"{name}.js"
+
+    content = render_script_template("phaser", script_type, "scene", ".js", params)
+    status = write_files(scripts_dir, {script_path.name: content})[script_path.name]
+
+    return {
+        "success": True,
+        "message": f"Created {script_type} script: {name}.js",
+        "path": str(script_path),
+        "status": status
     }
 
 
-def handle_phaser_server(action: str) -> dict:
+@tool(
+    "phaser_dev_server",
+    "Start, stop, restart or inspect the Phaser development server",
+    {
+        "action": {"type": "string", "enum": ["start", "stop", "status", "restart", "tail"]},
+        "lines": {"type": "integer", "description": "Output lines to return for tail (default 50)"}
+    },
+    required=["action"]
+)
+async def handle_phaser_server(args: dict) -> dict:
     """Handle Phaser dev server."""
+    action = args["action"]
     src_dir = PROJECT_ROOT / "src"
 
     if action == "start":
@@ -895,36 +1315,163 @@ def handle_phaser_server(action: str) -> dict:
                 "error": "Dependencies not installed. Run: cd src && npm install"
             }
 
+        npm = shutil.which("npm")
+        if npm is None:
+            return {"success": False, "error": "npm not found. Install Node.js and add it to PATH."}
+
         # Start dev server in background
-        result = run_shell("npm run dev", cwd=str(src_dir))
-        return {
-            "success": True,
-            "message": "Dev server starting...",
-            "url": "http://localhost:5173",
-            "output": result
-        }
+        result = await background.start("phaser", [npm, "run", "dev"], cwd=str(src_dir))
+        if result["success"]:
+            result["url"] = "http://localhost:5173"
+        return result
 
-    elif action == "status":
-        return {"success": True, "message": "Check terminal for server status"}
+    return await manage_background("phaser", action, args.get("lines", 50))
 
-    elif action == "stop":
-        return {"success": True, "message": "Stop the server with Ctrl+C in terminal"}
+
+# =============================================================================
+# BUILD TOOL IMPLEMENTATIONS
+# =============================================================================
+
+@tool(
+    "build",
+    "Export a headless build of src/ (Godot --export-release, Unity -batchmode WebGL, or vite build). "
+    "Skipped when no source changed; artifacts are stored by content hash in builds/",
+    {
+        "engine": {"type": "string", "enum": ["godot", "unity", "phaser"], "description": "Default: detected from src/"},
+        "preset": {"type": "string", "description": "Godot export preset (default 'Web')"},
+        "output": {"type": "string", "description": "Godot export file name inside the artifact (default 'index.html')"},
+        "target": {"type": "string", "description": "Unity build target (default 'WebGL')"},
+        "method": {"type": "string", "description": "Unity -executeMethod entry point (default 'BuildScript.Build')"},
+        "install_build_script": {"type": "boolean", "description": "Write the default BuildScript.cs to src/Assets/Editor if it is missing"},
+        "force": {"type": "boolean", "description": "Rebuild even if the sources are unchanged"},
+        "timeout": {"type": "number", "description": f"Seconds before the build is killed (default {BUILD_TIMEOUT:g})"},
+        "call_id": {"type": "string", "description": "Optional id so the build can be stopped with cancel_command"}
+    }
+)
+async def handle_build(args: dict) -> dict:
+    """Run the build pipeline for the project in src/."""
+    from build_pipeline import DEFAULT_OPTIONS, detect_engine
+
+    pipeline = get_build_pipeline()
+    engine = args.get("engine") or detect_engine(pipeline.src)
+    if engine is None:
+        return {"success": False, "error": "No Godot, Unity or Phaser project found in src/"}
+
+    option_names = {"godot": ["preset", "output"], "unity": ["target", "method"], "phaser": []}[engine]
+    options = {name: args.get(name) for name in option_names}
+
+    if engine == "unity" and options["method"] in (None, DEFAULT_OPTIONS["unity"]["method"]):
+        build_script = pipeline.src / "Assets" / "Editor" / "BuildScript.cs"
+        if not build_script.exists():
+            # Writing it would change the fingerprinted sources, so only do that on request
+            if not args.get("install_build_script"):
+                return {
+                    "success": False,
+                    "error": "src/Assets/Editor/BuildScript.cs not found. Scaffold it with unity_create_project, "
+                             "call build with install_build_script=true, or pass your own method."
+                }
+            template = "unity/project/Assets/Editor/BuildScript.cs"
+            write_files(build_script.parent, {build_script.name: get_templates().render(template, {})})
+
+    async def run(argv: list[str], cwd: str, timeout: float) -> dict:
+        return await run_shell(_join_command(argv), cwd=cwd, timeout=timeout, call_id=args.get("call_id"))
+
+    return await pipeline.build(engine, options, find_engine, run, args.get("timeout") or BUILD_TIMEOUT, args.get("force", False))
+
+
+def _join_command(argv: list[str]) -> str:
+    """Quote an argv for the platform shell used by run_shell."""
+    if sys.platform == "win32":
+        return subprocess.list2cmdline(argv)
+    return shlex.join(argv)
+
+
+# =============================================================================
+# SERVER CACHE IMPLEMENTATIONS
+# =============================================================================
+
+@tool(
+    "server_cache",
+    "Show or clear the persistent index cache (mcp/.cache/server.db)",
+    {
+        "action": {"type": "string", "enum": ["stats", "clear"]},
+        "namespace": {"type": "string", "description": "Namespace to clear, e.g. guid-meta or unity-objects (default: all)"}
+    },
+    required=["action"]
+)
+def handle_server_cache(args: dict) -> dict:
+    """Inspect or clear the persistent cache."""
+    if args["action"] == "stats":
+        return {"success": True, **get_disk_cache().stats()}
+
+    elif args["action"] == "clear":
+        get_disk_cache().clear(args.get("namespace"))
+        # Drop in-memory copies too so the next query rebuilds from disk
+        get_unity_assets().reset()
+        get_guid_graph().reset()
+        get_scene_analyzer.cache_clear()
+        return {"success": True, "message": f"Cleared {args.get('namespace') or 'all namespaces'}"}
 
     return {"success": False, "error": "Invalid action"}
 
 
+# =============================================================================
+# BACKGROUND PROCESS IMPLEMENTATIONS
+# =============================================================================
+
+async def manage_background(name: str, action: str, lines: int = 50, stream: str = "both") -> dict:
+    """Apply a status/tail/stop/restart action to a background process."""
+    if action == "status":
+        result = background.status(name)
+    elif action == "tail":
+        result = background.tail(name, lines, stream)
+    elif action == "stop":
+        result = await background.stop(name)
+    elif action == "restart":
+        result = await background.restart(name)
+    else:
+        return {"success": False, "error": "Invalid action"}
+
+    if not result["success"] and background.get(name) is None:
+        result["error"] = f"{name} has not been started"
+    return result
+
+
+@tool(
+    "process_manager",
+    "List, inspect, tail, stop or restart background processes started by other tools",
+    {
+        "action": {"type": "string", "enum": ["list", "status", "tail", "stop", "restart"]},
+        "name": {"type": "string", "description": "Process name, e.g. 'phaser' or 'godot' (not needed for list)"},
+        "lines": {"type": "integer", "description": "Output lines to return for tail (default 50)"},
+        "stream": {"type": "string", "enum": ["stdout", "stderr", "both"], "description": "Output stream for tail"}
+    },
+    required=["action"]
+)
+async def handle_process_manager(args: dict) -> dict:
+    """Handle generic background process operations."""
+    if args["action"] == "list":
+        return background.status()
+    if not args.get("name"):
+        return {"success": False, "error": "name is required"}
+    return await manage_background(args["name"], args["action"], args.get("lines", 50), args.get("stream", "both"))
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
 
 async def main():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+    finally:
+        await background.stop_all()
 
 
 if __name__ == "__main__":
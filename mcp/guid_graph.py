@@ -0,0 +1,236 @@
+"""
+Asset GUID Graph
+Maps Unity .meta GUIDs to asset paths and tracks which assets reference which,
+persisted in the DiskCache and refreshed per file by mtime.
+"""
+
+import os
+import posixpath
+import re
+import time
+from pathlib import Path
+from typing import Optional
+
+from disk_cache import DiskCache
+from project_index import SKIP_DIRS
+from unity_yaml import UNITY_YAML_SUFFIXES, is_unity_yaml
+
+# Bump when the cached entry layout changes so stale entries are discarded
+INDEX_VERSION = 1
+
+# Seconds a refresh stays valid; back-to-back queries reuse it instead of re-walking src/Assets
+REFRESH_INTERVAL = 2.0
+
+_META_GUID = re.compile(rb"^guid: ([0-9a-f]{32})", re.M)
+_REF_GUID = re.compile(rb"guid: ([0-9a-f]{32})")
+
+# Assets that are used without a GUID reference (loaded by name/path or by the editor)
+_IMPLICIT_ROOT_DIRS = ("/Resources/", "/Editor/", "/StreamingAssets/", "/Plugins/")
+
+# Built-in GUIDs (e.g. 0000000000000000e000000000000000) point into Unity itself
+_BUILTIN_GUID = re.compile(r"^0{16}[0-9a-f]0{15}$")
+
+
+class GuidGraph:
+    """GUID -> path map and dependency graph for the assets under src/Assets."""
+
+    def __init__(self, project_root: Path, assets_dir: str = "src/Assets", cache: DiskCache = None):
+        self.project_root = project_root
+        self.assets_dir = assets_dir
+        self.cache = cache
+        # rel meta path -> [mtime_ns, size, guid, is_folder, referenced guids]
+        self._metas: dict[str, list] = {}
+        # rel asset path -> [mtime_ns, size, referenced guids]
+        self._refs: dict[str, list] = {}
+        self.guid_to_path: dict[str, str] = {}
+        self.path_to_guid: dict[str, str] = {}
+        self.referrers: dict[str, set[str]] = {}
+        self._loaded = False
+        self._refreshed_at: Optional[float] = None
+        self._last_refresh: dict = {}
+
+    def reset(self) -> None:
+        """Forget everything in memory; the next refresh reloads from the cache."""
+        self._metas, self._refs = {}, {}
+        self.guid_to_path, self.path_to_guid, self.referrers = {}, {}, {}
+        self._loaded = False
+        self._refreshed_at = None
+
+    # -------------------------------------------------------------------------
+    # Indexing
+    # -------------------------------------------------------------------------
+
+    def refresh(self, force: bool = False) -> dict:
+        """Rescan .meta files and assets whose mtime or size changed.
+
+        The walk stats every file under src/Assets, so a refresh made less
+        than REFRESH_INTERVAL seconds ago is reused unless `force` is set.
+        """
+        now = time.monotonic()
+        if not force and self._refreshed_at is not None and now - self._refreshed_at < REFRESH_INTERVAL:
+            return {**self._last_refresh, "rescanned": 0, "removed": 0, "throttled": True}
+        if not self._loaded:
+            self._load()
+
+        seen_metas, seen_assets = set(), set()
+        changed_metas, changed_assets = [], []
+        base = self.project_root / self.assets_dir
+
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            for filename in filenames:
+                path = Path(dirpath) / filename
+                rel = path.relative_to(self.project_root).as_posix()
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                stamp = [stat.st_mtime_ns, stat.st_size]
+
+                if filename.endswith(".meta"):
+                    seen_metas.add(rel)
+                    cached = self._metas.get(rel)
+                    if cached and cached[:2] == stamp:
+                        continue
+                    data = path.read_bytes()
+                    guid = _META_GUID.search(data)
+                    self._metas[rel] = stamp + [
+                        guid.group(1).decode() if guid else "",
+                        b"folderAsset: yes" in data,
+                        _guids(data)
+                    ]
+                    changed_metas.append(rel)
+                elif os.path.splitext(filename)[1] in UNITY_YAML_SUFFIXES:
+                    seen_assets.add(rel)
+                    cached = self._refs.get(rel)
+                    if cached and cached[:2] == stamp:
+                        continue
+                    self._refs[rel] = stamp + [_scan_refs(path) if is_unity_yaml(path) else []]
+                    changed_assets.append(rel)
+
+        removed_metas = set(self._metas) - seen_metas
+        removed_assets = set(self._refs) - seen_assets
+        for rel in removed_metas:
+            del self._metas[rel]
+        for rel in removed_assets:
+            del self._refs[rel]
+
+        rescanned = len(changed_metas) + len(changed_assets)
+        removed = len(removed_metas) + len(removed_assets)
+        if rescanned or removed or not self.guid_to_path:
+            self._rebuild()
+        if self.cache is not None:
+            self.cache.put_many("guid-meta", ((rel, *self._metas[rel][:2], self._metas[rel][2:]) for rel in changed_metas), INDEX_VERSION)
+            self.cache.put_many("guid-refs", ((rel, *self._refs[rel][:2], self._refs[rel][2:]) for rel in changed_assets), INDEX_VERSION)
+            self.cache.delete("guid-meta", removed_metas)
+            self.cache.delete("guid-refs", removed_assets)
+        self._refreshed_at = now
+        self._last_refresh = {"assets": len(self.guid_to_path), "rescanned": rescanned, "removed": removed}
+        return dict(self._last_refresh)
+
+    def _rebuild(self) -> None:
+        """Derive the lookup maps from the per-file entries."""
+        self.guid_to_path = {}
+        self.path_to_guid = {}
+        for meta, (_, _, guid, is_folder, _) in self._metas.items():
+            if guid and not is_folder:
+                asset = meta[:-len(".meta")]
+                self.guid_to_path[guid] = asset
+                self.path_to_guid[asset] = guid
+
+        self.referrers = {}
+        for asset, guid in self.path_to_guid.items():
+            for dep in self._dependency_guids(asset, guid):
+                self.referrers.setdefault(dep, set()).add(asset)
+
+    def _dependency_guids(self, asset: str, guid: str) -> set[str]:
+        """GUIDs an asset references from its own file and its importer settings."""
+        deps = set(self._refs.get(asset, [0, 0, []])[2])
+        deps.update(self._metas.get(asset + ".meta", [0, 0, "", False, []])[4])
+        deps.discard(guid)
+        return {d for d in deps if not _BUILTIN_GUID.match(d)}
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def resolve(self, asset: str) -> Optional[str]:
+        """Accept a GUID or a project-relative (or Assets/-relative) path."""
+        if asset in self.guid_to_path:
+            return asset
+        # normpath drops "./" prefixes and "x/.." pairs but keeps "../" and dot-named folders
+        asset = posixpath.normpath(asset.replace("\\", "/"))
+        for candidate in (asset, f"src/{asset}", f"{self.assets_dir}/{asset}"):
+            if candidate in self.path_to_guid:
+                return self.path_to_guid[candidate]
+        return None
+
+    def references(self, guid: str) -> list[str]:
+        """Assets that reference the given GUID."""
+        return sorted(self.referrers.get(guid, ()))
+
+    def dependencies(self, guid: str, recursive: bool = False) -> dict:
+        """Assets the given asset references, split into resolved and missing GUIDs."""
+        pending = [guid]
+        visited = {guid}
+        found, missing = set(), set()
+        while pending:
+            current = pending.pop()
+            for dep in self._dependency_guids(self.guid_to_path.get(current, ""), current):
+                if dep in visited:
+                    continue
+                visited.add(dep)
+                if dep in self.guid_to_path:
+                    found.add(self.guid_to_path[dep])
+                    if recursive:
+                        pending.append(dep)
+                else:
+                    missing.add(dep)
+        return {"dependencies": sorted(found), "missing_guids": sorted(missing)}
+
+    def unreferenced(self, include_scripts: bool = False) -> list[str]:
+        """Assets nothing references, excluding build scenes and implicitly loaded folders."""
+        roots = self._build_scene_guids()
+        result = []
+        for guid, path in self.guid_to_path.items():
+            if guid in self.referrers or guid in roots:
+                continue
+            if any(part in f"/{path}" for part in _IMPLICIT_ROOT_DIRS):
+                continue
+            if not include_scripts and path.endswith((".cs", ".asmdef")):
+                continue
+            result.append(path)
+        return sorted(result)
+
+    def _build_scene_guids(self) -> set[str]:
+        settings = self.project_root / Path(self.assets_dir).parent / "ProjectSettings" / "EditorBuildSettings.asset"
+        try:
+            return set(_guids(settings.read_bytes()))
+        except OSError:
+            return set()
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def _load(self) -> None:
+        """Warm the per-file entries from the persistent cache."""
+        self._loaded = True
+        if self.cache is None:
+            return
+        self._metas = {rel: [mtime_ns, size, *value] for rel, (mtime_ns, size, value) in self.cache.load("guid-meta", INDEX_VERSION).items()}
+        self._refs = {rel: [mtime_ns, size, *value] for rel, (mtime_ns, size, value) in self.cache.load("guid-refs", INDEX_VERSION).items()}
+
+
+def _guids(data: bytes) -> list[str]:
+    return sorted({m.decode() for m in _REF_GUID.findall(data)})
+
+
+def _scan_refs(path: Path) -> list[str]:
+    """Collect referenced GUIDs by streaming the file line by line."""
+    found = set()
+    with open(path, "rb") as f:
+        for line in f:
+            if b"guid: " in line:
+                found.update(m.decode() for m in _REF_GUID.findall(line))
+    return sorted(found)
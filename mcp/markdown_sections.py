@@ -0,0 +1,259 @@
+"""
+Markdown Sections
+Heading-addressed reads and edits of the docs/ markdown files (TASKS.md,
+GAME_DESIGN.md) without rewriting or returning the whole document.
+"""
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from scaffolds import content_status
+
+_HEADING = re.compile(rb"^(#{1,6})[ \t]+(.*?)[ \t#]*\r?$")
+_CHECKBOX = re.compile(rb"^(\s*[-*+] \[)([ xX])(\] )(.*?)\r?$")
+
+# One lock per file so concurrent tool calls serialize their edits
+_locks: dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(path: Path) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(str(path), threading.Lock())
+
+
+class Section(NamedTuple):
+    """Byte layout of one heading's section."""
+    level: int
+    title: str
+    start: int          # offset of the heading line
+    body: int           # offset just after the heading line
+    end: int            # offset after the last non-blank line of the section
+    stop: int           # offset of the next heading at the same or higher level (or EOF)
+    done: int           # checked items directly in this section
+    total: int          # checkbox items directly in this section
+
+
+class MarkdownDoc:
+    """A markdown file indexed by heading, edited with atomic write-rename."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._stamp: Optional[tuple[int, int]] = None
+        self._sections: list[Section] = []
+
+    # -------------------------------------------------------------------------
+    # Index
+    # -------------------------------------------------------------------------
+
+    def sections(self) -> list[Section]:
+        """Section index, rebuilt only when the file's mtime or size changed."""
+        stat = self.path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self._stamp:
+            self._sections = _index(self.path)
+            self._stamp = stamp
+        return self._sections
+
+    def find(self, heading: str) -> Optional[Section]:
+        """Find a section by title ('Hour 2-6: Player Core') or heading ('### Hour 2-6: ...')."""
+        match = re.match(r"^(#{1,6})\s+(.*)$", heading.strip())
+        level = len(match.group(1)) if match else None
+        title = (match.group(2) if match else heading).strip().lower()
+        for section in self.sections():
+            if section.title.lower() == title and level in (None, section.level):
+                return section
+        return None
+
+    def _locate(self, heading: Optional[str]) -> Optional[Section]:
+        """Resolve a heading against the current file; call with the file's lock held."""
+        if heading is None:
+            return None
+        section = self.find(heading)
+        if section is None:
+            raise LookupError(f"Section '{heading}' not found in {self.path.name}")
+        return section
+
+    def outline(self) -> list[dict]:
+        """Headings with their checklist progress."""
+        outline = []
+        for section in self.sections():
+            entry = {"level": section.level, "title": section.title}
+            if section.total:
+                entry["done"] = section.done
+                entry["total"] = section.total
+            outline.append(entry)
+        return outline
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def read(self, heading: str = None) -> str:
+        """Whole document, or one section including its heading and subsections."""
+        with _lock_for(self.path):
+            section = self._locate(heading)
+            if section is None:
+                return self.path.read_text()
+            with open(self.path, "rb") as f:
+                f.seek(section.start)
+                return f.read(section.end - section.start).decode(errors="replace")
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def write(self, text: str) -> str:
+        """Replace the whole document atomically unless it already has this content."""
+        data = text.encode()
+        with _lock_for(self.path):
+            status = content_status(self.path, data)
+            if status != "unchanged":
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                _atomic_write(self.path, [data])
+                self._stamp = None
+        return status
+
+    def append(self, text: str, heading: str = None) -> Optional[str]:
+        """Append to the end of the document (O(1)) or of one section; returns the section title."""
+        data = text.rstrip("\n").encode() + b"\n"
+        with _lock_for(self.path):
+            section = self._locate(heading)
+            if section is None or section.end >= self.path.stat().st_size:
+                # End of file: a plain append never touches the existing bytes
+                with open(self.path, "ab+") as f:
+                    if f.tell() > 0:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b"\n":
+                            data = b"\n" + data
+                    f.write(data)
+            else:
+                _splice(self.path, section.end, section.end, data)
+            self._stamp = None
+        return section.title if section else None
+
+    def replace(self, heading: str, body: str) -> str:
+        """Replace a section's body (everything under its heading) atomically if it differs."""
+        data = body.rstrip("\n").encode() + b"\n"
+        with _lock_for(self.path):
+            section = self._locate(heading)
+            with open(self.path, "rb") as f:
+                f.seek(section.body)
+                if f.read(section.end - section.body) == data:
+                    return "unchanged"
+                # A heading on the last line without a newline: keep the body off the heading line
+                if section.body > 0:
+                    f.seek(section.body - 1)
+                    if f.read(1) != b"\n":
+                        data = b"\n" + data
+            _splice(self.path, section.body, section.end, data)
+            self._stamp = None
+        return "modified"
+
+    def toggle(self, item: str, checked: bool = None, heading: str = None) -> dict:
+        """Tick or untick one checklist item in place (a single-byte write)."""
+        needle = item.strip().lower()
+
+        with _lock_for(self.path):
+            section = self._locate(heading)
+            start, stop = (section.body, section.stop) if section else (0, self.path.stat().st_size)
+            matches = []
+            with open(self.path, "rb") as f:
+                f.seek(start)
+                offset = start
+                while offset < stop:
+                    line = f.readline()
+                    if not line:
+                        break
+                    box = _CHECKBOX.match(line)
+                    if box:
+                        text = box.group(4).decode(errors="replace")
+                        if needle in text.lower():
+                            matches.append((offset + len(box.group(1)), box.group(2), text))
+                            if text.strip().lower() == needle:
+                                matches = [matches[-1]]
+                                break
+                    offset += len(line)
+
+            if not matches:
+                return {"success": False, "error": f"No checklist item matching '{item}'"}
+            if len(matches) > 1:
+                return {"success": False, "error": f"'{item}' matches several items", "matches": [m[2] for m in matches[:10]]}
+
+            box_offset, mark, text = matches[0]
+            new_checked = (mark == b" ") if checked is None else checked
+            with open(self.path, "r+b") as f:
+                f.seek(box_offset)
+                f.write(b"x" if new_checked else b" ")
+            self._stamp = None
+        return {"success": True, "item": text, "checked": new_checked}
+
+
+def _index(path: Path) -> list[Section]:
+    """Scan heading lines (outside code fences) and checklist items."""
+    found = []          # [level, title, start, body, end, done, total]
+    open_sections = []  # indexes into found, innermost last
+    in_fence = False
+    offset = 0
+
+    with open(path, "rb") as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped.startswith(b"```") or stripped.startswith(b"~~~"):
+                in_fence = not in_fence
+            heading = None if in_fence else _HEADING.match(line)
+            if heading:
+                level = len(heading.group(1))
+                while open_sections and found[open_sections[-1]][0] >= level:
+                    open_sections.pop()
+                found.append([level, heading.group(2).decode(errors="replace"), offset, offset + len(line), offset + len(line), 0, 0])
+                open_sections.append(len(found) - 1)
+            elif stripped and open_sections:
+                for i in open_sections:
+                    found[i][4] = offset + len(line)
+                box = None if in_fence else _CHECKBOX.match(line)
+                if box:
+                    innermost = found[open_sections[-1]]
+                    innermost[6] += 1
+                    innermost[5] += box.group(2) in b"xX"
+            offset += len(line)
+
+    sections = []
+    for i, (level, title, start, body, end, done, total) in enumerate(found):
+        stop = next((s[2] for s in found[i + 1:] if s[0] <= level), offset)
+        # A parent's content ends where its last subsection's content ends
+        end = max([end] + [s[4] for s in found[i + 1:] if s[2] < stop])
+        sections.append(Section(level, title, start, body, end, stop, done, total))
+    return sections
+
+
+def _splice(path: Path, start: int, end: int, data: bytes) -> None:
+    """Replace bytes [start, end) with data by streaming into a temp file and renaming."""
+    with open(path, "rb") as src:
+        head = src.read(start)
+        src.seek(end)
+        _atomic_write(path, [head, data], tail=src)
+
+
+def _atomic_write(path: Path, chunks: list[bytes], tail=None) -> None:
+    """Write chunks (and the rest of an open file) to a temp file, then rename over path."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as out:
+            for chunk in chunks:
+                out.write(chunk)
+            if tail is not None:
+                while True:
+                    block = tail.read(65536)
+                    if not block:
+                        break
+                    out.write(block)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
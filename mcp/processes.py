@@ -0,0 +1,313 @@
+"""
+Background Process Registry
+Supervises long-lived children (dev servers, game runs) for the MCP server,
+and spools streamed command output so it can be paged by cursor.
+"""
+
+import asyncio
+import codecs
+import os
+import signal
+import sys
+import tempfile
+import time
+import uuid
+from collections import deque
+from typing import Optional
+
+# Lines of stdout/stderr kept per process
+RING_BUFFER_LINES = 2000
+
+# Seconds to wait after spawning so immediate failures are reported
+STARTUP_GRACE = 1.0
+
+# Seconds between SIGTERM and SIGKILL when stopping
+STOP_GRACE = 5.0
+
+# Bytes returned per page of streamed command output
+STREAM_PAGE_BYTES = 16384
+
+# Streamed command logs kept for paging (oldest finished ones are dropped)
+MAX_OUTPUT_LOGS = 20
+
+
+class ManagedProcess:
+    """A supervised child process with bounded output buffers."""
+
+    def __init__(self, name: str, cmd: list[str], cwd: str, env: dict = None):
+        self.name = name
+        self.cmd = cmd
+        self.cwd = cwd
+        self.env = env
+        self.proc: Optional[asyncio.subprocess.Process] = None
+        self.started_at: Optional[float] = None
+        self.restarts = 0
+        self.stdout: deque[str] = deque(maxlen=RING_BUFFER_LINES)
+        self.stderr: deque[str] = deque(maxlen=RING_BUFFER_LINES)
+        self._pumps: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return self.proc is not None and self.proc.returncode is None
+
+    async def spawn(self) -> None:
+        """Spawn the child and start pumping its output."""
+        self.stdout.clear()
+        self.stderr.clear()
+        self.proc = await asyncio.create_subprocess_exec(
+            *self.cmd,
+            cwd=self.cwd,
+            env={**os.environ, **self.env} if self.env else None,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=sys.platform != "win32"
+        )
+        self.started_at = time.time()
+        self._pumps = [
+            asyncio.create_task(_pump(self.proc.stdout, self.stdout)),
+            asyncio.create_task(_pump(self.proc.stderr, self.stderr))
+        ]
+
+    async def terminate(self, grace: float = STOP_GRACE) -> None:
+        """Stop the child, escalating to SIGKILL after the grace period."""
+        if not self.running:
+            return
+        _signal_group(self.proc)
+        try:
+            await asyncio.wait_for(self.proc.wait(), grace)
+        except asyncio.TimeoutError:
+            _signal_group(self.proc, force=True)
+            await self.proc.wait()
+        await asyncio.gather(*self._pumps, return_exceptions=True)
+
+    def status(self) -> dict:
+        """Describe the process state."""
+        return {
+            "name": self.name,
+            "command": " ".join(self.cmd),
+            "running": self.running,
+            "pid": self.proc.pid if self.proc else None,
+            "returncode": self.proc.returncode if self.proc else None,
+            "uptime_s": round(time.time() - self.started_at, 1) if self.running else None,
+            "restarts": self.restarts
+        }
+
+    def tail(self, lines: int = 50, stream: str = "both") -> dict:
+        """Return the last lines of buffered output."""
+        result = {}
+        if stream in ("stdout", "both"):
+            result["stdout"] = "\n".join(list(self.stdout)[-lines:])
+        if stream in ("stderr", "both"):
+            result["stderr"] = "\n".join(list(self.stderr)[-lines:])
+        return result
+
+
+class ProcessRegistry:
+    """Named registry of supervised background processes."""
+
+    def __init__(self):
+        self._processes: dict[str, ManagedProcess] = {}
+
+    def get(self, name: str) -> Optional[ManagedProcess]:
+        return self._processes.get(name)
+
+    async def start(self, name: str, cmd: list[str], cwd: str, env: dict = None) -> dict:
+        """Start a process unless one with this name is already running."""
+        existing = self._processes.get(name)
+        if existing and existing.running:
+            return {"success": True, "message": f"{name} already running", **existing.status()}
+
+        managed = ManagedProcess(name, cmd, cwd, env)
+        try:
+            await managed.spawn()
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+        self._processes[name] = managed
+
+        # Report processes that die straight away (bad command, port in use, ...)
+        try:
+            await asyncio.wait_for(asyncio.shield(managed.proc.wait()), STARTUP_GRACE)
+        except asyncio.TimeoutError:
+            pass
+
+        if not managed.running:
+            await asyncio.gather(*managed._pumps, return_exceptions=True)
+            return {"success": False, "error": f"{name} exited during startup", **managed.status(), **managed.tail(20)}
+        return {"success": True, "message": f"{name} started", **managed.status()}
+
+    async def stop(self, name: str) -> dict:
+        """Stop a running process."""
+        managed = self._processes.get(name)
+        if managed is None:
+            return {"success": False, "error": f"No process named '{name}'"}
+        was_running = managed.running
+        await managed.terminate()
+        message = f"{name} stopped" if was_running else f"{name} was not running"
+        return {"success": True, "message": message, **managed.status()}
+
+    async def restart(self, name: str) -> dict:
+        """Stop and respawn a process with its original command."""
+        managed = self._processes.get(name)
+        if managed is None:
+            return {"success": False, "error": f"No process named '{name}'"}
+        await managed.terminate()
+        restarts = managed.restarts + 1
+        result = await self.start(name, managed.cmd, managed.cwd, managed.env)
+        self._processes[name].restarts = restarts
+        result["restarts"] = restarts
+        return result
+
+    def status(self, name: str = None) -> dict:
+        """Status of one process, or of all of them."""
+        if name is None:
+            return {"success": True, "processes": [p.status() for p in self._processes.values()]}
+        managed = self._processes.get(name)
+        if managed is None:
+            return {"success": False, "error": f"No process named '{name}'"}
+        return {"success": True, **managed.status()}
+
+    def tail(self, name: str, lines: int = 50, stream: str = "both") -> dict:
+        """Last lines of a process's output."""
+        managed = self._processes.get(name)
+        if managed is None:
+            return {"success": False, "error": f"No process named '{name}'"}
+        return {"success": True, **managed.status(), **managed.tail(lines, stream)}
+
+    async def stop_all(self) -> None:
+        """Stop every supervised process (used on server shutdown)."""
+        await asyncio.gather(*(p.terminate() for p in self._processes.values()), return_exceptions=True)
+
+
+class OutputLog:
+    """Output of a streamed command, spooled to disk and readable by byte offset."""
+
+    def __init__(self, log_id: str, command: str):
+        self.id = log_id
+        self.command = command
+        self.size = 0
+        self.returncode: Optional[int] = None
+        self.error: Optional[str] = None
+        self.finished = False
+        self.task: Optional[asyncio.Task] = None
+        self._file = tempfile.TemporaryFile()
+        self._changed = asyncio.Event()
+
+    def write(self, data: bytes) -> None:
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(data)
+        self.size += len(data)
+        self._changed.set()
+
+    def finish(self, returncode: Optional[int], error: str = None) -> None:
+        self.returncode = returncode
+        self.error = error
+        self.finished = True
+        self._changed.set()
+
+    async def wait_for(self, size: int, timeout: float) -> None:
+        """Wait until the log holds `size` bytes, the command ends, or the timeout passes."""
+        deadline = time.monotonic() + timeout
+        while not self.finished and self.size < size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                return
+
+    def read(self, offset: int, max_bytes: int) -> dict:
+        """Read one page of output starting at a byte offset."""
+        self._file.seek(offset)
+        data = self._file.read(max_bytes)
+        # A finished log's tail never completes, so it is returned as is (decoded with replacement)
+        if not self.finished or offset + len(data) < self.size:
+            data = _trim_partial_utf8(data) or data
+        end = offset + len(data)
+        exhausted = self.finished and end >= self.size
+        page = {
+            "output": data.decode(errors="replace"),
+            "offset": offset,
+            "bytes": len(data),
+            "total_bytes": self.size,
+            "running": not self.finished,
+            "returncode": self.returncode,
+            "cursor": None if exhausted else f"{self.id}:{end}"
+        }
+        if self.error:
+            page["error"] = self.error
+        return page
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class OutputLogStore:
+    """Bounded set of streamed command logs addressed by cursor tokens."""
+
+    def __init__(self, max_logs: int = MAX_OUTPUT_LOGS):
+        self.max_logs = max_logs
+        self._logs: dict[str, OutputLog] = {}
+
+    def create(self, command: str) -> OutputLog:
+        """New log; at capacity the oldest finished log is dropped, else the oldest running one is cancelled."""
+        while len(self._logs) >= self.max_logs:
+            oldest = next((log for log in self._logs.values() if log.finished), None) or next(iter(self._logs.values()))
+            if oldest.task is not None and not oldest.task.done():
+                oldest.task.cancel()
+            self._logs.pop(oldest.id).close()
+        log = OutputLog(uuid.uuid4().hex[:8], command)
+        self._logs[log.id] = log
+        return log
+
+    def get(self, log_id: str) -> Optional[OutputLog]:
+        return self._logs.get(log_id)
+
+    def page(self, cursor: str, max_bytes: int = STREAM_PAGE_BYTES) -> dict:
+        """Read the page of output a cursor token points at."""
+        log_id, _, offset = cursor.partition(":")
+        log = self._logs.get(log_id)
+        if log is None or not offset.isdigit():
+            return {"success": False, "error": f"Unknown or expired cursor '{cursor}'"}
+        return {"success": True, "command": log.command, **log.read(int(offset), max_bytes)}
+
+
+async def _pump(stream: asyncio.StreamReader, buffer: deque) -> None:
+    """Copy a child's output into a ring buffer line by line."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    partial = ""
+    while True:
+        chunk = await stream.read(4096)
+        if not chunk:
+            break
+        lines = (partial + decoder.decode(chunk)).split("\n")
+        partial = lines.pop()
+        buffer.extend(line.rstrip("\r") for line in lines)
+    if partial:
+        buffer.append(partial)
+
+
+def _signal_group(proc: asyncio.subprocess.Process, force: bool = False) -> None:
+    """Terminate (or kill) a child and everything it spawned."""
+    try:
+        if sys.platform != "win32":
+            os.killpg(proc.pid, signal.SIGKILL if force else signal.SIGTERM)
+        elif force:
+            proc.kill()
+        else:
+            proc.terminate()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _trim_partial_utf8(data: bytes) -> bytes:
+    """Drop a multi-byte UTF-8 sequence cut off at the end of a page."""
+    for back in range(1, min(4, len(data)) + 1):
+        byte = data[-back]
+        if byte & 0xC0 != 0x80:
+            # Lead byte: keep it only if its whole sequence is present
+            expected = 2 if byte >> 5 == 0b110 else 3 if byte >> 4 == 0b1110 else 4 if byte >> 3 == 0b11110 else 1
+            return data if expected <= back else data[:-back]
+    return data
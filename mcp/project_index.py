@@ -0,0 +1,207 @@
+"""
+Project Tree Index
+In-memory directory listing cache, refreshed per directory by mtime.
+"""
+
+import os
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+# Directories never shown in the project tree or walked by the asset indexes
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__', '.godot', 'Library', 'Temp', 'Logs'}
+
+
+class DirListing(NamedTuple):
+    """Cached contents of one directory."""
+    mtime_ns: int
+    dirs: list[str]
+    files: list[str]
+
+
+class TreeNode(NamedTuple):
+    """One visible entry of a filtered tree query."""
+    name: str
+    path: str
+    is_dir: bool
+    files: int                          # matching files at or below this entry
+    children: Optional[list["TreeNode"]]  # None for files and collapsed directories
+
+
+class TreeIndex:
+    """Directory tree built once and rescanned only where directories changed.
+
+    A directory's mtime changes whenever an entry is added, removed or
+    renamed inside it, so a stat per visited directory is enough to know
+    whether its cached listing is still valid. Directories collapsed by a
+    depth limit are not shown, but every directory below them is still
+    statted so their file counts notice changes at any depth.
+    """
+
+    def __init__(self, root: Path, skip: set[str] = SKIP_DIRS):
+        self.root = root
+        self.skip = skip
+        self._listings: dict[str, DirListing] = {}
+        # (dir, filter key) -> matching files in the subtree
+        self._counts: dict[tuple[str, tuple], int] = {}
+        self.rescans = 0
+
+    def listing(self, rel: str) -> Optional[DirListing]:
+        """Get a directory's listing, rescanning it only if it changed."""
+        path = self.root / rel if rel else self.root
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            self._forget(rel)
+            return None
+
+        cached = self._listings.get(rel)
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            return cached
+
+        dirs, files = [], []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name in self.skip:
+                        continue
+                    (dirs if entry.is_dir() else files).append(entry.name)
+        except OSError:
+            self._forget(rel)
+            return None
+        dirs.sort()
+        files.sort()
+
+        if cached is not None:
+            for gone in set(cached.dirs) - set(dirs):
+                self._forget(_join(rel, gone))
+
+        listing = DirListing(mtime_ns, dirs, files)
+        self._listings[rel] = listing
+        self._drop_counts(rel)
+        self.rescans += 1
+        return listing
+
+    def query(self, rel: str = "", depth: int = None, include: list[str] = None,
+              exclude: list[str] = None, hide_meta: bool = False) -> list[TreeNode]:
+        """Filtered tree below a directory.
+
+        include globs select files (directories left without matches are
+        pruned), exclude globs drop files and whole subtrees, and directories
+        deeper than `depth` are collapsed to a matching-file count.
+        """
+        def keep_dir(path: str, name: str) -> bool:
+            return not (exclude and _matches(path, name, exclude))
+
+        def keep_file(path: str, name: str) -> bool:
+            if hide_meta and name.endswith(".meta"):
+                return False
+            if exclude and _matches(path, name, exclude):
+                return False
+            return not include or _matches(path, name, include)
+
+        key = (tuple(include or ()), tuple(exclude or ()), hide_meta)
+
+        def collect(current: str, level: int) -> list[TreeNode]:
+            listing = self.listing(current)
+            if listing is None:
+                return []
+
+            nodes = []
+            for name in listing.dirs:
+                path = _join(current, name)
+                if not keep_dir(path, name):
+                    continue
+                if depth is None or level < depth:
+                    children = collect(path, level + 1)
+                    files = sum(child.files for child in children)
+                else:
+                    children = None
+                    files = self._count(path, keep_dir, keep_file, key)
+                if include and files == 0:
+                    continue
+                nodes.append(TreeNode(name, path, True, files, children))
+
+            for name in listing.files:
+                path = _join(current, name)
+                if keep_file(path, name):
+                    nodes.append(TreeNode(name, path, False, 1, None))
+            return nodes
+
+        return collect(rel, 1)
+
+    def _count(self, rel: str, keep_dir, keep_file, key: tuple) -> int:
+        """Matching files below a directory; the subtree is re-statted and cached counts are kept only where nothing changed."""
+        listing = self.listing(rel)
+        if listing is None:
+            return 0
+        # Children first: a rescan anywhere below drops this directory's cached count
+        below = sum(self._count(_join(rel, name), keep_dir, keep_file, key)
+                    for name in listing.dirs if keep_dir(_join(rel, name), name))
+        cached = self._counts.get((rel, key))
+        if cached is not None:
+            return cached
+        total = below + sum(1 for name in listing.files if keep_file(_join(rel, name), name))
+        self._counts[(rel, key)] = total
+        return total
+
+    def resolve(self, subpath: str) -> str:
+        """Normalize a user-supplied subpath to an index key inside the root."""
+        target = (self.root / subpath).resolve()
+        relative = target.relative_to(self.root.resolve())
+        return "" if str(relative) == "." else relative.as_posix()
+
+    def _forget(self, rel: str) -> None:
+        """Drop a directory and everything cached below it."""
+        self._listings.pop(rel, None)
+        prefix = rel + "/"
+        for key in [k for k in self._listings if k.startswith(prefix)]:
+            del self._listings[key]
+        self._drop_counts(rel)
+
+    def _drop_counts(self, rel: str) -> None:
+        """Invalidate subtree counts of a directory, its ancestors and its descendants."""
+        for key in list(self._counts):
+            path = key[0]
+            if path == rel or not path or rel.startswith(path + "/") or path.startswith(rel + "/"):
+                del self._counts[key]
+
+
+def _join(rel: str, name: str) -> str:
+    return f"{rel}/{name}" if rel else name
+
+
+def render_tree(nodes: list[TreeNode], prefix: str = "") -> list[str]:
+    """Render tree nodes with box-drawing connectors."""
+    lines = []
+    for i, node in enumerate(nodes):
+        is_last = i == len(nodes) - 1
+        connector = "└── " if is_last else "├── "
+        if node.is_dir and node.children is None:
+            lines.append(f"{prefix}{connector}{node.name} ({node.files} files)")
+        else:
+            lines.append(f"{prefix}{connector}{node.name}")
+
+        if node.children:
+            extension = "    " if is_last else "│   "
+            lines.extend(render_tree(node.children, prefix + extension))
+    return lines
+
+
+def flatten_tree(nodes: list[TreeNode]) -> list[dict]:
+    """Flatten tree nodes into compact JSON entries in display order."""
+    entries = []
+    for node in nodes:
+        if not node.is_dir:
+            entries.append({"path": node.path, "type": "file"})
+        elif node.children is None:
+            entries.append({"path": node.path, "type": "dir", "files": node.files})
+        else:
+            entries.append({"path": node.path, "type": "dir"})
+            entries.extend(flatten_tree(node.children))
+    return entries
+
+
+def _matches(path: str, name: str, patterns: list[str]) -> bool:
+    """Match a glob against either the project-relative path or the bare name."""
+    return any(fnmatch(path, pattern) or fnmatch(name, pattern) for pattern in patterns)
@@ -0,0 +1,131 @@
+"""
+Scaffold Templates
+Loads project and script templates from mcp/templates/, compiles their
+{{placeholders}} once, and materializes rendered files in one pass,
+leaving files whose content is already up to date untouched.
+"""
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+_PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+# Describes a scaffold directory (extra empty directories to create)
+SCAFFOLD_FILE = "scaffold.json"
+
+# Threads used to write a scaffold's files
+WRITE_WORKERS = 8
+
+
+class Template:
+    """A template split into literal text and placeholder names."""
+
+    def __init__(self, text: str):
+        self.segments: list[tuple[str, str]] = []
+        pos = 0
+        for match in _PLACEHOLDER.finditer(text):
+            self.segments.append((text[pos:match.start()], match.group(1)))
+            pos = match.end()
+        self.tail = text[pos:]
+        self.params = {name for _, name in self.segments}
+
+    def render(self, params: dict) -> str:
+        missing = self.params - params.keys()
+        if missing:
+            raise KeyError(f"Missing template parameters: {', '.join(sorted(missing))}")
+        parts = []
+        for literal, name in self.segments:
+            parts.append(literal)
+            parts.append(str(params[name]))
+        parts.append(self.tail)
+        return "".join(parts)
+
+
+class Scaffold(NamedTuple):
+    """Templates of one project scaffold, keyed by output path."""
+    files: dict[str, Template]
+    dirs: list[str]
+
+
+class TemplateStore:
+    """Compiled templates under a directory, recompiled only when a file changes."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        # rel path -> (mtime_ns, compiled template)
+        self._compiled: dict[str, tuple[int, Template]] = {}
+
+    def get(self, rel: str) -> Template:
+        """Compiled template for a path relative to the store root."""
+        path = self.root / rel
+        mtime_ns = path.stat().st_mtime_ns
+        cached = self._compiled.get(rel)
+        if cached is None or cached[0] != mtime_ns:
+            cached = (mtime_ns, Template(path.read_text(encoding="utf-8")))
+            self._compiled[rel] = cached
+        return cached[1]
+
+    def exists(self, rel: str) -> bool:
+        return (self.root / rel).is_file()
+
+    def scaffold(self, rel: str) -> Scaffold:
+        """Every template below a scaffold directory plus its declared empty dirs."""
+        base = self.root / rel
+        files, dirs = {}, []
+        for dirpath, _, filenames in os.walk(base):
+            for filename in filenames:
+                target = (Path(dirpath) / filename).relative_to(base).as_posix()
+                if target == SCAFFOLD_FILE:
+                    dirs = json.loads((base / filename).read_text()).get("dirs", [])
+                    continue
+                files[target] = self.get(f"{rel}/{target}")
+        return Scaffold(dict(sorted(files.items())), dirs)
+
+    def render(self, rel: str, params: dict) -> str:
+        return self.get(rel).render(params)
+
+    def render_scaffold(self, rel: str, params: dict) -> tuple[dict[str, str], list[str]]:
+        """Rendered output path -> content for a whole scaffold, and its empty dirs."""
+        scaffold = self.scaffold(rel)
+        return {target: template.render(params) for target, template in scaffold.files.items()}, scaffold.dirs
+
+
+def content_status(path: Path, data: bytes) -> str:
+    """'created', 'modified' or 'unchanged' for writing data to path."""
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        return "created"
+    if size != len(data):
+        return "modified"
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(65536), b""):
+            digest.update(block)
+    return "unchanged" if digest.digest() == hashlib.sha256(data).digest() else "modified"
+
+
+def write_if_changed(path: Path, data: bytes) -> str:
+    """Write data unless the file already holds it, so mtimes (and engine reimports) only move on change."""
+    status = content_status(path, data)
+    if status != "unchanged":
+        path.write_bytes(data)
+    return status
+
+
+def write_files(base: Path, files: dict[str, str], dirs: list[str] = ()) -> dict[str, str]:
+    """Write rendered files below base in parallel; returns path -> created/modified/unchanged."""
+    for rel in list(dirs) + sorted({str(Path(rel).parent) for rel in files}):
+        (base / rel).mkdir(parents=True, exist_ok=True)
+
+    def write(item: tuple[str, str]) -> tuple[str, str]:
+        rel, content = item
+        return rel, write_if_changed(base / rel, content.encode("utf-8"))
+
+    with ThreadPoolExecutor(max_workers=min(WRITE_WORKERS, max(len(files), 1))) as pool:
+        return dict(pool.map(write, files.items()))
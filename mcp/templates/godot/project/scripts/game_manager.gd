@@ -0,0 +1,21 @@
+extends Node
+
+## Game Manager - Central game state and logic
+
+var score: int = 0
+var is_paused: bool = false
+
+func _ready() -> void:
+    print("Game started!")
+
+func add_score(amount: int) -> void:
+    score += amount
+    print("Score: ", score)
+
+func pause_game() -> void:
+    is_paused = true
+    get_tree().paused = true
+
+func resume_game() -> void:
+    is_paused = false
+    get_tree().paused = false
@@ -0,0 +1,19 @@
+extends CharacterBody2D
+
+@export var speed: float = 100.0
+@export var health: int = 3
+
+signal died
+
+func _physics_process(delta: float) -> void:
+    # Basic patrol or chase logic here
+    move_and_slide()
+
+func take_damage(amount: int) -> void:
+    health -= amount
+    if health <= 0:
+        die()
+
+func die() -> void:
+    died.emit()
+    queue_free()
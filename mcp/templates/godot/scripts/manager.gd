@@ -0,0 +1,12 @@
+extends Node
+
+## Manager for handling game subsystem
+
+func _ready() -> void:
+    pass
+
+func initialize() -> void:
+    pass
+
+func cleanup() -> void:
+    pass
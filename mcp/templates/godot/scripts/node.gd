@@ -0,0 +1,7 @@
+extends Node
+
+func _ready() -> void:
+    pass
+
+func _process(delta: float) -> void:
+    pass
@@ -0,0 +1,21 @@
+extends CharacterBody2D
+
+@export var speed: float = 200.0
+@export var jump_force: float = 400.0
+
+var gravity: float = ProjectSettings.get_setting("physics/2d/default_gravity")
+
+func _physics_process(delta: float) -> void:
+    # Gravity
+    if not is_on_floor():
+        velocity.y += gravity * delta
+
+    # Jump
+    if Input.is_action_just_pressed("jump") and is_on_floor():
+        velocity.y = -jump_force
+
+    # Movement
+    var direction := Input.get_axis("move_left", "move_right")
+    velocity.x = direction * speed
+
+    move_and_slide()
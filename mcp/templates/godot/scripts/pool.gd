@@ -0,0 +1,108 @@
+class_name {{name}}
+extends Node
+## Prewarmed pool of scene instances, kept as children of this node.
+## acquire() shows and resumes a pooled instance and release() hides and
+## pauses it again, so nothing is instantiated or freed while the pool has
+## room. Pooled scenes may define _on_pool_acquire() / _on_pool_release()
+## to reset per-use state.
+
+enum Growth {
+    FIXED,    ## acquire() returns null when every instance is in use
+    GROW,     ## instantiate more, up to max_size (0 = unbounded)
+    RECYCLE,  ## take back the instance that has been out the longest
+}
+
+@export var scene: PackedScene{{scene_init}}
+@export var capacity: int = {{capacity}}
+@export var growth: Growth = Growth.{{growth}}
+@export var max_size: int = {{max_size}}
+
+var _available: Array[Node] = []
+# Out instances as a linked list, oldest first (node -> neighbour), so
+# release() and RECYCLE never search or shift an array
+var _older: Dictionary = {}
+var _newer: Dictionary = {}
+var _oldest: Node = null
+var _newest: Node = null
+var _created := 0
+
+func _ready() -> void:
+    prewarm(capacity)
+
+## Instantiate inactive instances until count are available.
+func prewarm(count: int) -> void:
+    while _available.size() < count and (max_size <= 0 or _created < max_size):
+        _available.push_back(_create())
+
+## An active instance, or null when a FIXED pool is exhausted.
+func acquire() -> Node:
+    var item: Node
+    if not _available.is_empty():
+        item = _available.pop_back()
+    elif growth == Growth.GROW and (max_size <= 0 or _created < max_size):
+        item = _create()
+    elif growth == Growth.RECYCLE and _oldest != null:
+        item = _oldest
+        _unlink(item)
+        _set_active(item, false)
+    else:
+        return null
+    _link(item)
+    _set_active(item, true)
+    return item
+
+## Return an instance to the pool; ignores foreign or already released nodes.
+func release(item: Node) -> void:
+    if not _older.has(item):
+        return
+    _unlink(item)
+    _set_active(item, false)
+    _available.push_back(item)
+
+func release_all() -> void:
+    while _newest != null:
+        release(_newest)
+
+func count_active() -> int:
+    return _older.size()
+
+func count_inactive() -> int:
+    return _available.size()
+
+func _create() -> Node:
+    var item := scene.instantiate()
+    _created += 1
+    add_child(item)
+    _set_active(item, false)
+    return item
+
+func _link(item: Node) -> void:
+    _older[item] = _newest
+    _newer[item] = null
+    if _newest != null:
+        _newer[_newest] = item
+    else:
+        _oldest = item
+    _newest = item
+
+func _unlink(item: Node) -> void:
+    var before: Node = _older[item]
+    var after: Node = _newer[item]
+    if before != null:
+        _newer[before] = after
+    else:
+        _oldest = after
+    if after != null:
+        _older[after] = before
+    else:
+        _newest = before
+    _older.erase(item)
+    _newer.erase(item)
+
+func _set_active(item: Node, active: bool) -> void:
+    if item is CanvasItem or item is Node3D:
+        item.visible = active
+    item.process_mode = Node.PROCESS_MODE_INHERIT if active else Node.PROCESS_MODE_DISABLED
+    var hook := "_on_pool_acquire" if active else "_on_pool_release"
+    if item.has_method(hook):
+        item.call(hook)
@@ -0,0 +1,7 @@
+extends Control
+
+func _ready() -> void:
+    pass
+
+func update_display() -> void:
+    pass
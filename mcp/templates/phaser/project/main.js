@@ -0,0 +1,19 @@
+import Phaser from 'phaser';
+import { GameScene } from './scenes/GameScene.js';
+
+const config = {
+    type: Phaser.AUTO,
+    width: 800,
+    height: 600,
+    backgroundColor: '#2d2d2d',
+    physics: {
+        default: 'arcade',
+        arcade: {
+            gravity: { y: 300 },
+            debug: false
+        }
+    },
+    scene: [GameScene]
+};
+
+const game = new Phaser.Game(config);
@@ -0,0 +1,58 @@
+import Phaser from 'phaser';
+
+export class GameScene extends Phaser.Scene {
+    constructor() {
+        super({ key: 'GameScene' });
+        this.score = 0;
+    }
+
+    preload() {
+        // Load assets here
+        // this.load.image('player', 'assets/player.png');
+    }
+
+    create() {
+        // Create game objects
+        this.add.text(400, 300, 'Game Jam!', {
+            fontSize: '48px',
+            fill: '#fff'
+        }).setOrigin(0.5);
+
+        // Create player (placeholder rectangle)
+        this.player = this.add.rectangle(400, 500, 32, 32, 0x00ff00);
+        this.physics.add.existing(this.player);
+        this.player.body.setCollideWorldBounds(true);
+
+        // Setup controls
+        this.cursors = this.input.keyboard.createCursorKeys();
+
+        // Score text
+        this.scoreText = this.add.text(16, 16, 'Score: 0', {
+            fontSize: '24px',
+            fill: '#fff'
+        });
+    }
+
+    update() {
+        const speed = 200;
+
+        // Horizontal movement
+        if (this.cursors.left.isDown) {
+            this.player.body.setVelocityX(-speed);
+        } else if (this.cursors.right.isDown) {
+            this.player.body.setVelocityX(speed);
+        } else {
+            this.player.body.setVelocityX(0);
+        }
+
+        // Jump
+        if (this.cursors.up.isDown && this.player.body.touching.down) {
+            this.player.body.setVelocityY(-330);
+        }
+    }
+
+    addScore(amount) {
+        this.score += amount;
+        this.scoreText.setText('Score: ' + this.score);
+    }
+}
@@ -0,0 +1,75 @@
+/**
+ * Prewarmed pool of arcade sprites backed by a physics group.
+ * acquire() revives a pooled sprite and release() disables and hides it
+ * again, so nothing is created or destroyed while the pool has room.
+ *
+ * Growth policies:
+ *   fixed   - acquire() returns null when every sprite is in use
+ *   grow    - create more, up to maxSize (0 = unbounded)
+ *   recycle - take back the sprite that has been out the longest
+ */
+export class {{name}} {
+    constructor(scene, {
+        texture = '{{texture}}',
+        capacity = {{capacity}},
+        growth = '{{growth}}',
+        maxSize = {{max_size}},
+        allowGravity = false
+    } = {}) {
+        this.scene = scene;
+        this.texture = texture;
+        this.growth = growth;
+        this.maxSize = maxSize;
+        this.group = scene.physics.add.group({ allowGravity });
+        // Out sprites; a Set keeps insertion order (oldest first) and deletes in O(1)
+        this.active = new Set();
+        this.prewarm(capacity);
+    }
+
+    /** Create disabled sprites until count are available. */
+    prewarm(count) {
+        while (this.countInactive < count && (this.maxSize <= 0 || this.group.getLength() < this.maxSize)) {
+            const item = this.group.create(0, 0, this.texture);
+            item.disableBody(true, true);
+        }
+    }
+
+    /** An enabled sprite at (x, y), or null when a fixed pool is exhausted. */
+    acquire(x, y) {
+        let item = this.group.getFirstDead(false);
+        if (!item && this.growth === 'grow' && (this.maxSize <= 0 || this.group.getLength() < this.maxSize)) {
+            item = this.group.create(x, y, this.texture);
+        } else if (!item && this.growth === 'recycle' && this.active.size > 0) {
+            item = this.active.values().next().value;
+            this.active.delete(item);
+        }
+        if (!item) {
+            return null;
+        }
+        item.enableBody(true, x, y, true, true);
+        this.active.add(item);
+        return item;
+    }
+
+    /** Return a sprite to the pool; ignores foreign or already released sprites. */
+    release(item) {
+        if (!this.active.delete(item)) {
+            return;
+        }
+        item.disableBody(true, true);
+    }
+
+    releaseAll() {
+        for (const item of [...this.active]) {
+            this.release(item);
+        }
+    }
+
+    get countActive() {
+        return this.active.size;
+    }
+
+    get countInactive() {
+        return this.group.getLength() - this.active.size;
+    }
+}
@@ -0,0 +1,19 @@
+import Phaser from 'phaser';
+
+export class {{name}} extends Phaser.Scene {
+    constructor() {
+        super({ key: '{{name}}' });
+    }
+
+    preload() {
+
+    }
+
+    create() {
+
+    }
+
+    update(time, delta) {
+
+    }
+}
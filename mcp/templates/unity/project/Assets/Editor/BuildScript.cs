@@ -0,0 +1,46 @@
+using System;
+using System.IO;
+using System.Linq;
+using UnityEditor;
+using UnityEditor.Build.Reporting;
+
+/// <summary>
+/// Headless build entry point used by the MCP build tool:
+/// Unity -batchmode -quit -buildTarget WebGL -executeMethod BuildScript.Build -buildOutput <dir>
+/// </summary>
+public static class BuildScript
+{
+    public static void Build()
+    {
+        string output = GetArgument("-buildOutput") ?? Path.Combine("..", "builds", "unity");
+        BuildTarget target = EditorUserBuildSettings.activeBuildTarget;
+
+        string location = output;
+        if (target == BuildTarget.StandaloneWindows64)
+            location = Path.Combine(output, PlayerSettings.productName + ".exe");
+        else if (target == BuildTarget.StandaloneOSX)
+            location = Path.Combine(output, PlayerSettings.productName + ".app");
+        else if (target == BuildTarget.StandaloneLinux64)
+            location = Path.Combine(output, PlayerSettings.productName);
+
+        var options = new BuildPlayerOptions
+        {
+            scenes = EditorBuildSettings.scenes.Where(s => s.enabled).Select(s => s.path).ToArray(),
+            locationPathName = location,
+            target = target,
+            options = BuildOptions.None
+        };
+
+        BuildReport report = BuildPipeline.BuildPlayer(options);
+        Console.WriteLine($"Build {report.summary.result}: {report.summary.totalSize} bytes in {report.summary.totalTime}");
+        if (report.summary.result != BuildResult.Succeeded)
+            EditorApplication.Exit(1);
+    }
+
+    static string GetArgument(string name)
+    {
+        string[] args = Environment.GetCommandLineArgs();
+        int index = Array.IndexOf(args, name);
+        return index >= 0 && index + 1 < args.Length ? args[index + 1] : null;
+    }
+}
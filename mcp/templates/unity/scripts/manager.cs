@@ -0,0 +1,29 @@
+using UnityEngine;
+
+public class {{name}} : MonoBehaviour
+{
+    public static {{name}} Instance { get; private set; }
+
+    void Awake()
+    {
+        if (Instance == null)
+        {
+            Instance = this;
+            DontDestroyOnLoad(gameObject);
+        }
+        else
+        {
+            Destroy(gameObject);
+        }
+    }
+
+    void Start()
+    {
+        Initialize();
+    }
+
+    void Initialize()
+    {
+
+    }
+}
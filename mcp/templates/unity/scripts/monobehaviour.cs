@@ -0,0 +1,14 @@
+using UnityEngine;
+
+public class {{name}} : MonoBehaviour
+{
+    void Start()
+    {
+
+    }
+
+    void Update()
+    {
+
+    }
+}
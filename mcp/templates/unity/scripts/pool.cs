@@ -0,0 +1,128 @@
+using System.Collections.Generic;
+using UnityEngine;
+
+/// <summary>
+/// Prewarmed pool of {{component}} instances cloned from a prefab.
+/// Get() activates a pooled instance and Release() deactivates it again, so
+/// nothing is instantiated or destroyed while the pool has room. Use
+/// OnEnable/OnDisable on the prefab to reset per-use state.
+/// </summary>
+public class {{name}} : MonoBehaviour
+{
+    public enum Growth
+    {
+        Fixed,   // Get() returns null when every instance is in use
+        Grow,    // instantiate more, up to maxSize (0 = unbounded)
+        Recycle  // take back the instance that has been out the longest
+    }
+
+    public static {{name}} Instance { get; private set; }
+
+    [SerializeField] private {{component}} prefab;
+    [SerializeField] private int capacity = {{capacity}};
+    [SerializeField] private Growth growth = Growth.{{growth}};
+    [SerializeField] private int maxSize = {{max_size}};
+
+    private readonly Stack<{{component}}> available = new Stack<{{component}}>();
+    // Out instances, oldest first; each instance owns one node so Get/Release never allocate
+    private readonly LinkedList<{{component}}> active = new LinkedList<{{component}}>();
+    private readonly Dictionary<{{component}}, LinkedListNode<{{component}}>> nodes = new Dictionary<{{component}}, LinkedListNode<{{component}}>>();
+
+    public int CountActive => active.Count;
+    public int CountInactive => available.Count;
+    public int CountAll => nodes.Count;
+
+    void Awake()
+    {
+        if (Instance != null && Instance != this)
+        {
+            Destroy(gameObject);
+            return;
+        }
+        Instance = this;
+        Prewarm(capacity);
+    }
+
+    void OnDestroy()
+    {
+        if (Instance == this)
+        {
+            Instance = null;
+        }
+    }
+
+    /// <summary>Instantiate inactive instances until count are available.</summary>
+    public void Prewarm(int count)
+    {
+        while (available.Count < count && (maxSize <= 0 || nodes.Count < maxSize))
+        {
+            available.Push(Create());
+        }
+    }
+
+    public {{component}} Get()
+    {
+        return Get(prefab.transform.position, prefab.transform.rotation);
+    }
+
+    /// <summary>An active instance at the given pose, or null when a Fixed pool is exhausted.</summary>
+    public {{component}} Get(Vector3 position, Quaternion rotation)
+    {
+        {{component}} item;
+        if (available.Count > 0)
+        {
+            item = available.Pop();
+        }
+        else if (growth == Growth.Grow && (maxSize <= 0 || nodes.Count < maxSize))
+        {
+            item = Create();
+        }
+        else if (growth == Growth.Recycle && active.First != null)
+        {
+            item = active.First.Value;
+            active.RemoveFirst();
+            item.gameObject.SetActive(false);
+        }
+        else
+        {
+            return null;
+        }
+
+        item.transform.SetPositionAndRotation(position, rotation);
+        item.gameObject.SetActive(true);
+        active.AddLast(nodes[item]);
+        return item;
+    }
+
+    /// <summary>Return an instance to the pool; ignores foreign or already released objects.</summary>
+    public void Release({{component}} item)
+    {
+        if (item == null || !nodes.TryGetValue(item, out var node) || node.List == null)
+        {
+            return;
+        }
+        active.Remove(node);
+        item.gameObject.SetActive(false);
+        if (item.transform.parent != transform)
+        {
+            item.transform.SetParent(transform, false);
+        }
+        available.Push(item);
+    }
+
+    public void ReleaseAll()
+    {
+        while (active.First != null)
+        {
+            Release(active.First.Value);
+        }
+    }
+
+    private {{component}} Create()
+    {
+        var item = Instantiate(prefab, transform);
+        item.gameObject.SetActive(false);
+        nodes.Add(item, new LinkedListNode<{{component}}>(item));
+        return item;
+    }
+}
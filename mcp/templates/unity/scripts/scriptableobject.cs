@@ -0,0 +1,8 @@
+using UnityEngine;
+
+[CreateAssetMenu(fileName = "{{name}}", menuName = "Game/{{name}}")]
+public class {{name}} : ScriptableObject
+{
+    public string displayName;
+    public int value;
+}
@@ -0,0 +1,329 @@
+"""
+Unity Scene Analyzer
+Streams a .unity scene one document at a time to rebuild the GameObject
+hierarchy, count components and flag costly patterns (unbatched sprites,
+colliders without rigidbodies on non-static objects, missing scripts).
+"""
+
+from pathlib import Path
+from typing import Iterator, Optional
+
+from disk_cache import DiskCache
+from unity_yaml import DOC_HEADER, FILE_ID, GUID
+
+# Bump when the cached analysis layout changes
+INDEX_VERSION = 1
+
+# Active SpriteRenderers in a scene before material sharing is worth reporting
+SPRITE_BATCH_THRESHOLD = 20
+
+# Top-level fields and lists kept per document; everything else is skipped
+_FIELDS = {b"m_Name", b"m_IsActive", b"m_StaticEditorFlags", b"m_GameObject", b"m_Father", b"m_Enabled",
+           b"m_Script", b"m_EditorClassIdentifier", b"m_PrefabInstance"}
+_LIST_FIELDS = {b"m_Component", b"m_Children", b"m_Materials", b"m_Roots"}
+
+_RIGIDBODIES = {"Rigidbody", "Rigidbody2D", "ArticulationBody"}
+
+
+class SceneDocument:
+    """Top-level fields of one scene document, gathered line by line."""
+    __slots__ = ("class_id", "file_id", "stripped", "type", "fields", "lists")
+
+    def __init__(self, class_id: int, file_id: int, stripped: bool):
+        self.class_id = class_id
+        self.file_id = file_id
+        self.stripped = stripped
+        self.type = ""
+        self.fields: dict[str, bytes] = {}
+        self.lists: dict[str, list[bytes]] = {}
+
+    def ref(self, field: str) -> int:
+        """fileID of a {fileID: N} field, 0 when unset."""
+        match = FILE_ID.search(self.fields.get(field, b""))
+        return int(match.group(1)) if match else 0
+
+    def flag(self, field: str, default: int = 0) -> int:
+        value = self.fields.get(field, b"")
+        return int(value) if value.lstrip(b"-").isdigit() else default
+
+
+def iter_documents(path: Path) -> Iterator[SceneDocument]:
+    """Yield each document of a Unity YAML file with only its top-level fields.
+
+    Lines are read one at a time and nested blocks are skipped, so memory
+    stays flat however large the scene is.
+    """
+    current: Optional[SceneDocument] = None
+    list_field: Optional[str] = None
+    with open(path, "rb") as f:
+        for line in f:
+            if line.startswith(b"  m_"):
+                # Most lines are top-level fields; only the ones the analysis reads are kept
+                key, _, value = line[2:].partition(b":")
+                value = value.strip()
+                if value:
+                    list_field = None
+                    if key in _FIELDS and current is not None:
+                        current.fields[key.decode()] = value
+                elif key in _LIST_FIELDS and current is not None:
+                    list_field = key.decode()
+                    current.lists[list_field] = []
+                else:
+                    list_field = None
+            elif line.startswith(b"  - "):
+                if list_field is not None:
+                    current.lists[list_field].append(line[4:].strip())
+            elif line.startswith(b"--- "):
+                match = DOC_HEADER.match(line)
+                if match:
+                    if current:
+                        yield current
+                    current = SceneDocument(int(match.group(1)), int(match.group(2)), bool(match.group(3)))
+                    list_field = None
+            elif not line.startswith(b"   "):
+                if current is not None and not current.type and not line.startswith(b" "):
+                    current.type = line.strip().rstrip(b":").decode(errors="replace")
+                list_field = None
+    if current:
+        yield current
+
+
+def analyze_scene(path: Path) -> dict:
+    """Hierarchy, component counts and cost flags for one scene.
+
+    The result only depends on the scene file, so it can be cached by mtime;
+    missing-script checks against the project's GUIDs happen in summarize().
+    """
+    game_objects: dict[int, dict] = {}
+    transforms: dict[int, dict] = {}
+    components: dict[int, dict] = {}
+    counts: dict[str, int] = {}
+    root_order: list[int] = []
+    documents = prefab_instances = 0
+
+    for doc in iter_documents(path):
+        documents += 1
+        if doc.type == "SceneRoots":
+            root_order = [_ref(item) for item in doc.lists.get("m_Roots", [])]
+            continue
+        if doc.type == "PrefabInstance":
+            prefab_instances += 1
+            continue
+        if doc.stripped:
+            # Placeholder for an object that lives in a prefab; kept so the hierarchy still links up
+            if doc.type in ("Transform", "RectTransform"):
+                transforms[doc.file_id] = {"go": 0, "father": 0, "children": [], "prefab": doc.ref("m_PrefabInstance")}
+            continue
+        if doc.type == "GameObject":
+            game_objects[doc.file_id] = {
+                "name": _unquote(doc.fields.get("m_Name", b"").decode(errors="replace")),
+                "active": doc.flag("m_IsActive", 1) == 1,
+                "static": doc.flag("m_StaticEditorFlags") != 0,
+                "components": [_ref(item) for item in doc.lists.get("m_Component", [])],
+            }
+            continue
+
+        go = doc.ref("m_GameObject")
+        if not go:
+            continue
+        type_name = doc.type
+        if type_name == "MonoBehaviour":
+            identifier = doc.fields.get("m_EditorClassIdentifier", b"").decode(errors="replace")
+            assembly, _, class_name = identifier.rpartition("::")
+            guid = GUID.search(doc.fields.get("m_Script", b""))
+            script = {"guid": guid.group(1).decode() if guid else "", "assembly": assembly,
+                      "class": class_name.rpartition(".")[2]}
+            type_name = script["class"] or "MonoBehaviour"
+        else:
+            script = None
+        counts[type_name] = counts.get(type_name, 0) + 1
+
+        if doc.type in ("Transform", "RectTransform"):
+            transforms[doc.file_id] = {"go": go, "father": doc.ref("m_Father"),
+                                       "children": [_ref(item) for item in doc.lists.get("m_Children", [])]}
+        component = {"type": type_name, "class": doc.type, "go": go, "enabled": doc.flag("m_Enabled", 1) == 1}
+        if doc.type == "SpriteRenderer":
+            component["materials"] = [_material_key(item) for item in doc.lists.get("m_Materials", [])]
+        if script is not None:
+            component["script"] = script
+        components[doc.file_id] = component
+
+    # Hierarchy: transform parent links, roots in the scene's saved order (SceneRoots) when present
+    roots = [fid for fid, t in transforms.items() if not t["father"] or t["father"] not in transforms]
+    order = {fid: index for index, fid in enumerate(root_order)}
+    roots.sort(key=lambda fid: (order.get(fid, len(order)), game_objects.get(transforms[fid]["go"], {}).get("name", "")))
+
+    tree: list[list] = []
+    paths: dict[int, str] = {}
+    active_in_hierarchy: dict[int, bool] = {}
+    attached_body: dict[int, bool] = {}
+    go_components: dict[int, list[dict]] = {}
+    for component in components.values():
+        go_components.setdefault(component["go"], []).append(component)
+
+    by_father: dict[int, list[int]] = {}
+    for fid, transform in transforms.items():
+        if transform["father"]:
+            by_father.setdefault(transform["father"], []).append(fid)
+
+    stack = [(fid, 0, "", True, False) for fid in reversed(roots)]
+    visited = set()
+    while stack:
+        fid, depth, parent_path, parent_active, parent_body = stack.pop()
+        if fid in visited:
+            continue
+        visited.add(fid)
+        transform = transforms[fid]
+        go = game_objects.get(transform["go"])
+        if go is None:
+            name = "<prefab instance>" if transform.get("prefab") else "<missing GameObject>"
+            active = parent_active
+            types = []
+            has_body = parent_body
+        else:
+            name = go["name"]
+            active = parent_active and go["active"]
+            types = [components[c]["type"] for c in go["components"]
+                     if c in components and components[c]["class"] not in ("Transform", "RectTransform")]
+            has_body = parent_body or any(c["class"] in _RIGIDBODIES for c in go_components.get(transform["go"], []))
+            paths[transform["go"]] = f"{parent_path}/{name}" if parent_path else name
+            active_in_hierarchy[transform["go"]] = active
+            attached_body[transform["go"]] = has_body
+        tree.append([depth, name, active, types])
+
+        # m_Children keeps the editor's order; father links also cover children of prefab instances
+        children = [child for child in transform["children"] if child in transforms]
+        children += [child for child in by_father.get(fid, []) if child not in children]
+        path = paths.get(transform["go"], parent_path)
+        for child in reversed(children):
+            stack.append((child, depth + 1, path, active, has_body))
+
+    # Cost flags
+    sprites = []
+    colliders = []
+    scripts = []
+    for component in components.values():
+        go = component["go"]
+        if not active_in_hierarchy.get(go, False):
+            continue
+        owner = game_objects.get(go, {})
+        if component["class"] == "SpriteRenderer" and component["enabled"]:
+            sprites.append([paths.get(go, ""), component["materials"]])
+        elif _is_collider(component["class"]) and component["enabled"]:
+            if not attached_body.get(go, False) and not owner.get("static", False):
+                colliders.append([paths.get(go, ""), component["class"]])
+        if "script" in component:
+            scripts.append([paths.get(go, ""), component["script"]["guid"], component["script"]["assembly"],
+                            component["script"]["class"]])
+
+    return {
+        "documents": documents,
+        "game_objects": len(game_objects),
+        "active_game_objects": sum(1 for active in active_in_hierarchy.values() if active),
+        "prefab_instances": prefab_instances,
+        "components": dict(sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))),
+        "tree": tree,
+        "sprites": sprites,
+        "loose_colliders": colliders,
+        "scripts": scripts,
+    }
+
+
+def summarize(analysis: dict, known_guids: set = None, max_depth: int = 3, limit: int = 20,
+              hierarchy: bool = True) -> dict:
+    """Compact report from an analysis: an indented outline and the flagged issues."""
+    issues = {}
+
+    sprites = analysis["sprites"]
+    if len(sprites) >= SPRITE_BATCH_THRESHOLD:
+        users: dict[str, int] = {}
+        for _, materials in sprites:
+            for material in materials or ["none"]:
+                users[material] = users.get(material, 0) + 1
+        unshared = [path for path, materials in sprites if any(users[m] == 1 for m in materials or ["none"])]
+        if unshared or len(users) > 1:
+            issues["sprite_batching"] = {
+                "active_sprite_renderers": len(sprites),
+                "distinct_materials": len(users),
+                "unshared": len(unshared),
+                "examples": unshared[:limit],
+                "hint": "Sprites with different materials cannot batch; share one material (and an atlas)",
+            }
+
+    if analysis["loose_colliders"]:
+        issues["non_static_colliders"] = {
+            "count": len(analysis["loose_colliders"]),
+            "examples": [f"{path} ({kind})" for path, kind in analysis["loose_colliders"][:limit]],
+            "hint": "Colliders without a Rigidbody are static; mark the object Static or add a kinematic Rigidbody if it moves",
+        }
+
+    if known_guids is not None:
+        missing = []
+        for path, guid, assembly, class_name in analysis["scripts"]:
+            if not guid:
+                missing.append(f"{path} (no script)")
+            elif guid not in known_guids and assembly in ("", "Assembly-CSharp", "Assembly-CSharp-firstpass"):
+                # Package scripts (e.g. UnityEngine.UI) live outside Assets and cannot be checked here
+                missing.append(f"{path} ({class_name or guid})")
+        if missing:
+            issues["missing_scripts"] = {"count": len(missing), "examples": missing[:limit]}
+
+    result = {key: analysis[key] for key in ("documents", "game_objects", "active_game_objects",
+                                              "prefab_instances", "components")}
+    result["roots"] = sum(1 for depth, *_ in analysis["tree"] if depth == 0)
+    result["max_depth"] = max((depth for depth, *_ in analysis["tree"]), default=0)
+    if hierarchy:
+        outline = []
+        for depth, name, active, types in analysis["tree"]:
+            if depth > max_depth:
+                continue
+            line = "  " * depth + name + ("" if active else " (inactive)")
+            if types:
+                line += f" [{', '.join(types)}]"
+            outline.append(line)
+        result["hierarchy"] = outline
+    result["issues"] = issues
+    return result
+
+
+class SceneAnalyzer:
+    """Per-scene analyses cached in the DiskCache by mtime and size."""
+
+    def __init__(self, project_root: Path, cache: DiskCache = None):
+        self.project_root = project_root
+        self.cache = cache
+
+    def analyze(self, scene: str) -> tuple[dict, bool]:
+        """Analysis of a scene path relative to the project root, and whether it came from the cache."""
+        path = self.project_root / scene
+        stat = path.stat()
+        rel = path.relative_to(self.project_root).as_posix()
+        if self.cache is not None:
+            cached = self.cache.get("unity-scenes", rel, stat.st_mtime_ns, stat.st_size, INDEX_VERSION)
+            if cached is not None:
+                return cached, True
+        analysis = analyze_scene(path)
+        if self.cache is not None:
+            self.cache.put("unity-scenes", rel, stat.st_mtime_ns, stat.st_size, analysis, INDEX_VERSION)
+        return analysis, False
+
+
+def _ref(item: bytes) -> int:
+    match = FILE_ID.search(item)
+    return int(match.group(1)) if match else 0
+
+
+def _material_key(item: bytes) -> str:
+    """Identify a material reference: asset GUID plus fileID, or the local fileID."""
+    guid = GUID.search(item)
+    return f"{guid.group(1).decode()}:{_ref(item)}" if guid else str(_ref(item))
+
+
+def _is_collider(class_name: str) -> bool:
+    return class_name.endswith("Collider") or class_name.endswith("Collider2D")
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        return value[1:-1]
+    return value
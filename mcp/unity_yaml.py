@@ -0,0 +1,454 @@
+"""
+Unity YAML Assets
+Streaming reader for Unity's multi-document YAML (`--- !u!<classID> &<fileID>`)
+and an in-memory index of the objects in .asset/.unity/.prefab files.
+"""
+
+import os
+import re
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Iterator, NamedTuple, Optional
+
+from disk_cache import DiskCache
+from project_index import SKIP_DIRS
+
+# Text-serialized Unity files worth indexing
+UNITY_YAML_SUFFIXES = {
+    ".asset", ".unity", ".prefab", ".mat", ".anim", ".controller",
+    ".overrideController", ".physicsMaterial2D", ".spriteatlas", ".mask", ".playable"
+}
+
+# Bump when UnityObject's fields change so cached records are discarded
+INDEX_VERSION = 1
+
+# Document header, fileID and GUID references (shared with the scene analyzer)
+DOC_HEADER = re.compile(rb"^--- !u!(\d+) &(-?\d+)( stripped)?")
+FILE_ID = re.compile(rb"fileID: (-?\d+)")
+GUID = re.compile(rb"guid: ([0-9a-f]{32})")
+_MAPPING_ITEM = re.compile(r"^[^\s'\"{\[-][^:]*:(?: |$)")
+_INT = re.compile(r"^-?(?:0|[1-9]\d{0,18})$")
+_FLOAT = re.compile(r"^-?(?:(?:0|[1-9]\d*)(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d{1,3})?$")
+
+
+class UnityObject(NamedTuple):
+    """Index record for one document of a Unity YAML file."""
+    file: str               # path relative to the index root's project
+    file_id: int
+    class_id: int
+    type: str               # e.g. GameObject, MonoBehaviour
+    name: str
+    script_guid: str        # m_Script guid (MonoBehaviour / ScriptableObject)
+    script_class: str       # class from m_EditorClassIdentifier, e.g. BossData
+    game_object: int        # owning GameObject fileID for components
+    stripped: bool
+    offset: int             # byte offset of the document header
+    length: int             # byte length of the document
+
+    def summary(self) -> dict:
+        result = {"file": self.file, "fileID": self.file_id, "class": self.type, "classID": self.class_id}
+        if self.name:
+            result["name"] = self.name
+        if self.script_guid:
+            result["script"] = self.script_class or self.script_guid
+            result["script_guid"] = self.script_guid
+        if self.game_object:
+            result["gameObject"] = self.game_object
+        if self.stripped:
+            result["stripped"] = True
+        return result
+
+
+# =============================================================================
+# STREAMING DOCUMENT SCAN
+# =============================================================================
+
+def is_unity_yaml(path: Path) -> bool:
+    """Check the magic header without reading the whole file."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(5) == b"%YAML"
+    except OSError:
+        return False
+
+
+def scan_objects(path: Path, rel: str) -> Iterator[UnityObject]:
+    """Stream a Unity YAML file line by line, yielding one record per document.
+
+    Only the header and a few top-level fields are inspected, so the file
+    is never held in memory; bodies are parsed on demand by load_object.
+    """
+    current = None
+    offset = 0
+
+    def finish(end: int) -> UnityObject:
+        return UnityObject(**{**current, "length": end - current["offset"]})
+
+    with open(path, "rb") as f:
+        for line in f:
+            if line.startswith(b"--- "):
+                match = DOC_HEADER.match(line)
+                if match:
+                    if current:
+                        yield finish(offset)
+                    current = {
+                        "file": rel, "file_id": int(match.group(2)), "class_id": int(match.group(1)),
+                        "type": "", "name": "", "script_guid": "", "script_class": "", "game_object": 0,
+                        "stripped": bool(match.group(3)), "offset": offset
+                    }
+            elif current is not None:
+                if not current["type"] and not line.startswith(b" "):
+                    current["type"] = line.strip().rstrip(b":").decode(errors="replace")
+                elif line.startswith(b"  m_") and not line.startswith(b"   "):
+                    _read_header_field(current, line)
+            offset += len(line)
+
+    if current:
+        yield finish(offset)
+
+
+def _read_header_field(record: dict, line: bytes) -> None:
+    """Pick the indexed top-level fields out of a document line."""
+    if line.startswith(b"  m_Name: "):
+        record["name"] = _scalar(line[10:].decode(errors="replace").strip())
+    elif line.startswith(b"  m_Script: "):
+        guid = GUID.search(line)
+        record["script_guid"] = guid.group(1).decode() if guid else ""
+    elif line.startswith(b"  m_EditorClassIdentifier: "):
+        identifier = line[27:].decode(errors="replace").strip()
+        record["script_class"] = identifier.rpartition("::")[2].rpartition(".")[2]
+    elif line.startswith(b"  m_GameObject: "):
+        file_id = FILE_ID.search(line)
+        record["game_object"] = int(file_id.group(1)) if file_id else 0
+
+
+def load_object(root: Path, record: UnityObject) -> dict:
+    """Read and parse just one document's body."""
+    with open(root / record.file, "rb") as f:
+        f.seek(record.offset)
+        text = f.read(record.length).decode(errors="replace")
+    body = text.split("\n", 1)[1] if "\n" in text else ""
+    parsed = parse_document(body)
+    # Documents are a single `TypeName:` mapping; unwrap it
+    if isinstance(parsed, dict) and len(parsed) == 1:
+        return next(iter(parsed.values())) or {}
+    return parsed
+
+
+# =============================================================================
+# DOCUMENT PARSER
+# =============================================================================
+
+def parse_document(text: str) -> Any:
+    """Parse the body of one Unity YAML document.
+
+    Covers the subset Unity writes: block mappings, block sequences (at the
+    parent key's indent), flow mappings/sequences, quoted and wrapped plain
+    scalars, and literal/folded block scalars.
+    """
+    lines = []
+    for raw in text.split("\n"):
+        stripped = raw.strip()
+        if stripped and not stripped.startswith("#"):
+            lines.append([len(raw) - len(raw.lstrip(" ")), raw.strip(" ").rstrip("\r")])
+    if not lines:
+        return None
+    value, _ = _parse_block(lines, 0, lines[0][0])
+    return value
+
+
+def _parse_block(lines: list, i: int, indent: int) -> tuple[Any, int]:
+    content = lines[i][1]
+    if content == "-" or content.startswith("- "):
+        return _parse_sequence(lines, i, indent)
+    return _parse_mapping(lines, i, indent)
+
+
+def _parse_mapping(lines: list, i: int, indent: int) -> tuple[dict, int]:
+    result = {}
+    while i < len(lines) and lines[i][0] == indent:
+        content = lines[i][1]
+        if content == "-" or content.startswith("- "):
+            break
+        key, sep, rest = content.partition(": ")
+        if not sep:
+            key, rest = content.rstrip(":"), ""
+        key = _scalar(key)
+        rest = rest.strip()
+        i += 1
+
+        if rest:
+            result[key], i = _parse_inline(lines, i, indent, rest)
+        elif i < len(lines) and lines[i][0] > indent:
+            result[key], i = _parse_block(lines, i, lines[i][0])
+        elif i < len(lines) and lines[i][0] == indent and (lines[i][1] == "-" or lines[i][1].startswith("- ")):
+            # Unity writes sequences at the same indent as their key
+            result[key], i = _parse_sequence(lines, i, indent)
+        else:
+            result[key] = ""
+    return result, i
+
+
+def _parse_sequence(lines: list, i: int, indent: int) -> tuple[list, int]:
+    result = []
+    while i < len(lines) and lines[i][0] == indent:
+        content = lines[i][1]
+        if not (content == "-" or content.startswith("- ")):
+            break
+        rest = content[2:].strip()
+        if not rest:
+            i += 1
+            if i < len(lines) and lines[i][0] > indent:
+                item, i = _parse_block(lines, i, lines[i][0])
+            else:
+                item = None
+        elif _MAPPING_ITEM.match(rest) or rest.startswith("- "):
+            # `- key: value` starts a mapping (or nested sequence) two columns in
+            lines[i] = [indent + 2, rest]
+            item, i = _parse_block(lines, i, indent + 2)
+        else:
+            item, i = _parse_inline(lines, i + 1, indent, rest)
+        result.append(item)
+    return result, i
+
+
+def _parse_inline(lines: list, i: int, indent: int, text: str) -> tuple[Any, int]:
+    """Parse a value that starts on its key's line, pulling continuation lines."""
+    if text[0] in "|>":
+        block = []
+        while i < len(lines) and lines[i][0] > indent:
+            block.append(lines[i][1])
+            i += 1
+        joined = ("\n" if text[0] == "|" else " ").join(block)
+        return joined if text.endswith("-") else joined + "\n", i
+
+    if text[0] in "{[":
+        while _flow_depth(text) > 0 and i < len(lines):
+            text += " " + lines[i][1]
+            i += 1
+        value, _ = _parse_flow(text, 0)
+        return value, i
+
+    if text[0] in "'\"":
+        while not _quote_closed(text) and i < len(lines):
+            text += " " + lines[i][1]
+            i += 1
+        return _scalar(text), i
+
+    # Long plain scalars are wrapped onto deeper-indented lines
+    while i < len(lines) and lines[i][0] > indent:
+        text += " " + lines[i][1]
+        i += 1
+    return _scalar(text), i
+
+
+def _parse_flow(text: str, pos: int) -> tuple[Any, int]:
+    """Parse a flow mapping/sequence such as {fileID: 0, guid: ..., type: 3}."""
+    while text[pos] == " ":
+        pos += 1
+    opener = text[pos]
+    if opener not in "{[":
+        return _read_flow_scalar(text, pos)
+
+    closer = "}" if opener == "{" else "]"
+    result: Any = {} if opener == "{" else []
+    pos += 1
+    while pos < len(text):
+        while pos < len(text) and text[pos] in " ,":
+            pos += 1
+        if pos >= len(text) or text[pos] == closer:
+            return result, pos + 1
+        if opener == "{":
+            key_end = text.index(":", pos)
+            key = _scalar(text[pos:key_end].strip())
+            result[key], pos = _parse_flow(text, key_end + 1)
+        else:
+            item, pos = _parse_flow(text, pos)
+            result.append(item)
+    return result, pos
+
+
+def _read_flow_scalar(text: str, pos: int) -> tuple[Any, int]:
+    if text[pos] in "'\"":
+        quote = text[pos]
+        end = pos + 1
+        while end < len(text):
+            if text[end] == quote and not (quote == '"' and text[end - 1] == "\\"):
+                if quote == "'" and text[end + 1:end + 2] == "'":
+                    end += 2
+                    continue
+                break
+            end += 1
+        return _scalar(text[pos:end + 1]), end + 1
+    end = pos
+    while end < len(text) and text[end] not in ",}]":
+        end += 1
+    return _scalar(text[pos:end].strip()), end
+
+
+def _flow_depth(text: str) -> int:
+    depth = 0
+    quote = None
+    for ch in text:
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "'\"":
+            quote = ch
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+    return depth
+
+
+def _quote_closed(text: str) -> bool:
+    quote = text[0]
+    body = text[1:]
+    if quote == "'":
+        return body.replace("''", "").endswith("'")
+    return body.endswith('"') and not body.endswith('\\"')
+
+
+def _scalar(text: str) -> Any:
+    """Convert a scalar token to str/int/float."""
+    if len(text) >= 2 and text[0] == text[-1] == "'":
+        return text[1:-1].replace("''", "'")
+    if len(text) >= 2 and text[0] == text[-1] == '"':
+        try:
+            return text[1:-1].encode("latin-1", "backslashreplace").decode("unicode_escape")
+        except UnicodeDecodeError:
+            return text[1:-1]
+    if _INT.match(text):
+        return int(text)
+    if _FLOAT.match(text):
+        return float(text)
+    return text
+
+
+# =============================================================================
+# OBJECT INDEX
+# =============================================================================
+
+class UnityAssetIndex:
+    """Index of every object in the Unity YAML files under a directory.
+
+    Files are rescanned only when their mtime or size changes; records are
+    persisted in the DiskCache so a restarted server starts warm.
+    """
+
+    def __init__(self, project_root: Path, assets_dir: str = "src/Assets", cache: DiskCache = None):
+        self.project_root = project_root
+        self.assets_dir = assets_dir
+        self.cache = cache
+        self._files: dict[str, tuple[int, int, list[UnityObject]]] = {}
+        self._loaded = False
+
+    def reset(self) -> None:
+        """Forget everything in memory; the next refresh reloads from the cache."""
+        self._files = {}
+        self._loaded = False
+
+    def refresh(self) -> dict:
+        """Rescan changed files and drop deleted ones."""
+        if not self._loaded:
+            self._load()
+
+        seen = set()
+        changed = []
+        base = self.project_root / self.assets_dir
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            for filename in filenames:
+                if os.path.splitext(filename)[1] not in UNITY_YAML_SUFFIXES:
+                    continue
+                path = Path(dirpath) / filename
+                rel = path.relative_to(self.project_root).as_posix()
+                seen.add(rel)
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                cached = self._files.get(rel)
+                if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    continue
+                objects = list(scan_objects(path, rel)) if is_unity_yaml(path) else []
+                self._files[rel] = (stat.st_mtime_ns, stat.st_size, objects)
+                changed.append(rel)
+
+        removed = set(self._files) - seen
+        for gone in removed:
+            del self._files[gone]
+
+        if self.cache is not None:
+            self.cache.put_many("unity-objects", ((rel, *self._files[rel]) for rel in changed), INDEX_VERSION)
+            self.cache.delete("unity-objects", removed)
+        return {"files": len(self._files), "rescanned": len(changed)}
+
+    def _load(self) -> None:
+        """Warm the per-file records from the persistent cache."""
+        self._loaded = True
+        if self.cache is None:
+            return
+        for rel, (mtime_ns, size, rows) in self.cache.load("unity-objects", INDEX_VERSION).items():
+            self._files[rel] = (mtime_ns, size, [UnityObject(*row) for row in rows])
+
+    def objects(self) -> Iterator[UnityObject]:
+        for _, _, objects in self._files.values():
+            yield from objects
+
+    def find(self, class_name: str = None, script: str = None, name: str = None,
+             file: str = None) -> list[UnityObject]:
+        """Find objects by class (name or ID), script (class or GUID), name and file glob."""
+        class_name = class_name.lower() if class_name else None
+        script = script.lower() if script else None
+        name = name.lower() if name else None
+
+        matches = []
+        for obj in self.objects():
+            if class_name and class_name not in (obj.type.lower(), str(obj.class_id)):
+                continue
+            if script and script not in (obj.script_guid, obj.script_class.lower()):
+                continue
+            if name and name not in obj.name.lower():
+                continue
+            if file and not fnmatch(obj.file, file) and not fnmatch(Path(obj.file).name, file):
+                continue
+            matches.append(obj)
+        return matches
+
+    def get(self, file: str, file_id: int) -> Optional[UnityObject]:
+        cached = self._files.get(file)
+        if cached is None:
+            return None
+        return next((obj for obj in cached[2] if obj.file_id == file_id), None)
+
+    def load(self, record: UnityObject) -> dict:
+        return load_object(self.project_root, record)
+
+    def summary(self) -> dict:
+        """Object counts per class and per file."""
+        by_class: dict[str, int] = {}
+        for obj in self.objects():
+            by_class[obj.type] = by_class.get(obj.type, 0) + 1
+        return {
+            "files": {rel: len(entry[2]) for rel, entry in sorted(self._files.items())},
+            "classes": dict(sorted(by_class.items(), key=lambda kv: -kv[1]))
+        }
+
+
+def select_fields(data: Any, fields: list[str]) -> dict:
+    """Pick dotted field paths (e.g. 'phases', 'primaryColor.r') from parsed data."""
+    selected = {}
+    for field in fields:
+        value = data
+        for part in field.split("."):
+            if isinstance(value, dict):
+                value = value.get(part)
+            elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+                value = value[int(part)]
+            else:
+                value = None
+                break
+        selected[field] = value
+    return selected
@@ -1,4 +1,586 @@
 #!/usr/bin/env python3
+"""
+Asset Optimizer
+Texture processing (trim, premultiply, palette, mipmaps, platform sizes) and
+sprite atlas packing (MaxRects) for the asset-optimization skill.
+"""
+
+import argparse
+import hashlib
+import io
 import json
-def optimize(): return {"types": ["textures", "meshes", "audio"], "techniques": ["compression", "streaming"]}
-if __name__ == "__main__": print(json.dumps(optimize(), indent=2))
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import numpy as np
+from PIL import Image
+
+from asset_output import write_if_changed
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# Source image types picked up from sprite folders
+IMAGE_SUFFIXES = {".png", ".tga", ".bmp", ".gif"}
+
+# Largest atlas page; sprites that do not fit spill onto further pages
+MAX_ATLAS_SIZE = 2048
+
+# Transparent pixels between packed sprites, and edge pixels extruded around each one
+DEFAULT_PADDING = 2
+DEFAULT_BLEED = 1
+
+DEFAULT_SPRITE_DIRS = ["src/Assets/Sprites"]
+DEFAULT_ATLAS_DIR = "src/Assets/Art/Atlases"
+DEFAULT_OUTPUT_DIR = "builds/optimized"
+
+# Largest texture side and palette size per target platform (see SKILL.md size guidelines)
+PLATFORM_SETTINGS = {
+    "pc": {"max_size": 4096, "colors": None},
+    "console": {"max_size": 2048, "colors": None},
+    "mobile": {"max_size": 1024, "colors": 256},
+    "web": {"max_size": 512, "colors": 256},
+}
+
+# Bump when processing changes so cached results are redone
+PIPELINE_VERSION = 2
+
+# Below this many stale files the process pool costs more than it saves
+POOL_MIN_FILES = 4
+
+# Per-file results kept next to the outputs, keyed by source path
+CACHE_FILE = ".optimizer_cache.json"
+
+
+# =============================================================================
+# TEXTURE PIPELINE
+# =============================================================================
+
+def trim_transparent(rgba: np.ndarray) -> tuple[np.ndarray, tuple[int, int]]:
+    """Crop fully transparent borders; returns the crop and its top-left offset."""
+    visible = rgba[..., 3] > 0
+    if not visible.any():
+        return rgba[:1, :1], (0, 0)
+    rows = np.flatnonzero(visible.any(axis=1))
+    cols = np.flatnonzero(visible.any(axis=0))
+    return rgba[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1], (int(cols[0]), int(rows[0]))
+
+
+def premultiply(rgba: np.ndarray) -> np.ndarray:
+    """uint8 straight alpha -> float32 premultiplied in [0, 1]."""
+    pixels = rgba.astype(np.float32) / 255.0
+    pixels[..., :3] *= pixels[..., 3:4]
+    return pixels
+
+
+def unpremultiply(pixels: np.ndarray) -> np.ndarray:
+    """float32 premultiplied -> float32 straight alpha."""
+    straight = pixels.copy()
+    alpha = pixels[..., 3:4]
+    np.divide(pixels[..., :3], alpha, out=straight[..., :3], where=alpha > 0)
+    return straight
+
+
+def halve(pixels: np.ndarray) -> np.ndarray:
+    """2x2 box filter of premultiplied pixels (odd edges are replicated)."""
+    h, w = pixels.shape[:2]
+    if h == 1 and w == 1:
+        return pixels
+    pad_h, pad_w = (h > 1) * (h % 2), (w > 1) * (w % 2)
+    if pad_h or pad_w:
+        pixels = np.pad(pixels, ((0, pad_h), (0, pad_w), (0, 0)), mode="edge")
+        h, w = pixels.shape[:2]
+    fy, fx = (2 if h > 1 else 1), (2 if w > 1 else 1)
+    return pixels.reshape(h // fy, fy, w // fx, fx, 4).mean(axis=(1, 3))
+
+
+def mip_chain(pixels: np.ndarray) -> list[np.ndarray]:
+    """Every mip level below the given one, down to 1x1."""
+    levels = []
+    while pixels.shape[0] > 1 or pixels.shape[1] > 1:
+        pixels = halve(pixels)
+        levels.append(pixels)
+    return levels
+
+
+def to_uint8(pixels: np.ndarray) -> np.ndarray:
+    return np.clip(np.rint(pixels * 255.0), 0, 255).astype(np.uint8)
+
+
+def quantize(rgba: np.ndarray, colors: int) -> tuple[np.ndarray, np.ndarray]:
+    """Palette-index an RGBA image: exact when it has few colors, weighted median cut otherwise.
+
+    Median cut runs on a 5-5-5-4 bit histogram of the image, so its cost depends
+    on the number of distinct colours rather than pixels. Returns
+    (indices HxW uint8, palette Nx4 uint8).
+    """
+    flat = rgba.reshape(-1, 4).copy()
+    flat[flat[:, 3] == 0] = 0          # every transparent pixel shares one entry
+    packed = flat.view(np.uint32).ravel()
+    unique, inverse = np.unique(packed, return_inverse=True)
+    if len(unique) <= colors:
+        return inverse.reshape(rgba.shape[:2]).astype(np.uint8), unique.view(np.uint8).reshape(-1, 4)
+
+    reduced = flat >> np.array([3, 3, 3, 4], np.uint8)
+    keys = (reduced.astype(np.uint32) * np.array([1 << 15, 1 << 10, 1 << 5, 1], np.uint32)).sum(axis=1)
+    cells, cell_of_pixel, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    values = np.stack([(cells >> 15) & 31, (cells >> 10) & 31, (cells >> 5) & 31, (cells & 15) * 2], axis=1).astype(np.float32)
+
+    def stats(box: np.ndarray) -> tuple[np.ndarray, float]:
+        span = np.ptp(values[box], axis=0) if len(box) > 1 else np.zeros(4, np.float32)
+        return span, float(span.max() * counts[box].sum())
+
+    boxes = [np.arange(len(cells))]
+    box_stats = [stats(boxes[0])]
+    while len(boxes) < colors:
+        # Split the box with the widest channel range, weighted by how many pixels it covers
+        target = max(range(len(boxes)), key=lambda i: box_stats[i][1])
+        span, score = box_stats[target]
+        if score == 0:
+            break
+        box = boxes.pop(target)
+        box_stats.pop(target)
+        channel = int(np.argmax(span))
+        order = box[np.argsort(values[box, channel], kind="stable")]
+        cumulative = np.cumsum(counts[order])
+        cut = min(max(int(np.searchsorted(cumulative, cumulative[-1] / 2)), 1), len(order) - 1)
+        for half in (order[:cut], order[cut:]):
+            boxes.append(half)
+            box_stats.append(stats(half))
+
+    box_of_cell = np.empty(len(cells), np.int64)
+    for index, box in enumerate(boxes):
+        box_of_cell[box] = index
+    indices = box_of_cell[cell_of_pixel]
+
+    # Palette entries are the mean of the original pixels in each box
+    weights = np.bincount(indices, minlength=len(boxes)).astype(np.float64)
+    palette = np.stack([np.bincount(indices, flat[:, c], minlength=len(boxes)) for c in range(4)], axis=1)
+    palette = np.rint(palette / np.maximum(weights, 1)[:, None]).astype(np.uint8)
+    return indices.reshape(rgba.shape[:2]).astype(np.uint8), palette
+
+
+def encode_png(rgba: np.ndarray, colors: Optional[int]) -> tuple[bytes, int]:
+    """PNG bytes (palette PNG when colors is set) and the number of colors used."""
+    buffer = io.BytesIO()
+    if colors:
+        indices, palette = quantize(rgba, min(colors, 256))
+        image = Image.fromarray(indices, "P")
+        image.putpalette(palette.tobytes(), rawmode="RGBA")
+        image.save(buffer, "PNG", optimize=True)
+        return buffer.getvalue(), len(palette)
+    Image.fromarray(rgba, "RGBA").save(buffer, "PNG", optimize=True)
+    return buffer.getvalue(), 0
+
+
+def process_texture(source: str, output: str, settings: dict) -> dict:
+    """Run one texture through the pipeline and write it (and its mips) to output."""
+    started = time.perf_counter()
+    with Image.open(source) as image:
+        rgba = np.asarray(image.convert("RGBA"))
+    source_size = (rgba.shape[1], rgba.shape[0])
+
+    offset = (0, 0)
+    if settings["trim"]:
+        rgba, offset = trim_transparent(rgba)
+
+    # Resampling happens on premultiplied pixels so transparent texels never bleed colour
+    pixels = premultiply(rgba)
+    while max(pixels.shape[:2]) > settings["max_size"]:
+        pixels = halve(pixels)
+
+    levels = [pixels] + (mip_chain(pixels) if settings["mipmaps"] else [])
+    written, level_bytes, palette_colors = {}, [], 0
+    for level, level_pixels in enumerate(levels):
+        stored = level_pixels if settings["premultiply"] else unpremultiply(level_pixels)
+        data, used = encode_png(to_uint8(stored), settings["colors"])
+        path = Path(output) if level == 0 else Path(output).with_name(f"{Path(output).stem}_mip{level}.png")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        written[path.name] = write_if_changed(path, data)
+        level_bytes.append(len(data))
+        palette_colors = palette_colors or used
+
+    height, width = pixels.shape[:2]
+    return {
+        "output": output,
+        "files": written,
+        "source_size": f"{source_size[0]}x{source_size[1]}",
+        "size": f"{width}x{height}",
+        "offset": list(offset),
+        "colors": palette_colors or None,
+        "source_bytes": os.path.getsize(source),
+        "output_bytes": level_bytes[0],
+        "mip_bytes": sum(level_bytes[1:]),
+        # Uncompressed RGBA32 footprint once uploaded, including mips
+        "gpu_bytes": int(sum(level.shape[0] * level.shape[1] * 4 for level in levels)),
+        "seconds": round(time.perf_counter() - started, 4),
+    }
+
+
+def optimize(asset_type: str = "textures", platform: str = "pc", source_dirs: list[str] = None,
+             output_dir: str = DEFAULT_OUTPUT_DIR, colors: int = None, premultiply_alpha: bool = False,
+             mipmaps: bool = False, trim: bool = True, max_size: int = None, workers: int = None,
+             root: Path = PROJECT_ROOT) -> dict:
+    """Process every texture below source_dirs for a platform into output_dir/<platform>/.
+
+    Unchanged sources (same mtime, size and settings) reuse their cached
+    result; the rest are processed on a process pool.
+    """
+    started = time.perf_counter()
+    if asset_type not in ("textures", "all"):
+        return {"success": False, "error": f"Only textures are processed here (asset_type={asset_type})"}
+    if platform not in PLATFORM_SETTINGS:
+        return {"success": False, "error": f"Unknown platform '{platform}'. Options: {', '.join(PLATFORM_SETTINGS)}"}
+
+    settings = {
+        "max_size": max_size or PLATFORM_SETTINGS[platform]["max_size"],
+        "colors": colors if colors is not None else PLATFORM_SETTINGS[platform]["colors"],
+        "premultiply": premultiply_alpha,
+        "mipmaps": mipmaps,
+        "trim": trim,
+        "version": PIPELINE_VERSION,
+    }
+    settings_key = hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:16]
+
+    dirs = [root / d for d in (source_dirs or DEFAULT_SPRITE_DIRS)]
+    missing = [str(d) for d in dirs if not d.is_dir()]
+    if missing:
+        return {"success": False, "error": f"Source folder not found: {', '.join(missing)}"}
+
+    out = root / output_dir / platform
+    out.mkdir(parents=True, exist_ok=True)
+    cache_path = out / CACHE_FILE
+    try:
+        cache = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        cache = {}
+
+    results, stale = {}, []
+    for base in dirs:
+        for path in sorted(p for p in base.rglob("*") if p.suffix.lower() in IMAGE_SUFFIXES):
+            rel = path.relative_to(root).as_posix() if path.is_relative_to(root) else str(path)
+            target = out / base.name / path.relative_to(base).with_suffix(".png")
+            stat = path.stat()
+            stamp = [stat.st_mtime_ns, stat.st_size, settings_key]
+            entry = cache.get(rel)
+            if entry and entry["stamp"] == stamp and Path(entry["result"]["output"]).exists():
+                results[rel] = dict(entry["result"], cached=True)
+            else:
+                stale.append((rel, str(path), str(target), stamp))
+
+    if len(stale) >= POOL_MIN_FILES and (workers is None or workers > 1):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            processed = list(pool.map(process_texture, [s[1] for s in stale], [s[2] for s in stale],
+                                      [settings] * len(stale)))
+    else:
+        processed = [process_texture(source, target, settings) for _, source, target, _ in stale]
+
+    for (rel, _, _, stamp), result in zip(stale, processed):
+        cache[rel] = {"stamp": stamp, "result": result}
+        results[rel] = dict(result, cached=False)
+    cache = {rel: entry for rel, entry in cache.items() if rel in results}
+    cache_path.write_text(json.dumps(cache))
+
+    source_bytes = sum(r["source_bytes"] for r in results.values())
+    output_bytes = sum(r["output_bytes"] for r in results.values())
+    mip_bytes = sum(r["mip_bytes"] for r in results.values())
+    return {
+        "success": True,
+        "platform": platform,
+        "settings": {k: v for k, v in settings.items() if k != "version"},
+        "files": len(results),
+        "processed": len(stale),
+        "cached": len(results) - len(stale),
+        "asset_size_mb": round((output_bytes + mip_bytes) / 1048576, 4),
+        "mip_size_mb": round(mip_bytes / 1048576, 4),
+        "source_size_mb": round(source_bytes / 1048576, 4),
+        # Level 0 only, so enabling mipmaps does not read as worse compression
+        "compression_ratio": round(source_bytes / output_bytes, 3) if output_bytes else None,
+        "gpu_memory_mb": round(sum(r["gpu_bytes"] for r in results.values()) / 1048576, 4),
+        "import_time": round(time.perf_counter() - started, 3),
+        "output_dir": out.relative_to(root).as_posix() if out.is_relative_to(root) else str(out),
+        "textures": {rel: {k: r[k] for k in ("size", "source_size", "colors", "output_bytes", "cached")}
+                     for rel, r in sorted(results.items())},
+    }
+
+
+# =============================================================================
+# MAXRECTS PACKER
+# =============================================================================
+
+class Rect(NamedTuple):
+    x: int
+    y: int
+    w: int
+    h: int
+
+
+class MaxRectsBin:
+    """MaxRects bin packer using the best-short-side-fit heuristic (no rotation)."""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.free: list[Rect] = [Rect(0, 0, width, height)]
+
+    def insert(self, w: int, h: int) -> Optional[Rect]:
+        """Place a w x h rect, or None if it does not fit."""
+        best, best_short, best_long = None, None, None
+        for free in self.free:
+            if free.w >= w and free.h >= h:
+                short = min(free.w - w, free.h - h)
+                long = max(free.w - w, free.h - h)
+                if best is None or (short, long) < (best_short, best_long):
+                    best, best_short, best_long = Rect(free.x, free.y, w, h), short, long
+        if best is not None:
+            self._split(best)
+        return best
+
+    def _split(self, used: Rect) -> None:
+        """Carve the used rect out of every free rect it overlaps, then prune."""
+        kept, added = [], []
+        for free in self.free:
+            if (used.x >= free.x + free.w or used.x + used.w <= free.x or
+                    used.y >= free.y + free.h or used.y + used.h <= free.y):
+                kept.append(free)
+                continue
+            if used.x > free.x:
+                added.append(Rect(free.x, free.y, used.x - free.x, free.h))
+            if used.x + used.w < free.x + free.w:
+                added.append(Rect(used.x + used.w, free.y, free.x + free.w - used.x - used.w, free.h))
+            if used.y > free.y:
+                added.append(Rect(free.x, free.y, free.w, used.y - free.y))
+            if used.y + used.h < free.y + free.h:
+                added.append(Rect(free.x, used.y + used.h, free.w, free.y + free.h - used.y - used.h))
+
+        # Only the new rects can be contained in others (or contain old ones)
+        fresh = []
+        for i, rect in enumerate(added):
+            if any(_contains(other, rect) for j, other in enumerate(added) if j != i and (other != rect or j < i)):
+                continue
+            if any(_contains(other, rect) for other in kept):
+                continue
+            fresh.append(rect)
+        kept = [other for other in kept if not any(_contains(rect, other) for rect in fresh)]
+        self.free = kept + fresh
+
+
+def _contains(outer: Rect, inner: Rect) -> bool:
+    return (inner.x >= outer.x and inner.y >= outer.y and
+            inner.x + inner.w <= outer.x + outer.w and inner.y + inner.h <= outer.y + outer.h)
+
+
+def _next_pot(value: int) -> int:
+    return 1 << max(value - 1, 0).bit_length()
+
+
+def pack_sizes(sizes: list[tuple[int, int]], max_size: int = MAX_ATLAS_SIZE) -> list[tuple[int, int, dict[int, Rect]]]:
+    """Pack (w, h) boxes into as few power-of-two pages as possible.
+
+    Returns (width, height, {box index: rect}) per page. Each page starts at
+    the smallest power-of-two size that could hold the remaining area and
+    doubles its shorter side until everything fits or max_size is reached,
+    so max_size must itself be a power of two.
+    """
+    if max_size <= 0 or max_size & (max_size - 1):
+        raise ValueError(f"max_size must be a power of two, got {max_size}")
+    for w, h in sizes:
+        if w > max_size or h > max_size:
+            raise ValueError(f"A {w}x{h} sprite does not fit in a {max_size}x{max_size} atlas")
+
+    # Big, then tall boxes first: MaxRects packs tightest in that order
+    pending = sorted(range(len(sizes)), key=lambda i: (max(sizes[i]), sizes[i][1], sizes[i][0]), reverse=True)
+    pages = []
+    while pending:
+        area = sum(sizes[i][0] * sizes[i][1] for i in pending)
+        width = _next_pot(max(max(sizes[i][0] for i in pending), int(area ** 0.5)))
+        height = _next_pot(max(max(sizes[i][1] for i in pending), -(-area // width)))
+        width, height = min(width, max_size), min(height, max_size)
+
+        while True:
+            packer = MaxRectsBin(width, height)
+            placed, left = {}, []
+            for i in pending:
+                rect = packer.insert(*sizes[i])
+                if rect is None:
+                    left.append(i)
+                else:
+                    placed[i] = rect
+            if not left or (width >= max_size and height >= max_size):
+                break
+            if width <= height and width < max_size:
+                width = min(width * 2, max_size)
+            else:
+                height = min(height * 2, max_size)
+
+        pages.append((width, height, placed))
+        pending = left
+    return pages
+
+
+# =============================================================================
+# ATLAS BUILDING
+# =============================================================================
+
+class Sprite(NamedTuple):
+    """A source image cropped to its visible pixels."""
+    name: str
+    image: Image.Image
+    source_size: tuple[int, int]
+    offset: tuple[int, int]       # top-left of the trimmed image inside the source
+
+
+def load_sprites(dirs: list[Path], trim: bool = True) -> list[Sprite]:
+    """Read every image below the given folders, named by their path relative to the folder."""
+    sprites = []
+    for base in dirs:
+        for path in sorted(p for p in base.rglob("*") if p.suffix.lower() in IMAGE_SUFFIXES):
+            with Image.open(path) as source:
+                image = source.convert("RGBA")
+            name = path.relative_to(base).with_suffix("").as_posix()
+            box = image.getchannel("A").getbbox() if trim else None
+            if trim and box is None:
+                box = (0, 0, 1, 1)  # fully transparent: keep a single pixel
+            if box and box != (0, 0) + image.size:
+                sprites.append(Sprite(name, image.crop(box), image.size, box[:2]))
+            else:
+                sprites.append(Sprite(name, image, image.size, (0, 0)))
+    return sprites
+
+
+def _paste_with_bleed(atlas: Image.Image, image: Image.Image, x: int, y: int, bleed: int) -> None:
+    """Paste image at (x, y) and extrude its edge pixels `bleed` pixels outward."""
+    w, h = image.size
+    atlas.paste(image, (x, y))
+    if bleed <= 0:
+        return
+    atlas.paste(image.crop((0, 0, w, 1)).resize((w, bleed)), (x, y - bleed))
+    atlas.paste(image.crop((0, h - 1, w, h)).resize((w, bleed)), (x, y + h))
+    atlas.paste(image.crop((0, 0, 1, h)).resize((bleed, h)), (x - bleed, y))
+    atlas.paste(image.crop((w - 1, 0, w, h)).resize((bleed, h)), (x + w, y))
+    for cx, cy, px, py in ((0, 0, x - bleed, y - bleed), (w - 1, 0, x + w, y - bleed),
+                           (0, h - 1, x - bleed, y + h), (w - 1, h - 1, x + w, y + h)):
+        atlas.paste(image.getpixel((cx, cy)), (px, py, px + bleed, py + bleed))
+
+
+def build_atlas(sprites: list[Sprite], padding: int = DEFAULT_PADDING, bleed: int = DEFAULT_BLEED,
+                max_size: int = MAX_ATLAS_SIZE) -> list[tuple[Image.Image, dict]]:
+    """Pack sprites into atlas pages; returns (image, {sprite name: frame data}) per page."""
+    sizes = [(s.image.width + 2 * bleed + padding, s.image.height + 2 * bleed + padding) for s in sprites]
+    pages = []
+    for width, height, placed in pack_sizes(sizes, max_size):
+        atlas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        frames = {}
+        for index, rect in sorted(placed.items()):
+            sprite = sprites[index]
+            # Each box is [padding/2][bleed][sprite][bleed][rest of padding]
+            x, y = rect.x + padding // 2 + bleed, rect.y + padding // 2 + bleed
+            _paste_with_bleed(atlas, sprite.image, x, y, bleed)
+            frames[sprite.name] = _frame(sprite, x, y, height)
+        pages.append((atlas, frames))
+    return pages
+
+
+def _frame(sprite: Sprite, x: int, y: int, atlas_height: int) -> dict:
+    """Frame entry with top-left coordinates plus Unity SpriteMetaData fields (bottom-left origin)."""
+    w, h = sprite.image.size
+    source_w, source_h = sprite.source_size
+    left, top = sprite.offset
+    bottom = source_h - top - h
+    return {
+        "frame": {"x": x, "y": y, "w": w, "h": h},
+        "trimmed": (w, h) != sprite.source_size,
+        "source_size": {"w": source_w, "h": source_h},
+        "offset": {"x": left, "y": top},
+        "unity": {
+            "name": sprite.name.replace("/", "_"),
+            "rect": {"x": x, "y": atlas_height - y - h, "width": w, "height": h},
+            # Keeps the pivot at the centre of the untrimmed source image
+            "pivot": {"x": round((source_w / 2 - left) / w, 6), "y": round((source_h / 2 - bottom) / h, 6)},
+            "alignment": 9,
+            "border": {"x": 0, "y": 0, "z": 0, "w": 0},
+        },
+    }
+
+
+def pack_atlas(sprite_dirs: list[str] = None, output_dir: str = DEFAULT_ATLAS_DIR, name: str = "sprites",
+               padding: int = DEFAULT_PADDING, bleed: int = DEFAULT_BLEED, max_size: int = MAX_ATLAS_SIZE,
+               trim: bool = True, root: Path = PROJECT_ROOT) -> dict:
+    """Pack every sprite in the given folders into <name>_<page>.png plus a <name>.json manifest."""
+    dirs = [root / d for d in (sprite_dirs or DEFAULT_SPRITE_DIRS)]
+    missing = [str(d) for d in dirs if not d.is_dir()]
+    if missing:
+        return {"success": False, "error": f"Sprite folder not found: {', '.join(missing)}"}
+
+    sprites = load_sprites(dirs, trim)
+    if not sprites:
+        return {"success": False, "error": "No sprites found"}
+
+    out = root / output_dir
+    out.mkdir(parents=True, exist_ok=True)
+    manifest = {"padding": padding, "bleed": bleed, "pages": []}
+    written = {}
+    for page, (atlas, frames) in enumerate(build_atlas(sprites, padding, bleed, max_size)):
+        image_name = f"{name}_{page}.png"
+        buffer = io.BytesIO()
+        atlas.save(buffer, "PNG")
+        written[image_name] = write_if_changed(out / image_name, buffer.getvalue())
+        manifest["pages"].append({"image": image_name, "size": {"w": atlas.width, "h": atlas.height}, "frames": frames})
+
+    manifest_name = f"{name}.json"
+    written[manifest_name] = write_if_changed(out / manifest_name, json.dumps(manifest, indent=2).encode())
+
+    source_area = sum(s.source_size[0] * s.source_size[1] for s in sprites)
+    atlas_area = sum(p["size"]["w"] * p["size"]["h"] for p in manifest["pages"])
+    return {
+        "success": True,
+        "sprites": len(sprites),
+        "pages": [{"image": p["image"], "size": f"{p['size']['w']}x{p['size']['h']}", "frames": len(p["frames"])}
+                  for p in manifest["pages"]],
+        "fill_ratio": round(sum(s.image.width * s.image.height for s in sprites) / atlas_area, 3),
+        "source_pixels": source_area,
+        "atlas_pixels": atlas_area,
+        "output_dir": out.relative_to(root).as_posix() if out.is_relative_to(root) else str(out),
+        "files": written,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command")
+
+    atlas = commands.add_parser("atlas", help="Pack sprite folders into power-of-two atlases")
+    atlas.add_argument("dirs", nargs="*", help=f"Sprite folders relative to the project root (default {DEFAULT_SPRITE_DIRS[0]})")
+    atlas.add_argument("--out", default=DEFAULT_ATLAS_DIR)
+    atlas.add_argument("--name", default="sprites")
+    atlas.add_argument("--padding", type=int, default=DEFAULT_PADDING)
+    atlas.add_argument("--bleed", type=int, default=DEFAULT_BLEED)
+    atlas.add_argument("--max-size", type=int, default=MAX_ATLAS_SIZE)
+    atlas.add_argument("--no-trim", action="store_true")
+
+    textures = commands.add_parser("optimize", help="Process textures for a target platform")
+    textures.add_argument("dirs", nargs="*", help=f"Texture folders relative to the project root (default {DEFAULT_SPRITE_DIRS[0]})")
+    textures.add_argument("--platform", choices=sorted(PLATFORM_SETTINGS), default="pc")
+    textures.add_argument("--out", default=DEFAULT_OUTPUT_DIR)
+    textures.add_argument("--colors", type=int, help="Palette size (0 keeps full colour; default per platform)")
+    textures.add_argument("--max-size", type=int)
+    textures.add_argument("--premultiply", action="store_true", help="Store premultiplied alpha")
+    textures.add_argument("--mipmaps", action="store_true", help="Also write _mip<N>.png levels")
+    textures.add_argument("--no-trim", action="store_true")
+    textures.add_argument("--workers", type=int)
+
+    args = parser.parse_args()
+    if args.command == "atlas":
+        result = pack_atlas(args.dirs or None, args.out, args.name, args.padding, args.bleed, args.max_size, not args.no_trim)
+    elif args.command == "optimize":
+        result = optimize("textures", args.platform, args.dirs or None, args.out, args.colors, args.premultiply,
+                          args.mipmaps, not args.no_trim, args.max_size, args.workers)
+    else:
+        result = optimize()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""
+Asset Output
+File writes shared by the asset-optimization scripts. Output is rewritten
+only when its bytes change, so mtimes (and engine reimports) move only on
+real changes.
+"""
+
+from pathlib import Path
+
+
+def write_if_changed(path: Path, data: bytes) -> str:
+    """Write data unless the file already holds it; returns 'created', 'modified' or 'unchanged'."""
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        path.write_bytes(data)
+        return "created"
+    if size == len(data) and path.read_bytes() == data:
+        return "unchanged"
+    path.write_bytes(data)
+    return "modified"
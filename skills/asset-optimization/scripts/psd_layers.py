@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+PSD Layers
+Memory-mapped Photoshop (.psd/.psb) reader that indexes layer records
+without decoding pixels, decodes only the requested layers, and exports
+them as trimmed PNGs, redoing only layers whose pixel data changed.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import mmap
+import re
+import struct
+import zlib
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import numpy as np
+from PIL import Image
+
+from asset_output import write_if_changed
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+DEFAULT_PSD_DIR = "assets"
+DEFAULT_OUTPUT_ROOT = "src/Assets/Art/Sprites"
+
+# Layer -> pixel data hash of the last export, kept next to the PNGs
+EXPORT_MANIFEST = ".psd_layers.json"
+
+# Bump when decoding or export output changes so every layer is redone
+EXPORT_VERSION = 1
+
+# Colour modes that map onto RGBA PNGs
+_MODES = {1: "grayscale", 3: "rgb"}
+
+# Additional layer info keys whose length field is 8 bytes in .psb files
+_LONG_KEYS = {b"LMsk", b"Lr16", b"Lr32", b"Layr", b"Mt16", b"Mt32", b"Mtrn", b"Alph", b"FMsk", b"lnk2", b"FEid", b"FXid", b"PxSD"}
+
+
+class Channel(NamedTuple):
+    id: int            # 0/1/2 colour, -1 transparency, -2/-3 masks
+    offset: int        # file offset of the compression tag
+    length: int        # bytes including the tag
+
+
+class Layer(NamedTuple):
+    """One layer record; pixel data is only located, not read."""
+    index: int
+    name: str
+    path: str          # group/.../name
+    top: int
+    left: int
+    bottom: int
+    right: int
+    channels: tuple[Channel, ...]
+    opacity: int
+    visible: bool
+    is_group: bool
+
+    @property
+    def width(self) -> int:
+        return self.right - self.left
+
+    @property
+    def height(self) -> int:
+        return self.bottom - self.top
+
+
+class PsdFile:
+    """A .psd/.psb file opened through mmap; layers are parsed on first access."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        signature, self.version, self.channels, self.height, self.width, self.depth, self.mode = \
+            struct.unpack_from(">4sH6xHIIHH", self._map, 0)
+        if signature != b"8BPS" or self.version not in (1, 2):
+            raise ValueError(f"{path.name} is not a Photoshop file")
+        if self.depth != 8 or self.mode not in _MODES:
+            raise ValueError(f"{path.name}: only 8-bit RGB/grayscale documents are supported "
+                             f"(depth {self.depth}, mode {self.mode})")
+        self._layers: Optional[list[Layer]] = None
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Layer records
+    # -------------------------------------------------------------------------
+
+    @property
+    def layers(self) -> list[Layer]:
+        if self._layers is None:
+            self._layers = self._parse_layers()
+        return self._layers
+
+    def _parse_layers(self) -> list[Layer]:
+        """Walk the layer and mask section, recording where each channel's data lives."""
+        m, big = self._map, self.version == 2
+        offset = 26
+        offset += 4 + struct.unpack_from(">I", m, offset)[0]     # colour mode data
+        offset += 4 + struct.unpack_from(">I", m, offset)[0]     # image resources
+        section_length, offset = self._length(offset, big)
+        if section_length == 0:
+            return []
+        info_length, offset = self._length(offset, big)
+        if info_length == 0:
+            return []
+        count = abs(struct.unpack_from(">h", m, offset)[0])
+        offset += 2
+
+        records = []
+        for _ in range(count):
+            top, left, bottom, right, channel_count = struct.unpack_from(">iiiiH", m, offset)
+            offset += 18
+            channels = []
+            for _ in range(channel_count):
+                channel_id = struct.unpack_from(">h", m, offset)[0]
+                length, offset = self._length(offset + 2, big)
+                channels.append((channel_id, length))
+            _, _, opacity, _, flags, _, extra_length = struct.unpack_from(">4s4sBBBBI", m, offset)
+            offset += 16
+            extra_end = offset + extra_length
+            name, divider = self._parse_extra(offset, extra_end, big)
+            offset = extra_end
+            records.append([name, (top, left, bottom, right), channels, opacity, not flags & 0x02, divider])
+
+        # Channel image data follows the records, in the same order
+        layers_raw = []
+        for name, rect, channels, opacity, visible, divider in records:
+            located = []
+            for channel_id, length in channels:
+                located.append(Channel(channel_id, offset, length))
+                offset += length
+            layers_raw.append((name, rect, tuple(located), opacity, visible, divider))
+
+        # Records run bottom to top; walk top-down so group folders open before their children
+        layers, groups = [], []
+        for index in range(len(layers_raw) - 1, -1, -1):
+            name, rect, located, opacity, visible, divider = layers_raw[index]
+            if divider in (1, 2):
+                groups.append(name)
+                layers.append(Layer(index, name, "/".join(groups), *rect, located, opacity, visible, True))
+            elif divider == 3:
+                if groups:
+                    groups.pop()
+            else:
+                path = "/".join(groups + [name])
+                layers.append(Layer(index, name, path, *rect, located, opacity, visible, False))
+        return layers
+
+    def _length(self, offset: int, big: bool) -> tuple[int, int]:
+        if big:
+            return struct.unpack_from(">Q", self._map, offset)[0], offset + 8
+        return struct.unpack_from(">I", self._map, offset)[0], offset + 4
+
+    def _parse_extra(self, offset: int, end: int, big: bool) -> tuple[str, int]:
+        """Layer name (Unicode 'luni' preferred) and section divider type from the extra data."""
+        m = self._map
+        offset += 4 + struct.unpack_from(">I", m, offset)[0]      # layer mask data
+        offset += 4 + struct.unpack_from(">I", m, offset)[0]      # blending ranges
+        name_length = m[offset]
+        name = m[offset + 1:offset + 1 + name_length].decode("latin-1")
+        offset += (1 + name_length + 3) & ~3
+        divider = 0
+        while offset + 12 <= end:
+            signature, key = struct.unpack_from(">4s4s", m, offset)
+            if signature not in (b"8BIM", b"8B64"):
+                break
+            length, data = self._length(offset + 8, big and key in _LONG_KEYS)
+            if key == b"luni":
+                chars = struct.unpack_from(">I", m, data)[0]
+                name = m[data + 4:data + 4 + chars * 2].decode("utf-16-be").rstrip("\0")
+            elif key in (b"lsct", b"lsdk"):
+                divider = struct.unpack_from(">I", m, data)[0]
+            offset = data + length
+        return name, divider
+
+    # -------------------------------------------------------------------------
+    # Pixel data
+    # -------------------------------------------------------------------------
+
+    def pixel_hash(self, layer: Layer) -> str:
+        """Hash of a layer's stored (compressed) channel data and bounds; no decoding."""
+        digest = hashlib.sha256(struct.pack(">iiii", layer.top, layer.left, layer.bottom, layer.right))
+        for channel in layer.channels:
+            if channel.id >= -1:
+                digest.update(struct.pack(">h", channel.id))
+                digest.update(self._map[channel.offset:channel.offset + channel.length])
+        return digest.hexdigest()
+
+    def read_layer(self, layer: Layer) -> Optional[Image.Image]:
+        """Decode one layer into an RGBA image (None for empty layers)."""
+        width, height = layer.width, layer.height
+        if width <= 0 or height <= 0:
+            return None
+        planes = {}
+        for channel in layer.channels:
+            if channel.id in (0, 1, 2, -1):
+                planes[channel.id] = Image.frombytes("L", (width, height), self._decode(channel, width, height))
+        opaque = Image.new("L", (width, height), 255)
+        if self.mode == 1:
+            gray = planes.get(0, opaque)
+            bands = (gray, gray, gray)
+        else:
+            bands = tuple(planes.get(i, opaque) for i in (0, 1, 2))
+        return Image.merge("RGBA", bands + (planes.get(-1, opaque),))
+
+    def _decode(self, channel: Channel, width: int, height: int) -> bytes:
+        m = self._map
+        compression = struct.unpack_from(">H", m, channel.offset)[0]
+        start, end = channel.offset + 2, channel.offset + channel.length
+        if compression == 0:
+            return bytes(m[start:start + width * height])
+        if compression == 1:
+            return _decode_rle(m, start, width, height, self.version == 2)
+        if compression in (2, 3):
+            data = zlib.decompress(m[start:end])
+            if compression == 3:
+                data = _undo_prediction(data, width, height)
+            return data
+        raise ValueError(f"Unknown channel compression {compression}")
+
+
+def _decode_rle(m, offset: int, width: int, height: int, big: bool) -> bytes:
+    """PackBits rows preceded by a table of per-row byte counts.
+
+    Only the chain of run headers is walked in Python. Each payload byte then
+    gets a repeat count (1 inside literal runs, the run length for repeat
+    runs, 0 for headers) and the rows come out of a single np.repeat.
+    """
+    count_format = ">%d%s" % (height, "I" if big else "H")
+    row_lengths = struct.unpack_from(count_format, m, offset)
+    pos = offset + struct.calcsize(count_format)
+    packed = m[pos:pos + sum(row_lengths)]
+    size = len(packed)
+
+    heads = []
+    row_start = 0
+    for row_length in row_lengths:
+        p, end = row_start, row_start + row_length
+        while p < end:
+            header = packed[p]
+            heads.append(p)
+            p += header + 2 if header < 128 else 2 if header > 128 else 1
+        row_start = end
+
+    source = np.frombuffer(packed, dtype=np.uint8)
+    heads = np.array(heads, dtype=np.int64)
+    row_ends = np.cumsum(row_lengths, dtype=np.int64)
+    rows = np.searchsorted(row_ends, heads, side="right")
+    room = row_ends[rows] - heads - 1                        # payload bytes left in the row
+    header = source[heads].astype(np.int64)
+    literal = header < 128
+    run = np.where(literal, np.minimum(header + 1, room), np.where((header > 128) & (room > 0), 257 - header, 0))
+
+    # Clip runs that overflow their row's width; rows that come up short are zero-padded below
+    before = np.cumsum(run) - run
+    before = before - before[np.searchsorted(rows, rows)]    # bytes already written in the same row
+    take = np.clip(width - before, 0, run)
+    pad = width - np.bincount(rows, weights=take, minlength=height).astype(np.int64)
+
+    starts = heads[literal] + 1
+    counts = np.cumsum(np.bincount(starts, minlength=size + 1) -
+                       np.bincount(starts + take[literal], minlength=size + 1))
+    np.add.at(counts, heads[~literal] + 1, take[~literal])
+    out = np.repeat(source, counts[:size])
+    if pad.any():
+        out = np.insert(out, np.repeat(np.cumsum(width - pad), pad), 0)
+    return out.tobytes()
+
+
+def _undo_prediction(data: bytes, width: int, height: int) -> bytes:
+    """Reverse the per-row delta encoding of ZIP-with-prediction channels."""
+    deltas = np.frombuffer(data, dtype=np.uint8, count=width * height).reshape(height, width)
+    # uint8 accumulation wraps mod 256, matching the encoder's byte arithmetic
+    return np.cumsum(deltas, axis=1, dtype=np.uint8).tobytes()
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+def _safe_name(name: str) -> str:
+    cleaned = re.sub(r"[^\w\- ]+", "_", name).strip().replace(" ", "_")
+    return re.sub(r"_+", "_", cleaned).strip("_") or "layer"
+
+
+def list_layers(psd_path: str, root: Path = PROJECT_ROOT) -> dict:
+    """Layer tree of a PSD without decoding any pixels."""
+    with PsdFile(root / psd_path) as psd:
+        return {
+            "success": True,
+            "file": psd_path,
+            "size": f"{psd.width}x{psd.height}",
+            "mode": _MODES[psd.mode],
+            "layers": [
+                {"path": layer.path, "group": layer.is_group, "visible": layer.visible, "opacity": layer.opacity,
+                 "bounds": [layer.left, layer.top, layer.width, layer.height]}
+                for layer in psd.layers
+            ],
+        }
+
+
+def export_layers(psd_path: str, output_dir: str = None, layers: list[str] = None, include_hidden: bool = True,
+                  trim: bool = True, force: bool = False, root: Path = PROJECT_ROOT) -> dict:
+    """Export pixel layers as trimmed PNGs under output_dir (default src/Assets/Art/Sprites/<psd name>/).
+
+    `layers` selects by name or group path (a group selects its children).
+    Layers whose stored pixel data is unchanged since the last export are
+    skipped without being decoded.
+    """
+    source = root / psd_path
+    if not source.is_file():
+        return {"success": False, "error": f"PSD not found: {psd_path}"}
+    out = root / (output_dir or f"{DEFAULT_OUTPUT_ROOT}/{_safe_name(source.stem)}")
+
+    manifest_path = out / EXPORT_MANIFEST
+    try:
+        manifest = json.loads(manifest_path.read_text())
+        if manifest.get("version") != EXPORT_VERSION:
+            manifest = {}
+    except (OSError, ValueError):
+        manifest = {}
+    previous = manifest.get("layers", {})
+
+    exported, unchanged, skipped = {}, [], []
+    with PsdFile(source) as psd:
+        selected = [layer for layer in psd.layers if not layer.is_group]
+        if layers:
+            wanted = set(layers)
+            selected = [layer for layer in selected
+                        if layer.name in wanted or layer.path in wanted
+                        or any(layer.path.startswith(w.rstrip("/") + "/") for w in wanted)]
+        if not include_hidden:
+            selected = [layer for layer in selected if layer.visible]
+
+        for layer in selected:
+            rel = "/".join(_safe_name(part) for part in layer.path.split("/")) + ".png"
+            key = f"{layer.index}:{layer.path}"
+            digest = psd.pixel_hash(layer) + f":{int(trim)}"
+            entry = previous.get(key)
+            if not force and entry and entry["hash"] == digest and (out / entry["file"]).exists():
+                unchanged.append(entry["file"])
+                continue
+
+            image = psd.read_layer(layer)
+            box = image.getchannel("A").getbbox() if image is not None else None
+            if box is None:
+                skipped.append(layer.path)
+                continue
+            offset = (layer.left, layer.top)
+            if trim:
+                image = image.crop(box)
+                offset = (layer.left + box[0], layer.top + box[1])
+
+            target = out / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            buffer = io.BytesIO()
+            image.save(buffer, "PNG")
+            status = write_if_changed(target, buffer.getvalue())
+            previous[key] = {"hash": digest, "file": rel, "offset": list(offset), "size": list(image.size)}
+            if status == "unchanged":
+                unchanged.append(rel)
+                continue
+            exported[rel] = {"offset": list(offset), "size": f"{image.width}x{image.height}", "status": status}
+
+        # Forget layers that no longer exist in the document
+        live = {f"{layer.index}:{layer.path}" for layer in psd.layers}
+        previous = {key: entry for key, entry in previous.items() if key in live}
+        document = {"width": psd.width, "height": psd.height}
+
+    out.mkdir(parents=True, exist_ok=True)
+    write_if_changed(manifest_path, json.dumps({"version": EXPORT_VERSION, "source": psd_path, "document": document,
+                                                "layers": previous}, indent=2).encode())
+    return {
+        "success": True,
+        "output_dir": out.relative_to(root).as_posix() if out.is_relative_to(root) else str(out),
+        "exported": exported,
+        "unchanged": len(unchanged),
+        "empty_layers": skipped,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("psd", nargs="?", help=f"PSD path relative to the project root (default: every PSD in {DEFAULT_PSD_DIR}/)")
+    parser.add_argument("--list", action="store_true", help="Only list layers")
+    parser.add_argument("--layer", action="append", help="Export only this layer or group (repeatable)")
+    parser.add_argument("--out", help=f"Output folder (default {DEFAULT_OUTPUT_ROOT}/<psd name>)")
+    parser.add_argument("--visible-only", action="store_true")
+    parser.add_argument("--no-trim", action="store_true")
+    parser.add_argument("--force", action="store_true", help="Re-export unchanged layers")
+    args = parser.parse_args()
+
+    files = [args.psd] if args.psd else sorted(p.relative_to(PROJECT_ROOT).as_posix()
+                                               for p in (PROJECT_ROOT / DEFAULT_PSD_DIR).glob("*.ps[db]"))
+    results = []
+    for psd in files:
+        if args.list:
+            results.append(list_layers(psd))
+        else:
+            results.append(export_layers(psd, args.out, args.layer, not args.visible_only, not args.no_trim, args.force))
+    print(json.dumps(results[0] if len(results) == 1 else results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,636 @@
+#!/usr/bin/env python3
+"""
+Sprite Baker
+NumPy port of DetailedSpriteGenerator that renders the hero and boss
+animation frames offline into PNG sprite sheets plus a frame manifest,
+so RuntimeAssetLoader loads them instead of drawing them at startup.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import math
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+from PIL import Image
+
+from asset_output import write_if_changed
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# RuntimeAssetLoader loads baked sheets from Resources/Sprites/Baked before generating frames
+DEFAULT_BAKE_DIR = "src/Assets/Resources/Sprites/Baked"
+MANIFEST_NAME = "manifest.json"
+
+# Bump when drawing or sheet layout changes
+BAKE_VERSION = 2
+
+# Sprite.Create settings used by DetailedSpriteGenerator
+HERO_SIZE = 96
+BOSS_SIZE = 256
+PIXELS_PER_UNIT = 64
+PIVOT = (0.5, 0.5)
+
+# Largest sheet edge (the maxTextureSize written to SHEET_META)
+MAX_SHEET_SIZE = 2048
+
+# Cells are cropped to multiples of the 4x4 compression block, so no block spans two frames
+BLOCK_SIZE = 4
+
+# Importer settings for new sheets: point filtered, no mipmaps, no NPOT scaling, high quality
+# compression (BC7 on desktop, ASTC 4x4 on mobile, DXT5 on WebGL).
+# Only written when a sheet has no .meta yet, so edits made in the Unity inspector are kept.
+SHEET_META = """fileFormatVersion: 2
+guid: {guid}
+TextureImporter:
+  serializedVersion: 13
+  mipmaps:
+    enableMipMap: 0
+  isReadable: 0
+  textureSettings:
+    serializedVersion: 2
+    filterMode: 0
+    aniso: 1
+    mipBias: 0
+    wrapU: 1
+    wrapV: 1
+    wrapW: 1
+  nPOTScale: 0
+  alphaUsage: 1
+  alphaIsTransparency: 1
+  textureType: 0
+  textureShape: 1
+  platformSettings:
+  - serializedVersion: 4
+    buildTarget: DefaultTexturePlatform
+    maxTextureSize: 2048
+    textureFormat: -1
+    textureCompression: 2
+    crunchedCompression: 0
+"""
+
+Color = tuple[float, float, float, float]
+
+
+def rgb(r: float, g: float, b: float, a: float = 1.0) -> Color:
+    return (r, g, b, a)
+
+
+def lerp(a: Color, b: Color, t: float) -> Color:
+    """Color.Lerp, including alpha."""
+    t = min(max(t, 0.0), 1.0)
+    return tuple(x + (y - x) * t for x, y in zip(a, b))
+
+
+def with_alpha(color: Color, a: float) -> Color:
+    return (color[0], color[1], color[2], a)
+
+
+BLACK = rgb(0, 0, 0)
+WHITE = rgb(1, 1, 1)
+RED = rgb(1, 0, 0)
+
+
+# =============================================================================
+# CANVAS
+# =============================================================================
+
+def _to_bytes(values) -> np.ndarray:
+    return np.round(np.clip(np.asarray(values, dtype=np.float32), 0, 1) * 255).astype(np.uint8)
+
+
+def _mix(existing: np.ndarray, color: Color) -> np.ndarray:
+    """BlendPixel over an (N, 4) uint8 selection: opaque colours overwrite, translucent ones lerp RGB."""
+    if color[3] >= 1:
+        return np.broadcast_to(_to_bytes(color), existing.shape)
+    under = existing.astype(np.float32) / 255
+    out = under.copy()
+    out[:, :3] += (np.float32(color[:3]) - under[:, :3]) * np.float32(color[3])
+    out[:, 3] = np.maximum(under[:, 3], np.float32(color[3]))
+    return _to_bytes(out)
+
+
+class Canvas:
+    """RGBA32 texture with DetailedSpriteGenerator's primitives, each filled as one mask over its bounds.
+
+    Rows run bottom-up like Texture2D.SetPixel; image() flips them for PNG output.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.pixels = np.zeros((size, size, 4), dtype=np.uint8)
+
+    def image(self) -> Image.Image:
+        return Image.fromarray(self.pixels[::-1], "RGBA")
+
+    def _fill(self, left: int, bottom: int, mask: np.ndarray, color: Color) -> None:
+        """Blend color wherever mask (rows bottom-up, anchored at left/bottom) is set, clipped to the canvas."""
+        if color[3] <= 0:
+            return
+        x0, y0 = max(left, 0), max(bottom, 0)
+        x1, y1 = min(left + mask.shape[1], self.size), min(bottom + mask.shape[0], self.size)
+        if x0 >= x1 or y0 >= y1:
+            return
+        mask = mask[y0 - bottom:y1 - bottom, x0 - left:x1 - left]
+        region = self.pixels[y0:y1, x0:x1]
+        region[mask] = _mix(region[mask], color)
+
+    def rect(self, x: int, y: int, width: int, height: int, color: Color) -> None:
+        if width > 0 and height > 0:
+            self._fill(x, y, np.ones((height, width), dtype=bool), color)
+
+    def circle(self, cx: int, cy: int, radius: int, color: Color) -> None:
+        ys, xs = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+        self._fill(cx - radius, cy - radius, xs * xs + ys * ys <= radius * radius, color)
+
+    def oval(self, cx: int, cy: int, rx: int, ry: int, color: Color) -> None:
+        # Same float32 test as the C# loop so edge pixels match
+        nx = np.arange(-rx, rx + 1, dtype=np.float32) / np.float32(rx)
+        ny = np.arange(-ry, ry + 1, dtype=np.float32) / np.float32(ry)
+        self._fill(cx - rx, cy - ry, ny[:, None] * ny[:, None] + nx[None, :] * nx[None, :] <= 1, color)
+
+    def triangle(self, x1: int, y1: int, x2: int, y2: int, x3: int, y3: int, color: Color) -> None:
+        left, bottom = min(x1, x2, x3), min(y1, y2, y3)
+        ys, xs = np.ogrid[bottom:max(y1, y2, y3) + 1, left:max(x1, x2, x3) + 1]
+        d1 = (xs - x2) * (y1 - y2) - (x1 - x2) * (ys - y2)
+        d2 = (xs - x3) * (y2 - y3) - (x2 - x3) * (ys - y3)
+        d3 = (xs - x1) * (y3 - y1) - (x3 - x1) * (ys - y1)
+        has_neg = (d1 < 0) | (d2 < 0) | (d3 < 0)
+        has_pos = (d1 > 0) | (d2 > 0) | (d3 > 0)
+        self._fill(left, bottom, ~(has_neg & has_pos), color)
+
+    def line(self, x1: int, y1: int, x2: int, y2: int, color: Color) -> None:
+        """Bresenham line thickened one pixel right and up, as DrawLine does."""
+        if color[3] <= 0:
+            return
+        points = np.array(_bresenham(x1, y1, x2, y2))
+        x, y = points[:, 0], points[:, 1]
+        inside = (x >= 0) & (x < self.size) & (y >= 0) & (y < self.size)
+        x, y = x[inside], y[inside]
+        right, up = x + 1 < self.size, y + 1 < self.size
+        index = np.concatenate([y * self.size + x, y[right] * self.size + x[right] + 1, (y[up] + 1) * self.size + x[up]])
+        flat = self.pixels.reshape(-1, 4)
+        if color[3] >= 1:
+            flat[index] = _mix(flat[index], color)
+            return
+        # A translucent colour blends once per hit, so overlapping pixels are blended again per extra hit
+        index, hits = np.unique(index, return_counts=True)
+        for n in range(hits.max()):
+            selected = index[hits > n]
+            flat[selected] = _mix(flat[selected], color)
+
+
+def _bresenham(x1: int, y1: int, x2: int, y2: int) -> list[tuple[int, int]]:
+    dx, dy = abs(x2 - x1), abs(y2 - y1)
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+    err = dx - dy
+    points = []
+    while True:
+        points.append((x1, y1))
+        if x1 == x2 and y1 == y2:
+            return points
+        e2 = 2 * err
+        if e2 > -dy:
+            err -= dy
+            x1 += sx
+        if e2 < dx:
+            err += dx
+            y1 += sy
+
+
+def _f32(value: float) -> np.float32:
+    return np.float32(value)
+
+
+def _sin_wave(i: int) -> float:
+    """Mathf.Sin(i * Mathf.PI * 0.5f) in float32, as used for breathing and pulsing."""
+    return float(_f32(math.sin(float(_f32(i) * _f32(math.pi) * _f32(0.5)))))
+
+
+# =============================================================================
+# HEROES
+# =============================================================================
+
+def draw_warrior(c: Canvas, cx: int, by: int, body: Color, armor: Color, skin: Color, weapon: Color,
+                 pose: int, breath: float) -> None:
+    head_y = by + 55 + int(breath)
+    body_y = by + 25
+
+    # Legs and boots
+    c.rect(cx - 12, by, 8, 20, body)
+    c.rect(cx + 4, by, 8, 20, body)
+    c.rect(cx - 14, by, 12, 6, armor)
+    c.rect(cx + 2, by, 12, 6, armor)
+
+    # Torso, chest armor, belt, armor detail
+    c.rect(cx - 18, body_y, 36, 30, body)
+    c.rect(cx - 16, body_y + 5, 32, 20, armor)
+    c.rect(cx - 18, body_y, 36, 5, lerp(armor, BLACK, 0.3))
+    c.rect(cx - 2, body_y + 5, 4, 20, lerp(armor, BLACK, 0.2))
+
+    # Pauldrons
+    c.oval(cx - 22, body_y + 22, 8, 10, armor)
+    c.oval(cx + 22, body_y + 22, 8, 10, armor)
+
+    arm_pose = pose % 10
+    if arm_pose == 0:
+        c.rect(cx - 30, body_y + 5, 10, 22, skin)
+        c.rect(cx + 20, body_y + 5, 10, 22, skin)
+        c.rect(cx - 32, body_y + 2, 12, 8, armor)
+        c.rect(cx + 20, body_y + 2, 12, 8, armor)
+        draw_sword(c, cx + 35, body_y + 5, weapon)
+    elif 1 <= arm_pose <= 3:
+        c.rect(cx - 30, body_y + 5, 10, 22, skin)
+        draw_sword(c, cx + 25, body_y + 30, weapon)
+        c.rect(cx + 15, body_y + 20 + arm_pose * 5, 12, 18, skin)
+    elif 10 <= pose < 20:
+        c.rect(cx - 20, body_y + 10, 8, 15, skin)
+        c.rect(cx + 12, body_y + 10, 8, 15, skin)
+    elif pose >= 20:
+        c.rect(cx - 28, body_y + 8, 10, 18, skin)
+        c.rect(cx + 18, body_y + 8, 10, 18, skin)
+
+    # Head, helmet, visor, eyes, crest
+    c.oval(cx, head_y, 14, 16, skin)
+    c.oval(cx, head_y + 4, 16, 14, armor)
+    c.rect(cx - 10, head_y + 2, 20, 4, BLACK)
+    c.circle(cx - 4, head_y + 3, 2, rgb(0.9, 0.9, 1))
+    c.circle(cx + 4, head_y + 3, 2, rgb(0.9, 0.9, 1))
+    c.triangle(cx, head_y + 22, cx - 4, head_y + 12, cx + 4, head_y + 12, armor)
+
+
+def draw_rogue(c: Canvas, cx: int, by: int, body: Color, armor: Color, skin: Color, weapon: Color,
+               pose: int, breath: float) -> None:
+    head_y = by + 52 + int(breath)
+    body_y = by + 22
+
+    # Legs and boots
+    c.rect(cx - 8, by, 6, 22, body)
+    c.rect(cx + 2, by, 6, 22, body)
+    c.rect(cx - 9, by, 8, 5, armor)
+    c.rect(cx + 1, by, 8, 5, armor)
+
+    # Torso, leather armor, cross straps, cloak collar
+    c.rect(cx - 12, body_y, 24, 28, body)
+    c.rect(cx - 10, body_y + 8, 20, 16, armor)
+    c.line(cx - 10, body_y + 8, cx + 10, body_y + 24, lerp(armor, BLACK, 0.3))
+    c.line(cx + 10, body_y + 8, cx - 10, body_y + 24, lerp(armor, BLACK, 0.3))
+    c.triangle(cx, body_y + 30, cx - 14, body_y + 20, cx + 14, body_y + 20, armor)
+
+    arm_pose = pose % 10
+    if arm_pose == 0:
+        c.rect(cx - 20, body_y + 8, 8, 18, skin)
+        c.rect(cx + 12, body_y + 8, 8, 18, skin)
+        draw_dagger(c, cx - 24, body_y + 5, weapon)
+        draw_dagger(c, cx + 24, body_y + 5, weapon)
+    elif 1 <= arm_pose <= 3:
+        offset = arm_pose * 8
+        c.rect(cx - 25 + offset, body_y + 10, 8, 16, skin)
+        c.rect(cx + 17 - offset, body_y + 10, 8, 16, skin)
+        draw_dagger(c, cx - 20 + offset * 2, body_y + 15, weapon)
+        draw_dagger(c, cx + 20 - offset * 2, body_y + 15, weapon)
+
+    # Head, hood, face, eyes, mask
+    c.oval(cx, head_y, 12, 14, skin)
+    c.oval(cx, head_y + 2, 16, 16, armor)
+    c.oval(cx, head_y - 2, 10, 12, skin)
+    c.circle(cx - 4, head_y, 2, WHITE)
+    c.circle(cx + 4, head_y, 2, WHITE)
+    c.circle(cx - 4, head_y, 1, BLACK)
+    c.circle(cx + 4, head_y, 1, BLACK)
+    c.rect(cx - 8, head_y - 8, 16, 6, armor)
+
+
+def draw_mage(c: Canvas, cx: int, by: int, body: Color, armor: Color, skin: Color, weapon: Color,
+              pose: int, breath: float) -> None:
+    head_y = by + 55 + int(breath)
+    body_y = by + 20
+
+    # Robe, trim, sash
+    c.triangle(cx, by, cx - 20, by + 25, cx + 20, by + 25, body)
+    c.rect(cx - 14, body_y, 28, 35, body)
+    c.rect(cx - 14, body_y + 30, 28, 4, armor)
+    c.rect(cx - 2, body_y, 4, 35, armor)
+    c.rect(cx - 12, body_y + 10, 24, 4, weapon)
+
+    arm_pose = pose % 10
+    if arm_pose == 0:
+        c.rect(cx - 22, body_y + 10, 10, 15, body)
+        c.rect(cx + 12, body_y + 10, 10, 15, body)
+        c.rect(cx - 26, body_y + 5, 6, 8, skin)
+        c.rect(cx + 20, body_y + 5, 6, 8, skin)
+        draw_staff(c, cx + 30, by + 5, weapon, armor)
+    elif 1 <= arm_pose <= 3:
+        c.rect(cx - 22, body_y + 15 + arm_pose * 5, 10, 15, body)
+        c.rect(cx + 12, body_y + 15 + arm_pose * 5, 10, 15, body)
+        c.circle(cx, head_y - 10 + arm_pose * 10, 8 + arm_pose * 3, with_alpha(weapon, 0.5))
+
+    # Head, hat, band, eyes, beard
+    c.oval(cx, head_y, 12, 14, skin)
+    c.oval(cx, head_y + 8, 18, 6, armor)
+    c.triangle(cx, head_y + 35, cx - 14, head_y + 8, cx + 14, head_y + 8, armor)
+    c.rect(cx - 15, head_y + 6, 30, 3, weapon)
+    c.circle(cx - 4, head_y + 2, 2, WHITE)
+    c.circle(cx + 4, head_y + 2, 2, WHITE)
+    c.circle(cx - 4, head_y + 2, 1, rgb(0.4, 0.2, 0.6))
+    c.circle(cx + 4, head_y + 2, 1, rgb(0.4, 0.2, 0.6))
+    c.triangle(cx, head_y - 15, cx - 8, head_y - 4, cx + 8, head_y - 4, lerp(skin, WHITE, 0.5))
+
+
+def draw_sword(c: Canvas, x: int, y: int, color: Color) -> None:
+    c.rect(x - 2, y - 5, 4, 10, lerp(color, BLACK, 0.5))
+    c.rect(x - 6, y + 4, 12, 3, color)
+    c.rect(x - 2, y + 6, 4, 25, color)
+    c.triangle(x, y + 33, x - 2, y + 30, x + 2, y + 30, color)
+
+
+def draw_dagger(c: Canvas, x: int, y: int, color: Color) -> None:
+    c.rect(x - 1, y - 3, 2, 6, lerp(color, BLACK, 0.5))
+    c.rect(x - 1, y + 2, 2, 12, color)
+    c.circle(x, y + 14, 1, color)
+
+
+def draw_staff(c: Canvas, x: int, y: int, gem: Color, wood: Color) -> None:
+    c.rect(x - 2, y, 4, 60, wood)
+    c.oval(x, y + 65, 8, 10, wood)
+    c.circle(x, y + 68, 5, gem)
+    c.circle(x + 1, y + 70, 2, WHITE)
+
+
+HERO_DRAWERS: dict[str, Callable] = {"warrior": draw_warrior, "rogue": draw_rogue, "mage": draw_mage}
+
+
+def hero_frame(kind: str, body: Color, armor: Color, skin: Color, weapon: Color, pose: int, breath: float) -> Canvas:
+    """DetailedSpriteGenerator.CreateDetailedHeroSprite."""
+    canvas = Canvas(HERO_SIZE)
+    HERO_DRAWERS[kind](canvas, HERO_SIZE // 2, 10, body, armor, skin, weapon, pose, breath)
+    return canvas
+
+
+def hero_animations(kind: str, body: Color, armor: Color, skin: Color, weapon: Color) -> dict[str, list[Canvas]]:
+    """GenerateHeroIdle/Attack/Dodge/HurtFrames."""
+    def frame(pose, breath=0.0):
+        return hero_frame(kind, body, armor, skin, weapon, pose, breath)
+    return {
+        "idle": [frame(0, _sin_wave(i) * 2) for i in range(4)],
+        "attack": [frame(pose) for pose in (1, 2, 3, 0)],
+        "dodge": [frame(10 + i) for i in range(4)],
+        "hurt": [frame(20), frame(21)],
+    }
+
+
+# =============================================================================
+# BOSSES
+# =============================================================================
+
+def draw_mask_boss(c: Canvas, cx: int, cy: int, body: Color, eye: Color, accent: Color, glow: Color,
+                   pose: int, pulse: float) -> None:
+    glow_size = int(pulse * 5)
+
+    # Aura (normal states only), mask body and inner face
+    if pose < 10:
+        c.oval(cx, cy, 95 + glow_size, 105 + glow_size, with_alpha(glow, 0.15))
+    c.oval(cx, cy, 85, 95, body)
+    c.oval(cx, cy - 5, 70, 75, accent)
+    c.oval(cx, cy - 5, 60, 65, body)
+
+    # Crown and jewels
+    crown_y = cy + 60
+    c.triangle(cx, crown_y + 40, cx - 30, crown_y, cx + 30, crown_y, accent)
+    c.triangle(cx - 25, crown_y + 20, cx - 45, crown_y - 10, cx - 5, crown_y - 10, accent)
+    c.triangle(cx + 25, crown_y + 20, cx + 5, crown_y - 10, cx + 45, crown_y - 10, accent)
+    c.circle(cx, crown_y + 30, 6, glow)
+    c.circle(cx - 25, crown_y + 10, 4, glow)
+    c.circle(cx + 25, crown_y + 10, 4, glow)
+
+    # Eye sockets, eyes, pupils, shine
+    eye_y = cy + 15
+    c.oval(cx - 28, eye_y, 20, 16, BLACK)
+    c.oval(cx + 28, eye_y, 20, 16, BLACK)
+    eye_glow = int(abs(pulse) * 3)
+    c.oval(cx - 28, eye_y, 16 + eye_glow, 12 + eye_glow, eye)
+    c.oval(cx + 28, eye_y, 16 + eye_glow, 12 + eye_glow, eye)
+    pupil_offset = 3 if 1 <= pose <= 3 else 0
+    c.oval(cx - 28 - pupil_offset, eye_y, 8, 10, BLACK)
+    c.oval(cx + 28 - pupil_offset, eye_y, 8, 10, BLACK)
+    c.circle(cx - 32, eye_y + 4, 3, WHITE)
+    c.circle(cx + 24, eye_y + 4, 3, WHITE)
+
+    # Nose
+    c.rect(cx - 4, cy - 5, 8, 25, accent)
+    c.triangle(cx, cy - 20, cx - 8, cy - 5, cx + 8, cy - 5, accent)
+
+    # Mouth and teeth
+    mouth_y = cy - 40
+    c.rect(cx - 30, mouth_y, 60, 20, BLACK)
+    for i in range(6):
+        c.rect(cx - 25 + i * 10, mouth_y + 12, 6, 8, lerp(body, WHITE, 0.8))
+
+    draw_tribal_mark(c, cx - 55, cy, accent, glow)
+    draw_tribal_mark(c, cx + 55, cy, accent, glow)
+
+    # Horns and horn tips
+    c.triangle(cx - 100, cy + 20, cx - 75, cy + 50, cx - 75, cy - 10, accent)
+    c.triangle(cx + 100, cy + 20, cx + 75, cy + 50, cx + 75, cy - 10, accent)
+    c.circle(cx - 95, cy + 20, 5, glow)
+    c.circle(cx + 95, cy + 20, 5, glow)
+
+    # Chin
+    chin_y = cy - 70
+    c.triangle(cx, chin_y - 20, cx - 25, chin_y + 10, cx + 25, chin_y + 10, accent)
+    c.circle(cx, chin_y - 15, 5, glow)
+
+    if 1 <= pose <= 3:
+        c.oval(cx - 28, eye_y, 22, 18, with_alpha(eye, 0.7))
+        c.oval(cx + 28, eye_y, 22, 18, with_alpha(eye, 0.7))
+        c.rect(cx - 35, mouth_y - 5, 70, 30, BLACK)
+
+    if pose >= 20:
+        draw_cracks(c, cx, cy, pose - 20, glow)
+
+
+def draw_tribal_mark(c: Canvas, x: int, y: int, line: Color, glow: Color) -> None:
+    c.rect(x - 2, y - 20, 4, 40, line)
+    c.rect(x - 10, y - 10, 20, 3, line)
+    c.rect(x - 10, y + 7, 20, 3, line)
+    c.circle(x, y - 15, 3, glow)
+    c.circle(x, y + 12, 3, glow)
+
+
+def draw_cracks(c: Canvas, cx: int, cy: int, intensity: int, glow: Color) -> None:
+    # Mathf trig is float32; truncating e.g. cos(60deg) * 50 depends on it
+    deg2rad = _f32(math.pi / 180)
+    for i in range(intensity + 1):
+        rad = _f32(i * 60) * deg2rad
+        end_x = cx + int(_f32(math.cos(rad)) * _f32(50))
+        end_y = cy + int(_f32(math.sin(rad)) * _f32(50))
+        c.line(cx, cy, end_x, end_y, glow)
+        if intensity > 1:
+            branch = rad + _f32(0.3)
+            branch_x = cx + int(_f32(math.cos(branch)) * _f32(30))
+            branch_y = cy + int(_f32(math.sin(branch)) * _f32(30))
+            c.line((cx + end_x) // 2, (cy + end_y) // 2, branch_x, branch_y, glow)
+
+
+def boss_frame(body: Color, eye: Color, accent: Color, glow: Color, pose: int, pulse: float) -> Canvas:
+    """DetailedSpriteGenerator.CreateDetailedBossSprite."""
+    canvas = Canvas(BOSS_SIZE)
+    draw_mask_boss(canvas, BOSS_SIZE // 2, BOSS_SIZE // 2, body, eye, accent, glow, pose, pulse)
+    return canvas
+
+
+def boss_animations(body: Color, eye: Color, accent: Color, glow: Color, phase2: Color) -> dict[str, list[Canvas]]:
+    """GenerateBossIdle/Attack/Hurt/TransitionFrames."""
+    return {
+        "idle": [boss_frame(body, eye, accent, glow, 0, _sin_wave(i)) for i in range(4)],
+        "attack": [boss_frame(body, eye, accent, glow, pose, 0.0) for pose in (1, 2, 3)],
+        "hurt": [boss_frame(body, eye, accent, WHITE, 10, 0.0), boss_frame(body, eye, accent, glow, 10, 0.0)],
+        "transition": [boss_frame(lerp(body, phase2, i / 3), eye, accent, lerp(glow, RED, i / 3), 20 + i, 0.0)
+                       for i in range(4)],
+    }
+
+
+# =============================================================================
+# SHEETS
+# =============================================================================
+
+# Hero name -> (kind, body, armor, skin, weapon), as in RuntimeAssetLoader.GenerateHeroSprites
+HEROES = {
+    "BronzeWarrior": ("warrior", rgb(0.8, 0.5, 0.2), rgb(0.6, 0.35, 0.15), rgb(0.95, 0.8, 0.7), rgb(0.7, 0.7, 0.75)),
+    "ShadowDancer": ("rogue", rgb(0.3, 0.2, 0.4), rgb(0.2, 0.15, 0.25), rgb(0.85, 0.75, 0.85), rgb(0.5, 0.3, 0.6)),
+    "FlameBearer": ("mage", rgb(0.9, 0.3, 0.1), rgb(0.7, 0.2, 0.1), rgb(0.95, 0.85, 0.75), rgb(1, 0.5, 0.2)),
+}
+
+# Boss name -> (body, eye, accent, glow, phase 2), as in RuntimeAssetLoader.GenerateBossSprites
+BOSSES = {
+    "BronzeMask": (rgb(0.8, 0.5, 0.2), rgb(1, 0.9, 0.5), rgb(0.5, 0.3, 0.1), rgb(1, 0.7, 0.3), rgb(0.9, 0.2, 0.2)),
+    "ChaosTotem": (rgb(0.5, 0.2, 0.4), rgb(1, 0.3, 0.5), rgb(0.3, 0.1, 0.2), rgb(0.8, 0.3, 0.6), rgb(0.6, 0.1, 0.4)),
+}
+
+# Animation -> (fps, loop, ping pong) from SpriteAnimator.SetupCharacterAnimations / SetupBossAnimations
+HERO_TIMING = {"idle": (8, True, True), "attack": (16, False, False), "dodge": (16, False, False), "hurt": (12, False, False)}
+BOSS_TIMING = {"idle": (6, True, True), "attack": (12, False, False), "hurt": (10, False, False), "transition": (8, False, False)}
+
+
+def _crop_box(frames: list[Canvas]) -> tuple[int, int, int, int]:
+    """(left, bottom, width, height) covering every visible pixel of the frames, in whole blocks."""
+    size = frames[0].size
+    visible = np.zeros((size, size), dtype=bool)
+    for canvas in frames:
+        visible |= canvas.pixels[..., 3] > 0
+    rows, cols = np.nonzero(visible)
+    if not rows.size:
+        return 0, 0, size, size
+    box = []
+    for low, high in ((cols.min(), cols.max() + 1), (rows.min(), rows.max() + 1)):
+        extent = min(size, -(-int(high - low) // BLOCK_SIZE) * BLOCK_SIZE)
+        box.append((min(int(low), size - extent), extent))
+    (left, width), (bottom, height) = box
+    return left, bottom, width, height
+
+
+def _grid_columns(count: int, width: int, height: int) -> int:
+    """Columns giving the smallest sheet that fits MAX_SHEET_SIZE."""
+    fits = [c for c in range(1, count + 1)
+            if c * width <= MAX_SHEET_SIZE and -(-count // c) * height <= MAX_SHEET_SIZE]
+    if not fits:
+        raise ValueError(f"{count} frames of {width}x{height} do not fit a {MAX_SHEET_SIZE} sheet")
+    return min(fits, key=lambda c: (c * width * -(-count // c) * height, abs(c * width - -(-count // c) * height)))
+
+
+def build_sheet(name: str, animations: dict[str, list[Canvas]], timing: dict) -> tuple[Image.Image, dict]:
+    """Frames cropped to their shared visible bounds, packed row by row in animation order.
+
+    Every frame uses the same crop, so one pivot (moved with the crop) keeps them aligned in game.
+    Frame rects use Unity's bottom-left origin.
+    """
+    frames = [canvas for canvas_list in animations.values() for canvas in canvas_list]
+    left, bottom, cell_w, cell_h = _crop_box(frames)
+    size = frames[0].size
+    columns = _grid_columns(len(frames), cell_w, cell_h)
+    width, height = columns * cell_w, -(-len(frames) // columns) * cell_h
+
+    # Bottom-up like the canvases; flipped once for PNG output
+    pixels = np.zeros((height, width, 4), dtype=np.uint8)
+    entries, index = [], 0
+    for animation, canvas_list in animations.items():
+        rects = []
+        for canvas in canvas_list:
+            row, column = divmod(index, columns)
+            x, y = column * cell_w, height - (row + 1) * cell_h
+            pixels[y:y + cell_h, x:x + cell_w] = canvas.pixels[bottom:bottom + cell_h, left:left + cell_w]
+            rects.append({"x": x, "y": y, "w": cell_w, "h": cell_h})
+            index += 1
+        fps, loop, ping_pong = timing[animation]
+        entries.append({"name": animation, "fps": fps, "loop": loop, "pingPong": ping_pong, "frames": rects})
+    pivot = {"x": round((PIVOT[0] * size - left) / cell_w, 6), "y": round((PIVOT[1] * size - bottom) / cell_h, 6)}
+    return Image.fromarray(pixels[::-1], "RGBA"), {
+        "name": name,
+        "image": f"{name}.png",
+        "width": width,
+        "height": height,
+        "ppu": PIXELS_PER_UNIT,
+        "pivot": pivot,
+        "animations": entries,
+    }
+
+
+def bake_sprites(output_dir: str = DEFAULT_BAKE_DIR, root: Path = PROJECT_ROOT) -> dict:
+    """Render every hero and boss sheet plus manifest.json; unchanged files are left untouched."""
+    start = time.perf_counter()
+    sheets = [(name, hero_animations(*colors), HERO_TIMING) for name, colors in HEROES.items()]
+    sheets += [(name, boss_animations(*colors), BOSS_TIMING) for name, colors in BOSSES.items()]
+
+    out = root / output_dir
+    out.mkdir(parents=True, exist_ok=True)
+    manifest = {"version": BAKE_VERSION, "origin": "bottom-left", "sheets": []}
+    files, summary = {}, {}
+    for name, animations, timing in sheets:
+        sheet, entry = build_sheet(name, animations, timing)
+        buffer = io.BytesIO()
+        sheet.save(buffer, "PNG", optimize=True)
+        path = out / entry["image"]
+        files[entry["image"]] = write_if_changed(path, buffer.getvalue())
+        _write_meta(path, root)
+        manifest["sheets"].append(entry)
+        summary[name] = {
+            "size": f"{entry['width']}x{entry['height']}",
+            "cell": f"{entry['animations'][0]['frames'][0]['w']}x{entry['animations'][0]['frames'][0]['h']}",
+            "frames": sum(len(frames) for frames in animations.values()),
+            "bytes": len(buffer.getvalue()),
+        }
+    files[MANIFEST_NAME] = write_if_changed(out / MANIFEST_NAME, json.dumps(manifest, indent=2).encode())
+
+    return {
+        "success": True,
+        "sheets": summary,
+        "frames": sum(s["frames"] for s in summary.values()),
+        "render_time": f"{time.perf_counter() - start:.2f}s",
+        "output_dir": out.relative_to(root).as_posix() if out.is_relative_to(root) else str(out),
+        "files": files,
+    }
+
+
+def _write_meta(path: Path, root: Path) -> None:
+    meta = path.with_name(path.name + ".meta")
+    if meta.exists():
+        return
+    # Stable per path, so re-baking into a fresh checkout reuses the same GUID
+    relative = path.relative_to(root).as_posix() if path.is_relative_to(root) else str(path)
+    meta.write_text(SHEET_META.format(guid=hashlib.md5(relative.encode()).hexdigest()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--out", default=DEFAULT_BAKE_DIR, help="Output folder relative to the project root")
+    args = parser.parse_args()
+    print(json.dumps(bake_sprites(args.out), indent=2))
+
+
+if __name__ == "__main__":
+    main()
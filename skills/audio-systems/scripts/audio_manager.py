@@ -1,4 +1,583 @@
 #!/usr/bin/env python3
+"""
+Audio Manager
+Streaming WAV pipeline (silence trim, loudness normalization, per-platform
+resampling) and offline baking of the ProceduralAudio clips for the
+audio-systems skill.
+"""
+
+import argparse
+import hashlib
+import io
 import json
-def manage(): return {"engines": ["fmod", "wwise"], "concepts": ["spatial", "mixing", "dynamic"]}
-if __name__ == "__main__": print(json.dumps(manage(), indent=2))
+import math
+import os
+import struct
+import tempfile
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Iterator, NamedTuple, Optional
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+DEFAULT_AUDIO_DIRS = ["src/Assets/Audio/SFX", "src/Assets/Audio/Music"]
+DEFAULT_OUTPUT_DIR = "builds/optimized"
+
+# ProceduralAudio loads baked clips from Resources/Audio/SFX before synthesizing them
+DEFAULT_BAKE_DIR = "src/Assets/Resources/Audio/SFX"
+
+# Frames decoded per read; bounds memory for long music tracks
+CHUNK_FRAMES = 1 << 16
+
+# Sample rate per clip category and whether SFX are folded to mono, per target platform
+PLATFORM_SETTINGS = {
+    "pc": {"sfx_rate": 44100, "music_rate": 44100, "mono_sfx": False},
+    "console": {"sfx_rate": 44100, "music_rate": 44100, "mono_sfx": False},
+    "mobile": {"sfx_rate": 22050, "music_rate": 32000, "mono_sfx": True},
+    "web": {"sfx_rate": 22050, "music_rate": 32000, "mono_sfx": True},
+}
+
+# RMS loudness targets in dBFS (music sits under effects) and the peak ceiling no gain may exceed
+LOUDNESS_TARGETS = {"sfx": -16.0, "music": -20.0}
+PEAK_CEILING_DB = -1.0
+
+# Anything quieter than this at either end of a clip counts as silence
+SILENCE_THRESHOLD_DB = -60.0
+SILENCE_PAD_SECONDS = 0.005
+
+# Half-width, in input samples, of the windowed-sinc resampling kernel
+RESAMPLE_HALF_TAPS = 16
+
+# Bump when processing changes so cached results are redone
+PIPELINE_VERSION = 2
+
+# Fewer stale clips than this are decoded and resampled in-process
+POOL_MIN_FILES = 4
+
+# Bake results (levels, output names) stored in the bake folder, keyed by source clip
+CACHE_FILE = ".audio_cache.json"
+
+# WAVE format tags
+WAVE_PCM = 1
+WAVE_FLOAT = 3
+WAVE_EXTENSIBLE = 0xFFFE
+
+
+# =============================================================================
+# WAV STREAMING
+# =============================================================================
+
+class WavInfo(NamedTuple):
+    """Layout of a WAV file's sample data."""
+    rate: int
+    channels: int
+    sample_width: int
+    is_float: bool
+    data_offset: int
+    frames: int
+
+
+def read_wav_info(f: BinaryIO) -> WavInfo:
+    """Parse the RIFF chunks up to the sample data without reading it."""
+    riff, _, form = struct.unpack("<4sI4s", f.read(12))
+    if riff != b"RIFF" or form != b"WAVE":
+        raise ValueError("Not a RIFF/WAVE file")
+
+    fmt = None
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            raise ValueError("WAV file has no data chunk")
+        chunk_id, size = struct.unpack("<4sI", header)
+        if chunk_id == b"fmt ":
+            body = f.read(size)
+            tag, channels, rate, _, block_align, bits = struct.unpack("<HHIIHH", body[:16])
+            if tag == WAVE_EXTENSIBLE and len(body) >= 26:
+                tag = struct.unpack("<H", body[24:26])[0]
+            if tag not in (WAVE_PCM, WAVE_FLOAT):
+                raise ValueError(f"Unsupported WAV encoding (format tag {tag})")
+            fmt = (rate, channels, block_align // channels, tag == WAVE_FLOAT)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise ValueError("WAV data chunk precedes its fmt chunk")
+            rate, channels, width, is_float = fmt
+            # Streamed writers leave the size at 0 or 0xFFFFFFFF; trust the file length instead
+            offset = f.tell()
+            available = os.fstat(f.fileno()).st_size - offset
+            size = available if size in (0, 0xFFFFFFFF) else min(size, available)
+            return WavInfo(rate, channels, width, is_float, offset, size // (width * channels))
+        else:
+            f.seek(size + (size & 1), 1)
+        if chunk_id == b"fmt " and size & 1:
+            f.seek(1, 1)
+
+
+def _decode(raw: bytes, info: WavInfo) -> np.ndarray:
+    """Little-endian samples -> float32 frames x channels in [-1, 1]."""
+    width = info.sample_width
+    if info.is_float:
+        samples = np.frombuffer(raw, dtype="<f4" if width == 4 else "<f8").astype(np.float32)
+    elif width == 1:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 3:
+        triplets = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        values = triplets[:, 0] | (triplets[:, 1] << 8) | (triplets[:, 2] << 16)
+        samples = (np.where(values >= 1 << 23, values - (1 << 24), values)).astype(np.float32) / float(1 << 23)
+    else:
+        dtype = {2: "<i2", 4: "<i4"}[width]
+        samples = np.frombuffer(raw, dtype=dtype).astype(np.float32) / float(1 << (8 * width - 1))
+    return samples.reshape(-1, info.channels)
+
+
+def iter_chunks(path: Path, start: int = 0, stop: int = None,
+                chunk_frames: int = CHUNK_FRAMES) -> Iterator[np.ndarray]:
+    """Decode frames [start, stop) of a WAV file a chunk at a time."""
+    with open(path, "rb") as f:
+        info = read_wav_info(f)
+        stop = info.frames if stop is None else min(stop, info.frames)
+        frame_bytes = info.sample_width * info.channels
+        f.seek(info.data_offset + start * frame_bytes)
+        position = start
+        while position < stop:
+            count = min(chunk_frames, stop - position)
+            raw = f.read(count * frame_bytes)
+            raw = raw[:len(raw) - len(raw) % frame_bytes]
+            if not raw:
+                break
+            yield _decode(raw, info)
+            position += len(raw) // frame_bytes
+
+
+def _to_pcm16(samples: np.ndarray) -> bytes:
+    return (np.clip(samples, -1.0, 1.0) * 32767.0).round().astype("<i2").tobytes()
+
+
+# =============================================================================
+# ANALYSIS AND RESAMPLING
+# =============================================================================
+
+def analyze(path: Path, threshold_db: float = SILENCE_THRESHOLD_DB) -> dict:
+    """One streaming pass: peak, RMS of the audible span and where that span starts and ends."""
+    threshold = 10 ** (threshold_db / 20)
+    peak, sum_squares = 0.0, 0.0
+    first, last, position = None, None, 0
+    for chunk in iter_chunks(path):
+        levels = np.abs(chunk).max(axis=1)
+        peak = max(peak, float(levels.max()))
+        sum_squares += float(np.square(chunk, dtype=np.float64).mean(axis=1).sum())
+        loud = np.flatnonzero(levels > threshold)
+        if loud.size:
+            if first is None:
+                first = position + int(loud[0])
+            last = position + int(loud[-1])
+        position += len(chunk)
+
+    # Samples outside the audible span are below the threshold and add almost nothing to the sum
+    span = (last - first + 1) if first is not None else 0
+    rms = math.sqrt(sum_squares / span) if span else 0.0
+    return {"frames": position, "first": first, "last": last, "peak": peak, "rms": rms}
+
+
+def _db(value: float) -> Optional[float]:
+    return round(20 * math.log10(value), 2) if value > 0 else None
+
+
+class Resampler:
+    """Streaming windowed-sinc resampler; feed chunks in order, then flush."""
+
+    def __init__(self, source_rate: int, target_rate: int, channels: int, half_taps: int = RESAMPLE_HALF_TAPS):
+        divisor = math.gcd(source_rate, target_rate)
+        self.up, self.down = target_rate // divisor, source_rate // divisor
+        self.half_taps = half_taps
+        # Low-pass below the lower of the two Nyquist frequencies
+        self.cutoff = min(1.0, target_rate / source_rate)
+        self.offsets = np.arange(-half_taps + 1, half_taps + 1)
+        # Outputs fall on only `up` distinct fractional positions, so one kernel per phase covers them all
+        distance = (np.arange(self.up) / self.up)[:, None] - self.offsets[None, :]
+        kernels = self.cutoff * np.sinc(self.cutoff * distance) * _blackman(distance / half_taps)
+        self.kernels = (kernels / kernels.sum(axis=1, keepdims=True)).astype(np.float32)
+        self.buffer = np.zeros((half_taps, channels), dtype=np.float32)
+        self.buffer_start = -half_taps
+        self.received = 0
+        self.produced = 0
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        self.buffer = np.concatenate([self.buffer, chunk.astype(np.float32, copy=False)])
+        self.received += len(chunk)
+        return self._emit(final=False)
+
+    def flush(self) -> np.ndarray:
+        self.buffer = np.concatenate([self.buffer, np.zeros((self.half_taps, self.buffer.shape[1]), np.float32)])
+        return self._emit(final=True)
+
+    def _emit(self, final: bool) -> np.ndarray:
+        if final:
+            total = -(-self.received * self.up // self.down)
+        else:
+            # Output n needs input up to floor(n * down / up) + half_taps
+            available = self.buffer_start + len(self.buffer) - self.half_taps
+            total = max(self.produced, -(-available * self.up // self.down))
+        n = np.arange(self.produced, total, dtype=np.int64)
+        if not n.size:
+            return np.zeros((0, self.buffer.shape[1]), dtype=np.float32)
+
+        numerator = n * self.down
+        base, phase = np.divmod(numerator, self.up)
+        kernel = self.kernels[phase]
+        first = base - self.half_taps + 1 - self.buffer_start
+        out = np.zeros((len(n), self.buffer.shape[1]), dtype=np.float32)
+        for tap in range(len(self.offsets)):
+            out += kernel[:, tap, None] * self.buffer[first + tap]
+        self.produced = total
+
+        # Keep only the history the next output still needs
+        keep_from = (total * self.down // self.up) - self.half_taps + 1 - self.buffer_start
+        keep_from = max(0, min(keep_from, len(self.buffer)))
+        self.buffer = self.buffer[keep_from:]
+        self.buffer_start += keep_from
+        return out
+
+
+def _blackman(x: np.ndarray) -> np.ndarray:
+    """Blackman window over x in [-1, 1]."""
+    x = np.clip(x, -1.0, 1.0)
+    return 0.42 + 0.5 * np.cos(np.pi * x) + 0.08 * np.cos(2 * np.pi * x)
+
+
+# =============================================================================
+# AUDIO PIPELINE
+# =============================================================================
+
+def process_audio(source: str, output: str, settings: dict) -> dict:
+    """Trim, normalize and resample one WAV file into a 16-bit PCM WAV, streaming both passes."""
+    started = time.perf_counter()
+    path = Path(source)
+    with open(path, "rb") as f:
+        info = read_wav_info(f)
+    stats = analyze(path, settings["silence_db"])
+
+    start, stop = 0, stats["frames"]
+    if settings["trim"] and stats["first"] is not None:
+        pad = int(SILENCE_PAD_SECONDS * info.rate)
+        start, stop = max(0, stats["first"] - pad), min(stats["frames"], stats["last"] + 1 + pad)
+
+    gain = 1.0
+    if stats["rms"] > 0 and settings["target_db"] is not None:
+        gain = 10 ** (settings["target_db"] / 20) / stats["rms"]
+
+    channels = 1 if settings["mono"] else info.channels
+    rate = settings["rate"] or info.rate
+    resampler = Resampler(info.rate, rate, channels) if rate != info.rate else None
+
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    temp = Path(output).with_suffix(".wav.tmp")
+    peak_out, frames_out = 0.0, 0
+    # Stage the unity-gain float output in an anonymous temp file outside the project:
+    # downmixing and sinc ringing move the peak, so the ceiling is only known once the
+    # last resampled block is out
+    with tempfile.TemporaryFile() as stage:
+
+        def stage_block(block: np.ndarray) -> None:
+            nonlocal peak_out, frames_out
+            if len(block):
+                stage.write(block.astype("<f4", copy=False).tobytes())
+                peak_out = max(peak_out, float(np.abs(block).max()))
+                frames_out += len(block)
+
+        for chunk in iter_chunks(path, start, stop):
+            if channels != info.channels:
+                chunk = chunk.mean(axis=1, keepdims=True)
+            stage_block(resampler.process(chunk) if resampler else chunk)
+        if resampler:
+            stage_block(resampler.flush())
+
+        # Peak limit last, just before quantizing
+        if peak_out > 0:
+            gain = min(gain, 10 ** (PEAK_CEILING_DB / 20) / peak_out)
+
+        stage.seek(0)
+        block_bytes = CHUNK_FRAMES * channels * 4
+        try:
+            with wave.open(str(temp), "wb") as writer:
+                writer.setnchannels(channels)
+                writer.setsampwidth(2)
+                writer.setframerate(rate)
+                for raw in iter(lambda: stage.read(block_bytes), b""):
+                    writer.writeframes(_to_pcm16(np.frombuffer(raw, "<f4") * np.float32(gain)))
+            output_bytes = temp.stat().st_size
+            status = _replace_if_changed(temp, Path(output))
+        finally:
+            # Never leave a half-written .wav.tmp next to the output (Unity would import it)
+            temp.unlink(missing_ok=True)
+
+    return {
+        "output": output,
+        "status": status,
+        "category": settings["category"],
+        "source_rate": info.rate,
+        "rate": rate,
+        "channels": channels,
+        "source_seconds": round(stats["frames"] / info.rate, 3),
+        "seconds": round(frames_out / rate, 3),
+        "trimmed_seconds": round((stats["frames"] - (stop - start)) / info.rate, 3),
+        "peak_db": _db(stats["peak"]),
+        "rms_db": _db(stats["rms"]),
+        "gain_db": _db(gain),
+        "output_peak_db": _db(peak_out * gain),
+        "source_bytes": path.stat().st_size,
+        "output_bytes": output_bytes,
+        "process_time": round(time.perf_counter() - started, 4),
+    }
+
+
+def optimize(platform: str = "pc", source_dirs: list[str] = None, output_dir: str = DEFAULT_OUTPUT_DIR,
+             target_db: float = None, trim: bool = True, silence_db: float = SILENCE_THRESHOLD_DB,
+             workers: int = None, root: Path = PROJECT_ROOT) -> dict:
+    """Process every WAV below source_dirs for a platform into output_dir/<platform>/.
+
+    Files in a folder named Music use the music rate and loudness target,
+    everything else is treated as SFX. Unchanged sources (same mtime, size
+    and settings) reuse their cached result; the rest run on a process pool.
+    """
+    started = time.perf_counter()
+    if platform not in PLATFORM_SETTINGS:
+        return {"success": False, "error": f"Unknown platform '{platform}'. Options: {', '.join(PLATFORM_SETTINGS)}"}
+
+    if source_dirs:
+        dirs = [root / d for d in source_dirs]
+        missing = [str(d) for d in dirs if not d.is_dir()]
+        if missing:
+            return {"success": False, "error": f"Source folder not found: {', '.join(missing)}"}
+    else:
+        # The default SFX/Music folders only exist once something has been imported into them
+        dirs = [root / d for d in DEFAULT_AUDIO_DIRS if (root / d).is_dir()]
+
+    platform_settings = PLATFORM_SETTINGS[platform]
+    out = root / output_dir / platform
+    out.mkdir(parents=True, exist_ok=True)
+    cache_path = out / CACHE_FILE
+    try:
+        cache = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        cache = {}
+
+    results, stale = {}, []
+    for base in dirs:
+        for path in sorted(p for p in base.rglob("*") if p.suffix.lower() == ".wav"):
+            rel = path.relative_to(root).as_posix() if path.is_relative_to(root) else str(path)
+            category = "music" if "music" in (part.lower() for part in path.relative_to(base.parent).parts[:-1]) else "sfx"
+            settings = {
+                "category": category,
+                "rate": platform_settings[f"{category}_rate"],
+                "mono": category == "sfx" and platform_settings["mono_sfx"],
+                "target_db": LOUDNESS_TARGETS[category] if target_db is None else target_db,
+                "trim": trim,
+                "silence_db": silence_db,
+                "version": PIPELINE_VERSION,
+            }
+            settings_key = hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:16]
+            target = out / base.name / path.relative_to(base)
+            stat = path.stat()
+            stamp = [stat.st_mtime_ns, stat.st_size, settings_key]
+            entry = cache.get(rel)
+            if entry and entry["stamp"] == stamp and Path(entry["result"]["output"]).exists():
+                results[rel] = dict(entry["result"], cached=True)
+            else:
+                stale.append((rel, str(path), str(target), stamp, settings))
+
+    errors = {}
+    if len(stale) >= POOL_MIN_FILES and (workers is None or workers > 1):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(process_audio, source, target, settings) for _, source, target, _, settings in stale]
+            processed = [_result(future.result) for future in futures]
+    else:
+        processed = [_result(process_audio, source, target, settings) for _, source, target, _, settings in stale]
+
+    for (rel, _, _, stamp, _), result in zip(stale, processed):
+        if "error" in result:
+            errors[rel] = result["error"]
+            continue
+        cache[rel] = {"stamp": stamp, "result": result}
+        results[rel] = dict(result, cached=False)
+    cache = {rel: entry for rel, entry in cache.items() if rel in results}
+    cache_path.write_text(json.dumps(cache))
+
+    source_bytes = sum(r["source_bytes"] for r in results.values())
+    output_bytes = sum(r["output_bytes"] for r in results.values())
+    return {
+        "success": not errors,
+        "platform": platform,
+        "settings": platform_settings,
+        "files": len(results),
+        "processed": len(stale) - len(errors),
+        "cached": len(results) - len(stale) + len(errors),
+        "errors": errors,
+        "asset_size_mb": round(output_bytes / 1048576, 4),
+        "source_size_mb": round(source_bytes / 1048576, 4),
+        "compression_ratio": round(source_bytes / output_bytes, 3) if output_bytes else None,
+        "import_time": round(time.perf_counter() - started, 3),
+        "output_dir": out.relative_to(root).as_posix() if out.is_relative_to(root) else str(out),
+        "clips": {rel: {k: r[k] for k in ("category", "rate", "channels", "seconds", "trimmed_seconds",
+                                          "gain_db", "output_bytes", "cached")}
+                  for rel, r in sorted(results.items())},
+    }
+
+
+def _result(fn, *args) -> dict:
+    """Call fn, turning a bad file into an error entry instead of failing the batch."""
+    try:
+        return fn(*args)
+    except (OSError, ValueError, KeyError, struct.error) as e:
+        return {"error": str(e)}
+
+
+# =============================================================================
+# PROCEDURAL CLIP BAKING
+# =============================================================================
+
+# Sample rate ProceduralAudio synthesizes at
+BAKE_RATE = 44100
+
+# Seed for the noise component so re-baking produces identical files
+BAKE_SEED = 1
+
+
+def swish(duration: float, start_freq: float, end_freq: float, rng: np.random.Generator) -> np.ndarray:
+    """ProceduralAudio.GenerateSwishSound: falling tone plus noise under a sine fade."""
+    i, t = _timeline(duration)
+    freq = start_freq + (end_freq - start_freq) * t
+    amplitude = np.sin(t * np.pi) * 0.5
+    noise = (rng.random(len(i)) * 2 - 1) * 0.3
+    return (np.sin(2 * np.pi * freq * i / BAKE_RATE) * 0.5 + noise) * amplitude
+
+
+def impact(duration: float, freq: float, intensity: float, rng: np.random.Generator) -> np.ndarray:
+    """ProceduralAudio.GenerateImpactSound: low thump and noise burst under an exponential decay."""
+    i, t = _timeline(duration)
+    envelope = np.exp(-t * 10) * intensity
+    noise = rng.random(len(i)) * 2 - 1
+    thump = np.sin(2 * np.pi * freq * i / BAKE_RATE)
+    return (thump * 0.6 + noise * 0.4) * envelope
+
+
+def _timeline(duration: float) -> tuple[np.ndarray, np.ndarray]:
+    """Sample indices and normalized time, sized like the C# (int)(duration * sampleRate)."""
+    samples = int(np.float32(duration) * np.float32(BAKE_RATE))
+    i = np.arange(samples, dtype=np.float64)
+    return i, i / samples
+
+
+# Clip name -> generator and arguments, as registered in ProceduralAudio.GenerateAllSounds
+BAKED_CLIPS = {
+    "PlayerAttack1": (swish, (0.15, 800.0, 400.0)),
+    "PlayerAttack2": (swish, (0.15, 900.0, 350.0)),
+    "PlayerAttack3": (swish, (0.2, 1000.0, 300.0)),
+    "BossSweep": (swish, (0.3, 400.0, 150.0)),
+    "PlayerHit": (impact, (0.2, 200.0, 0.8)),
+    "BossSlam": (impact, (0.4, 80.0, 1.0)),
+    "BossHurt": (impact, (0.25, 150.0, 0.7)),
+}
+
+
+def bake_clips(names: list[str] = None, output_dir: str = DEFAULT_BAKE_DIR, seed: int = BAKE_SEED,
+               root: Path = PROJECT_ROOT) -> dict:
+    """Render ProceduralAudio clips to 16-bit mono WAVs so the game loads instead of synthesizing them."""
+    names = names or list(BAKED_CLIPS)
+    unknown = [name for name in names if name not in BAKED_CLIPS]
+    if unknown:
+        return {"success": False, "error": f"Unknown clip(s): {', '.join(unknown)}. Options: {', '.join(BAKED_CLIPS)}"}
+
+    out = root / output_dir
+    out.mkdir(parents=True, exist_ok=True)
+    files = {}
+    for name in names:
+        generate, params = BAKED_CLIPS[name]
+        # Seeded per clip so baking a subset gives the same bytes as baking everything
+        rng = np.random.default_rng([seed, int.from_bytes(hashlib.sha256(name.encode()).digest()[:4], "little")])
+        samples = generate(*params, rng).astype(np.float32)
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as writer:
+            writer.setnchannels(1)
+            writer.setsampwidth(2)
+            writer.setframerate(BAKE_RATE)
+            writer.writeframes(_to_pcm16(samples))
+        path = out / f"{name}.wav"
+        files[path.relative_to(root).as_posix() if path.is_relative_to(root) else str(path)] = {
+            "status": _write_if_changed(path, buffer.getvalue()),
+            "seconds": round(len(samples) / BAKE_RATE, 3),
+            "bytes": len(buffer.getvalue()),
+        }
+
+    return {
+        "success": True,
+        "clips": len(files),
+        "sample_rate": BAKE_RATE,
+        "output_dir": out.relative_to(root).as_posix() if out.is_relative_to(root) else str(out),
+        "files": files,
+    }
+
+
+def _write_if_changed(path: Path, data: bytes) -> str:
+    """Write data unless the file already holds it, so Unity only reimports changed clips."""
+    if not path.exists():
+        path.write_bytes(data)
+        return "created"
+    if path.stat().st_size == len(data) and path.read_bytes() == data:
+        return "unchanged"
+    path.write_bytes(data)
+    return "modified"
+
+
+def _replace_if_changed(temp: Path, path: Path) -> str:
+    """Move a finished temp file into place unless the existing output is byte-identical."""
+    if path.exists() and path.stat().st_size == temp.stat().st_size and _digest(path) == _digest(temp):
+        temp.unlink()
+        return "unchanged"
+    status = "modified" if path.exists() else "created"
+    temp.replace(path)
+    return status
+
+
+def _digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command")
+
+    audio = commands.add_parser("optimize", help="Trim, normalize and resample WAVs for a target platform")
+    audio.add_argument("dirs", nargs="*", help=f"Audio folders relative to the project root (default {', '.join(DEFAULT_AUDIO_DIRS)})")
+    audio.add_argument("--platform", choices=sorted(PLATFORM_SETTINGS), default="pc")
+    audio.add_argument("--out", default=DEFAULT_OUTPUT_DIR)
+    audio.add_argument("--target-db", type=float, help="RMS loudness target in dBFS (default per category)")
+    audio.add_argument("--silence-db", type=float, default=SILENCE_THRESHOLD_DB)
+    audio.add_argument("--no-trim", action="store_true")
+    audio.add_argument("--workers", type=int)
+
+    bake = commands.add_parser("bake", help="Render ProceduralAudio swish and impact clips to WAV files")
+    bake.add_argument("clips", nargs="*", help=f"Clip names (default all: {', '.join(BAKED_CLIPS)})")
+    bake.add_argument("--out", default=DEFAULT_BAKE_DIR)
+    bake.add_argument("--seed", type=int, default=BAKE_SEED)
+
+    args = parser.parse_args()
+    if args.command == "bake":
+        result = bake_clips(args.clips or None, args.out, args.seed)
+    elif args.command == "optimize":
+        result = optimize(args.platform, args.dirs or None, args.out, args.target_db, not args.no_trim,
+                          args.silence_db, args.workers)
+    else:
+        result = optimize()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,551 @@
 #!/usr/bin/env python3
+"""
+Memory Analyzer
+Asset memory budget report for a Unity project: estimated GPU memory of every
+texture and loaded size of every audio clip under the platform's import
+settings (.meta), checked against per-platform budgets.
+"""
+
+import argparse
+import heapq
 import json
-def analyze(): return {"strategies": ["pooling", "streaming"], "tools": ["heap_analysis", "leak_detection"]}
-if __name__ == "__main__": print(json.dumps(analyze(), indent=2))
+import math
+import os
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+DEFAULT_ASSET_DIR = "src/Assets"
+
+# Per-file facts (dimensions, clip length, import settings) keyed by path; builds/ is not versioned
+DEFAULT_CACHE_FILE = "builds/.asset_budget_cache.json"
+
+TEXTURE_SUFFIXES = {".png", ".jpg", ".jpeg", ".tga", ".bmp", ".gif", ".psd", ".tif", ".tiff"}
+AUDIO_SUFFIXES = {".wav", ".ogg", ".mp3"}
+
+# Loaded-asset budgets in MB, sized from the VRAM guidelines in SKILL.md
+# (WebGL shares one browser heap, mobile VRAM starts at 512 MB, PC low-end at 2 GB)
+PLATFORM_BUDGETS = {
+    "webgl": {"textures_mb": 256, "audio_mb": 64},
+    "mobile": {"textures_mb": 512, "audio_mb": 96},
+    "pc": {"textures_mb": 2048, "audio_mb": 256},
+}
+
+# Unity build target names in .meta files per platform; the first one present wins
+TEXTURE_TARGETS = {"webgl": ["WebGL"], "mobile": ["Android", "iPhone"], "pc": ["Standalone"]}
+AUDIO_TARGET_GROUPS = {"webgl": ["13"], "mobile": ["7", "4"], "pc": ["1"]}
+
+# TextureImporterFormat -> (block width, block height, bytes per block)
+TEXTURE_FORMATS = {
+    1: ("Alpha8", 1, 1, 1), 2: ("ARGB16", 1, 1, 2), 3: ("RGB24", 1, 1, 3), 4: ("RGBA32", 1, 1, 4),
+    5: ("ARGB32", 1, 1, 4), 7: ("RGB565", 1, 1, 2), 9: ("R16", 1, 1, 2), 10: ("DXT1", 4, 4, 8),
+    12: ("DXT5", 4, 4, 16), 13: ("RGBA4444", 1, 1, 2), 14: ("BGRA32", 1, 1, 4), 15: ("RHalf", 1, 1, 2),
+    16: ("RGHalf", 1, 1, 4), 17: ("RGBAHalf", 1, 1, 8), 18: ("RFloat", 1, 1, 4), 19: ("RGFloat", 1, 1, 8),
+    20: ("RGBAFloat", 1, 1, 16), 22: ("RGB9e5", 1, 1, 4), 24: ("BC6H", 4, 4, 16), 25: ("BC7", 4, 4, 16),
+    26: ("BC4", 4, 4, 8), 27: ("BC5", 4, 4, 16), 28: ("DXT1Crunched", 4, 4, 8), 29: ("DXT5Crunched", 4, 4, 16),
+    30: ("PVRTC_RGB2", 8, 4, 8), 31: ("PVRTC_RGBA2", 8, 4, 8), 32: ("PVRTC_RGB4", 4, 4, 8),
+    33: ("PVRTC_RGBA4", 4, 4, 8), 34: ("ETC_RGB4", 4, 4, 8), 41: ("EAC_R", 4, 4, 8), 43: ("EAC_RG", 4, 4, 16),
+    45: ("ETC2_RGB4", 4, 4, 8), 46: ("ETC2_RGB4_PUNCHTHROUGH_ALPHA", 4, 4, 8), 47: ("ETC2_RGBA8", 4, 4, 16),
+    48: ("ASTC_4x4", 4, 4, 16), 49: ("ASTC_5x5", 5, 5, 16), 50: ("ASTC_6x6", 6, 6, 16),
+    51: ("ASTC_8x8", 8, 8, 16), 52: ("ASTC_10x10", 10, 10, 16), 53: ("ASTC_12x12", 12, 12, 16),
+    62: ("RG16", 1, 1, 2), 63: ("R8", 1, 1, 1), 64: ("ETC_RGB4Crunched", 4, 4, 8), 65: ("ETC2_RGBA8Crunched", 4, 4, 16),
+}
+
+# What Automatic (-1) resolves to per platform: textureCompression (0 none, 1 normal, 2 high, 3 low) -> (opaque, alpha)
+AUTOMATIC_FORMATS = {
+    "webgl": {0: (3, 4), 1: (10, 12), 2: (10, 12), 3: (10, 12)},
+    "mobile": {0: (3, 4), 1: (50, 50), 2: (48, 48), 3: (51, 51)},
+    "pc": {0: (3, 4), 1: (10, 12), 2: (25, 25), 3: (10, 12)},
+}
+
+# AudioImporter loadType and compressionFormat values
+LOAD_DECOMPRESS, LOAD_COMPRESSED, LOAD_STREAMING = 0, 1, 2
+FORMAT_PCM, FORMAT_VORBIS, FORMAT_ADPCM = 0, 1, 2
+LOAD_TYPES = {LOAD_DECOMPRESS: "DecompressOnLoad", LOAD_COMPRESSED: "CompressedInMemory", LOAD_STREAMING: "Streaming"}
+
+# MP3 Layer III bitrates in kbps by header index (MPEG-1, MPEG-2/2.5)
+MP3_BITRATES_V1 = [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320]
+MP3_BITRATES_V2 = [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160]
+
+# Resident buffer of a streamed clip
+STREAM_BUFFER_BYTES = 200 * 1024
+
+# Decoded clips longer than this should stream or stay compressed
+LONG_CLIP_SECONDS = 10.0
+
+# Bump when the cached per-file facts change shape
+CACHE_VERSION = 1
+
+# Threads for the directory walk and for reading headers of changed files
+SCAN_WORKERS = 8
+
+
+# =============================================================================
+# META FILES
+# =============================================================================
+
+def parse_meta(text: str) -> dict:
+    """Minimal block-YAML reader for .meta files: nested mappings and lists of mappings."""
+    root: dict = {}
+    stack: list[tuple[int, object]] = [(-1, root)]
+    pending: Optional[tuple[int, dict, str]] = None
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#") or stripped == "---" or stripped.startswith("%"):
+            continue
+        indent = len(line) - len(line.lstrip(" "))
+        item = stripped.startswith("- ")
+        if item:
+            stripped = stripped[2:]
+            indent += 2
+
+        if pending:
+            # A bare "key:" opens a list when the next line is an item, a mapping otherwise
+            parent_indent, parent, key = pending
+            parent[key] = [] if item else {}
+            stack.append((parent_indent, parent[key]))
+            pending = None
+        while stack[-1][0] >= indent and len(stack) > 1:
+            stack.pop()
+
+        container = stack[-1][1]
+        if item:
+            while not isinstance(container, list) and len(stack) > 1:
+                stack.pop()
+                container = stack[-1][1]
+            if not isinstance(container, list):
+                continue
+            entry: dict = {}
+            container.append(entry)
+            stack.append((indent - 1, entry))
+            container = entry
+        if not isinstance(container, dict) or ":" not in stripped:
+            continue
+        key, _, value = stripped.partition(":")
+        value = value.strip()
+        if value:
+            container[key.strip()] = value
+        else:
+            pending = (indent, container, key.strip())
+    return root
+
+
+def _int(value, default: int = 0) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def texture_import(meta: dict) -> dict:
+    """Settings that decide a texture's GPU size, per platform (overrides fall back to the default)."""
+    importer = meta.get("TextureImporter", {})
+    mipmaps = importer.get("mipmaps", {})
+    platforms = {entry.get("buildTarget"): entry for entry in importer.get("platformSettings", []) or []
+                 if isinstance(entry, dict)}
+    default = platforms.get("DefaultTexturePlatform", {})
+    base = {
+        "max_size": _int(default.get("maxTextureSize", importer.get("maxTextureSize")), 2048),
+        "format": _int(default.get("textureFormat"), -1),
+        "compression": _int(default.get("textureCompression", importer.get("textureCompression")), 1),
+        "crunched": _int(default.get("crunchedCompression")) == 1,
+    }
+
+    settings = {}
+    for platform, targets in TEXTURE_TARGETS.items():
+        chosen = dict(base)
+        for target in targets:
+            entry = platforms.get(target)
+            if entry and _int(entry.get("overridden")) == 1:
+                chosen.update(max_size=_int(entry.get("maxTextureSize"), base["max_size"]),
+                              format=_int(entry.get("textureFormat"), -1),
+                              compression=_int(entry.get("textureCompression"), base["compression"]),
+                              crunched=_int(entry.get("crunchedCompression")) == 1)
+                break
+        settings[platform] = chosen
+    return {
+        "mipmaps": _int(mipmaps.get("enableMipMap"), 1) == 1,
+        "alpha_usage": _int(importer.get("alphaUsage"), 1),
+        "npot_scale": _int(importer.get("nPOTScale"), 1),
+        "texture_type": _int(importer.get("textureType"), 0),
+        "readable": _int(importer.get("isReadable")) == 1,
+        "platforms": settings,
+    }
+
+
+def audio_import(meta: dict) -> dict:
+    """Load type, compression and rate per platform (overrides fall back to the default settings)."""
+    importer = meta.get("AudioImporter", {})
+    default = importer.get("defaultSettings", {})
+    base = {
+        "load_type": _int(default.get("loadType"), LOAD_DECOMPRESS),
+        "compression": _int(default.get("compressionFormat"), FORMAT_VORBIS),
+        "quality": float(default.get("quality", 1) or 1),
+        "rate_setting": _int(default.get("sampleRateSetting")),
+        "rate_override": _int(default.get("sampleRateOverride"), 44100),
+    }
+    overrides = importer.get("platformSettingOverrides")
+    overrides = overrides if isinstance(overrides, dict) else {}
+
+    settings = {}
+    for platform, groups in AUDIO_TARGET_GROUPS.items():
+        chosen = dict(base)
+        for group in groups:
+            entry = overrides.get(group)
+            if isinstance(entry, dict):
+                chosen.update(load_type=_int(entry.get("loadType"), base["load_type"]),
+                              compression=_int(entry.get("compressionFormat"), base["compression"]),
+                              quality=float(entry.get("quality", base["quality"]) or base["quality"]),
+                              rate_setting=_int(entry.get("sampleRateSetting"), base["rate_setting"]),
+                              rate_override=_int(entry.get("sampleRateOverride"), base["rate_override"]))
+                break
+        settings[platform] = chosen
+    return {"force_mono": _int(importer.get("forceToMono")) == 1, "platforms": settings}
+
+
+# =============================================================================
+# FILE HEADERS
+# =============================================================================
+
+def texture_header(path: Path) -> tuple[int, int, bool]:
+    """Width, height and whether the image carries alpha, without decoding pixels."""
+    if path.suffix.lower() == ".psd":
+        with open(path, "rb") as f:
+            header = f.read(26)
+        if header[:4] != b"8BPS":
+            raise ValueError("Not a PSD file")
+        channels, height, width = struct.unpack(">HII", header[12:22])
+        return width, height, channels >= 4
+    with Image.open(path) as image:
+        alpha = image.mode in ("RGBA", "LA", "PA", "RGBa", "La") or "transparency" in image.info
+        return image.width, image.height, alpha
+
+
+def audio_header(path: Path) -> tuple[int, int, int]:
+    """Frames, sample rate and channels read from the file header (MP3 length is estimated)."""
+    suffix = path.suffix.lower()
+    with open(path, "rb") as f:
+        if suffix == ".wav":
+            riff, _, form = struct.unpack("<4sI4s", f.read(12))
+            if riff != b"RIFF" or form != b"WAVE":
+                raise ValueError("Not a RIFF/WAVE file")
+            fmt = None
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    raise ValueError("WAV file has no data chunk")
+                chunk_id, size = struct.unpack("<4sI", header)
+                if chunk_id == b"fmt ":
+                    _, channels, rate, _, block_align = struct.unpack("<HHIIH", f.read(14))
+                    fmt = (rate, channels, block_align)
+                    f.seek(size - 14 + (size & 1), 1)
+                elif chunk_id == b"data" and fmt:
+                    size = min(size, os.fstat(f.fileno()).st_size - f.tell())
+                    return size // fmt[2], fmt[0], fmt[1]
+                else:
+                    f.seek(size + (size & 1), 1)
+
+        if suffix == ".ogg":
+            head = f.read(64)
+            if head[:4] != b"OggS" or head[29:35] != b"vorbis":
+                raise ValueError("Not an Ogg Vorbis file")
+            if len(head) < 44:
+                raise ValueError("Truncated Vorbis identification header")
+            channels, rate = head[39], struct.unpack("<I", head[40:44])[0]
+            # The last page's granule position is the total sample count
+            f.seek(max(0, os.fstat(f.fileno()).st_size - 65536))
+            tail = f.read()
+            last = tail.rfind(b"OggS")
+            frames = struct.unpack("<q", tail[last + 6:last + 14])[0] if last >= 0 else 0
+            return max(frames, 0), rate, channels
+
+        # MP3: bitrate and rate from the first frame header, length from the file size
+        data = f.read(65536)
+        if data[:3] == b"ID3" and len(data) < 10:
+            raise ValueError("Truncated ID3 header")
+        start = 10 + ((data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]) if data[:3] == b"ID3" else 0
+        if start:
+            f.seek(start)
+            data = f.read(65536)
+        for i in range(len(data) - 4):
+            if data[i] == 0xFF and data[i + 1] & 0xE0 == 0xE0:
+                version = (data[i + 1] >> 3) & 3
+                bitrate_index, rate_index = data[i + 2] >> 4, (data[i + 2] >> 2) & 3
+                if bitrate_index in (0, 15) or rate_index == 3:
+                    continue
+                mpeg1 = version == 3
+                bitrate = (MP3_BITRATES_V1 if mpeg1 else MP3_BITRATES_V2)[bitrate_index] * 1000
+                rate = (44100, 48000, 32000)[rate_index] >> (0 if mpeg1 else 1 if version == 2 else 2)
+                channels = 1 if data[i + 3] >> 6 == 3 else 2
+                audio_bytes = os.fstat(f.fileno()).st_size - start - i
+                return int(audio_bytes * 8 / bitrate * rate), rate, channels
+        raise ValueError("No MP3 frame header found")
+
+
+
+def inspect_file(path: str, meta_path: Optional[str], kind: str) -> dict:
+    """Header facts plus parsed import settings for one asset; what gets cached."""
+    meta = {}
+    if meta_path:
+        with open(meta_path, encoding="utf-8", errors="replace") as f:
+            meta = parse_meta(f.read())
+    if kind == "texture":
+        width, height, alpha = texture_header(Path(path))
+        return {"kind": kind, "width": width, "height": height, "alpha": alpha, "import": texture_import(meta)}
+    frames, rate, channels = audio_header(Path(path))
+    return {"kind": kind, "frames": frames, "rate": rate, "channels": channels, "import": audio_import(meta)}
+
+
+# =============================================================================
+# MEMORY ESTIMATES
+# =============================================================================
+
+def _import_size(width: int, height: int, max_size: int, npot_scale: int) -> tuple[int, int]:
+    """Dimensions after the importer's power-of-two scaling and max size clamp."""
+    if npot_scale and (width & (width - 1) or height & (height - 1)):
+        def pot(value: int) -> int:
+            larger = 1 << max(0, (value - 1).bit_length())
+            if npot_scale == 2:
+                return larger
+            if npot_scale == 3:
+                return larger if larger == value else larger >> 1
+            return larger if larger - value <= value - (larger >> 1) else larger >> 1
+        width, height = pot(width), pot(height)
+    scale = min(1.0, max_size / max(width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def texture_memory(facts: dict, platform: str) -> dict:
+    """GPU bytes for a texture on a platform: imported size x format x mip chain."""
+    settings = facts["import"]["platforms"][platform]
+    # Sprites (textureType 8) keep their size; other textures scale to a power of two
+    npot = 0 if facts["import"]["texture_type"] == 8 else facts["import"]["npot_scale"]
+    width, height = _import_size(facts["width"], facts["height"], settings["max_size"], npot)
+
+    fmt = settings["format"]
+    if fmt not in TEXTURE_FORMATS:
+        alpha = facts["alpha"] and facts["import"]["alpha_usage"] != 0
+        fmt = AUTOMATIC_FORMATS[platform].get(settings["compression"], AUTOMATIC_FORMATS[platform][1])[1 if alpha else 0]
+    name, block_w, block_h, block_bytes = TEXTURE_FORMATS[fmt]
+
+    total, w, h, levels = 0, width, height, 0
+    while True:
+        total += math.ceil(w / block_w) * math.ceil(h / block_h) * block_bytes
+        levels += 1
+        if not facts["import"]["mipmaps"] or (w == 1 and h == 1):
+            break
+        w, h = max(1, w // 2), max(1, h // 2)
+    # Read/write textures keep a CPU copy as well
+    if facts["import"]["readable"]:
+        total *= 2
+
+    hints = []
+    if block_w == 1 and fmt not in (1, 63):
+        hints.append(f"uncompressed {name}; enable compression")
+    if facts["import"]["mipmaps"] and facts["import"]["texture_type"] == 8:
+        hints.append("mipmaps on a 2D sprite")
+    if facts["import"]["readable"]:
+        hints.append("Read/Write enabled doubles memory")
+    if max(facts["width"], facts["height"]) > settings["max_size"]:
+        hints.append(f"source {facts['width']}x{facts['height']} exceeds max size {settings['max_size']}")
+    return {"bytes": total, "size": f"{width}x{height}", "format": name, "mips": levels, "hints": hints}
+
+
+def audio_memory(facts: dict, platform: str) -> dict:
+    """Resident bytes for a clip on a platform, by load type and compression."""
+    settings = facts["import"]["platforms"][platform]
+    channels = 1 if facts["import"]["force_mono"] else facts["channels"]
+    rate = settings["rate_override"] if settings["rate_setting"] == 2 else facts["rate"]
+    seconds = facts["frames"] / facts["rate"] if facts["rate"] else 0.0
+    pcm = int(seconds * rate) * channels * 2
+
+    if settings["compression"] == FORMAT_PCM:
+        compressed = pcm
+    elif settings["compression"] == FORMAT_ADPCM:
+        compressed = int(pcm / 3.5)
+    else:
+        # Vorbis at quality 0..1 lands roughly between 32 and 192 kbps per channel
+        compressed = int(seconds * channels * (32000 + 160000 * settings["quality"]) / 8)
+
+    load_type = settings["load_type"]
+    if load_type == LOAD_STREAMING:
+        total = min(STREAM_BUFFER_BYTES, compressed)
+    elif load_type == LOAD_COMPRESSED:
+        total = compressed
+    else:
+        total = pcm
+
+    hints = []
+    if load_type == LOAD_DECOMPRESS and seconds > LONG_CLIP_SECONDS:
+        hints.append(f"{seconds:.0f}s clip decompressed on load; use Streaming or CompressedInMemory")
+    if channels > 1 and seconds <= LONG_CLIP_SECONDS and not facts["import"]["force_mono"]:
+        hints.append("stereo short clip; consider Force To Mono")
+    return {"bytes": total, "seconds": round(seconds, 2), "rate": rate, "channels": channels,
+            "load_type": LOAD_TYPES.get(load_type, str(load_type)), "hints": hints}
+
+
+# =============================================================================
+# SCAN AND REPORT
+# =============================================================================
+
+def scan_assets(base: Path, workers: int = SCAN_WORKERS) -> list[tuple[str, list[int], Optional[str]]]:
+    """(path, stamp, .meta path) for every texture/audio file below base, walking directories on a thread pool.
+
+    The stamp is the mtime and size of the asset and of its .meta, both taken
+    from the directory listing.
+    """
+    found, frontier = [], [base]
+    suffixes = TEXTURE_SUFFIXES | AUDIO_SUFFIXES
+
+    def list_dir(directory: Path) -> tuple[list, list]:
+        assets, metas, subdirs = [], {}, []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith("."):
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(".meta"):
+                        metas[entry.name[:-5]] = entry
+                    elif os.path.splitext(entry.name)[1].lower() in suffixes:
+                        assets.append(entry)
+            files = []
+            for entry in assets:
+                stat, meta = entry.stat(), metas.get(entry.name)
+                meta_stat = meta.stat() if meta else None
+                stamp = [stat.st_mtime_ns, stat.st_size,
+                         meta_stat.st_mtime_ns if meta_stat else 0, meta_stat.st_size if meta_stat else 0]
+                files.append((entry.path, stamp, meta.path if meta else None))
+        except OSError:
+            return [], []
+        return files, subdirs
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while frontier:
+            next_frontier = []
+            for files, subdirs in pool.map(list_dir, frontier):
+                found.extend(files)
+                next_frontier.extend(subdirs)
+            frontier = next_frontier
+    return sorted(found)
+
+
+def analyze(platform: str = "all", asset_dir: str = DEFAULT_ASSET_DIR, top: int = 10,
+            cache_file: str = DEFAULT_CACHE_FILE, root: Path = PROJECT_ROOT) -> dict:
+    """Estimate texture and audio memory per platform and list the largest offenders.
+
+    Header facts and parsed .meta settings are cached per file keyed by the
+    mtime and size of both the asset and its .meta, so a warm report only
+    stats the tree.
+    """
+    started = time.perf_counter()
+    platforms = list(PLATFORM_BUDGETS) if platform == "all" else [platform]
+    unknown = [p for p in platforms if p not in PLATFORM_BUDGETS]
+    if unknown:
+        return {"success": False, "error": f"Unknown platform '{platform}'. Options: all, {', '.join(PLATFORM_BUDGETS)}"}
+    base = root / asset_dir
+    if not base.is_dir():
+        return {"success": False, "error": f"Asset folder not found: {asset_dir}"}
+
+    cache_path = root / cache_file
+    try:
+        cache = json.loads(cache_path.read_text())
+        entries = cache.get("files", {}) if cache.get("version") == CACHE_VERSION else {}
+    except (OSError, ValueError):
+        entries = {}
+
+    prefix = str(root).rstrip(os.sep) + os.sep
+    facts, stale = {}, []
+    for path, stamp, meta_path in scan_assets(base):
+        rel = path[len(prefix):].replace(os.sep, "/") if path.startswith(prefix) else path
+        entry = entries.get(rel)
+        if entry and entry["stamp"] == stamp:
+            facts[rel] = entry["facts"]
+        else:
+            kind = "texture" if os.path.splitext(path)[1].lower() in TEXTURE_SUFFIXES else "audio"
+            stale.append((rel, path, meta_path, kind, stamp))
+
+    errors = {}
+    if stale:
+        def inspect(item: tuple) -> dict:
+            try:
+                result = inspect_file(item[1], item[2], item[3])
+            except (OSError, ValueError, struct.error) as e:
+                return {"error": str(e)}
+            # Estimates depend only on the cached facts, so they are cached with them
+            estimate = texture_memory if result["kind"] == "texture" else audio_memory
+            result["estimates"] = {name: estimate(result, name) for name in PLATFORM_BUDGETS}
+            return result
+
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            for item, result in zip(stale, pool.map(inspect, stale)):
+                if "error" in result:
+                    errors[item[0]] = result["error"]
+                else:
+                    facts[item[0]] = result
+                    entries[item[0]] = {"stamp": item[4], "facts": result}
+
+    if stale or len(entries) != len(facts):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": CACHE_VERSION, "files": {rel: entries[rel] for rel in facts}}))
+        os.replace(tmp, cache_path)
+
+    report = {}
+    for name in platforms:
+        totals = {"texture": 0, "audio": 0}
+        for item in facts.values():
+            totals[item["kind"]] += item["estimates"][name]["bytes"]
+        budget = PLATFORM_BUDGETS[name]
+        usage = {
+            "textures": _budget_line(totals["texture"], budget["textures_mb"]),
+            "audio": _budget_line(totals["audio"], budget["audio_mb"]),
+        }
+        largest = heapq.nlargest(top, facts.items(), key=lambda pair: pair[1]["estimates"][name]["bytes"])
+        report[name] = {
+            "within_budget": all(line["within_budget"] for line in usage.values()),
+            "budget": usage,
+            "top_offenders": [
+                {"path": rel, "kind": item["kind"], "mb": round(item["estimates"][name]["bytes"] / 1048576, 3),
+                 **{k: v for k, v in item["estimates"][name].items() if k != "bytes"}}
+                for rel, item in largest
+            ],
+        }
+
+    return {
+        "success": True,
+        "asset_dir": asset_dir,
+        "textures": sum(1 for item in facts.values() if item["kind"] == "texture"),
+        "audio_clips": sum(1 for item in facts.values() if item["kind"] == "audio"),
+        "inspected": len(stale) - len(errors),
+        "cached": len(facts) - len(stale) + len(errors),
+        "errors": errors,
+        "platforms": report,
+        "scan_time": round(time.perf_counter() - started, 3),
+    }
+
+
+def _budget_line(used: int, budget_mb: float) -> dict:
+    used_mb = used / 1048576
+    return {"used_mb": round(used_mb, 3), "budget_mb": budget_mb,
+            "percent": round(100 * used_mb / budget_mb, 1), "within_budget": used_mb <= budget_mb}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--platform", choices=["all", *PLATFORM_BUDGETS], default="all")
+    parser.add_argument("--dir", default=DEFAULT_ASSET_DIR, help="Asset folder relative to the project root")
+    parser.add_argument("--top", type=int, default=10, help="Largest assets to list per platform")
+    args = parser.parse_args()
+    print(json.dumps(analyze(args.platform, args.dir, args.top), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,905 @@
 #!/usr/bin/env python3
+"""
+Performance Analyzer
+Static hot-path lint for Unity C#, Godot GDScript and Phaser JavaScript:
+allocations, lookups and string building in per-frame callbacks, scene
+lookups in loops, and spawn/destroy churn that bypasses pooling. Findings
+are ranked and cached per file content hash.
+"""
+
+import argparse
+import hashlib
 import json
-def analyze(): return {"areas": ["cpu", "gpu", "memory"], "techniques": ["profiling", "batching", "lod"]}
-if __name__ == "__main__": print(json.dumps(analyze(), indent=2))
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+DEFAULT_SOURCE_DIRS = ["src"]
+
+# Per-file findings keyed by content hash; builds/ is not versioned
+DEFAULT_CACHE_FILE = "builds/.perf_cache.json"
+
+# Bump when rules or finding fields change so cached results are redone
+CACHE_VERSION = 5
+
+# Editor-only code (Unity Editor folders), engine caches, third-party code and build output
+SKIP_DIRS = {"Editor", "Library", "Temp", "Packages", "Plugins", "addons", "node_modules", "dist"}
+
+# Fewer stale files than this are analyzed in-process
+POOL_MIN_FILES = 4
+
+# Callbacks the engine invokes every frame (or every physics step / GUI event)
+HOT_METHODS = {
+    "Update", "FixedUpdate", "LateUpdate", "OnGUI", "OnRenderObject", "OnWillRenderObject",
+    "OnTriggerStay", "OnTriggerStay2D", "OnCollisionStay", "OnCollisionStay2D",
+}
+GD_HOT_FUNCS = {"_process", "_physics_process", "_integrate_forces"}
+JS_HOT_METHODS = {"update", "preUpdate", "postUpdate"}
+
+# Where each language caches lookups once, quoted in finding messages
+SETUP_HOOKS = {"csharp": "Awake/Start", "gdscript": "_ready", "javascript": "create"}
+
+# Callbacks the engine invokes once per object; loops reached only from these build
+# the scene or UI once and are not counted as loops
+SETUP_METHODS = {
+    "csharp": {"Awake", "Start", "OnEnable", "Reset", "OnValidate"},
+    "gdscript": {"_init", "_ready", "_enter_tree"},
+    "javascript": {"constructor", "init", "preload", "create"},
+}
+
+# One-shot input checks: a branch they guard runs on that press, not every frame
+EDGE_TRIGGERS = {
+    "csharp": {
+        "GetKeyDown", "GetKeyUp", "GetButtonDown", "GetButtonUp", "GetMouseButtonDown", "GetMouseButtonUp",
+        "WasPressedThisFrame", "WasReleasedThisFrame", "WasPerformedThisFrame",
+    },
+    "gdscript": {"is_action_just_pressed", "is_action_just_released"},
+    "javascript": {"JustDown", "JustUp"},
+}
+# Callback registrations: code in their arguments runs when the event fires
+LISTENER_CALLS = {
+    "csharp": {"AddListener", "RegisterCallback"},
+    "gdscript": {"connect"},
+    "javascript": {"on", "once", "addEventListener"},
+}
+
+# rule -> (weight, message); a finding scores weight x (1 + 2 if per frame + 1 if in a loop)
+RULES = {
+    "instantiate_without_pool": (5, "{detail} without pooling; reuse instances from a pool"),
+    "destroy_without_pool": (4, "{detail} per object; return it to a pool instead"),
+    "find_in_hot_path": (4, "{detail} searches the scene; cache the result in {setup}"),
+    "get_component_in_hot_path": (3, "{detail} lookup; cache the component in {setup}"),
+    "allocation_per_frame": (3, "allocates a new {detail}; hoist it out of the hot path or reuse one instance"),
+    "linq_per_frame": (3, "LINQ .{detail}() allocates enumerators and closures"),
+    "string_concat_per_frame": (2, "{detail} builds a new string; cache it or rebuild only on change"),
+}
+# Dropped for classes that already use a pool
+POOL_RULES = {"instantiate_without_pool", "destroy_without_pool"}
+# A class defining one of each (any case) is a pool itself, e.g. the generated Get/Release pools
+POOL_ACQUIRE_METHODS = {"get", "acquire", "spawn", "rent", "take"}
+POOL_RELEASE_METHODS = {"release", "despawn", "recycle", "return", "giveback"}
+
+# Structs (no heap allocation on new); project structs are added from the scanned files
+VALUE_TYPES = {
+    "Vector2", "Vector3", "Vector4", "Vector2Int", "Vector3Int", "Quaternion", "Color", "Color32",
+    "Rect", "RectInt", "Bounds", "BoundsInt", "Ray", "Ray2D", "RaycastHit", "RaycastHit2D", "Matrix4x4",
+    "Plane", "LayerMask", "ContactFilter2D", "ContactPoint", "ContactPoint2D", "Keyframe",
+    "GradientColorKey", "GradientAlphaKey", "KeyValuePair", "TimeSpan", "DateTime", "Guid", "Nullable",
+    "Scene", "JobHandle", "NativeArray", "NativeList",
+    "bool", "byte", "sbyte", "char", "short", "ushort", "int", "uint", "long", "ulong", "float", "double", "decimal",
+}
+
+# Yield instructions allocated on every iteration of a coroutine loop
+YIELD_INSTRUCTIONS = {"WaitForSeconds", "WaitForSecondsRealtime", "WaitForFixedUpdate", "WaitForEndOfFrame", "WaitUntil", "WaitWhile"}
+
+FIND_CALLS = {
+    "FindObjectOfType", "FindObjectsOfType", "FindFirstObjectByType", "FindAnyObjectByType", "FindObjectsByType",
+    "FindWithTag", "FindGameObjectWithTag", "FindGameObjectsWithTag", "FindObjectsOfTypeAll",
+}
+# Find itself is only a scene search on GameObject/Transform (List.Find etc. are not)
+FIND_QUALIFIERS = {"GameObject", "transform", "Transform"}
+
+GET_COMPONENT_CALLS = {
+    "GetComponent", "GetComponentInChildren", "GetComponentInParent",
+    "GetComponents", "GetComponentsInChildren", "GetComponentsInParent",
+}
+
+LINQ_METHODS = {
+    "Where", "Select", "SelectMany", "OrderBy", "OrderByDescending", "ThenBy", "GroupBy", "Distinct",
+    "ToList", "ToArray", "ToDictionary", "Any", "All", "Count", "First", "FirstOrDefault", "Last",
+    "LastOrDefault", "Sum", "Min", "Max", "Average", "Concat", "Skip", "Take", "Reverse", "Cast", "OfType",
+}
+
+CONTROL_KEYWORDS = {
+    "if", "for", "foreach", "while", "switch", "catch", "using", "lock", "fixed", "return", "when",
+    "nameof", "typeof", "sizeof", "default", "checked", "unchecked", "new", "else", "do", "try", "finally",
+}
+LOOP_KEYWORDS = {"for", "foreach", "while"}
+TYPE_KEYWORDS = {"class", "struct", "interface", "enum", "record"}
+
+# Node lookups that walk the scene tree
+GD_LOOKUP_CALLS = {"get_node", "get_node_or_null", "find_child", "find_children", "find_node", "get_nodes_in_group"}
+# Keywords after which '[' / '{' start a literal rather than an index
+GD_EXPRESSION_KEYWORDS = {"return", "in", "and", "or", "not", "await", "if", "elif", "else"}
+
+JS_CONTROL_KEYWORDS = {"if", "for", "while", "switch", "catch", "with", "function", "return", "typeof", "new", "await", "super"}
+JS_EXPRESSION_KEYWORDS = {"return", "yield", "await", "case", "in", "of", "typeof", "throw"}
+# Array methods whose callback runs once per element
+JS_LOOP_CALLS = frozenset({"forEach", "iterate", "each", "map", "filter", "some", "every", "find", "findIndex", "reduce", "sort"})
+JS_ALLOCATING_CALLS = {"map", "filter", "slice", "concat", "flat", "flatMap", "split"}
+JS_STATIC_ALLOCATING = {"keys", "values", "entries", "from", "of"}
+JS_LOOKUP_CALLS = {
+    "getByName", "getChildByName", "getMatching", "getElementById", "querySelector", "querySelectorAll",
+    "getElementsByClassName", "getElementsByTagName",
+}
+# GameObjectFactory (this.add.* / this.physics.add.*) calls that create a display object
+PHASER_FACTORIES = {
+    "sprite", "image", "text", "bitmapText", "rectangle", "circle", "ellipse", "arc", "triangle", "polygon",
+    "star", "line", "graphics", "particles", "container", "zone", "tileSprite", "nineslice", "video", "dom",
+}
+# Phaser Group pooling API
+PHASER_POOL_MARKERS = ("getFirstDead", "killAndHide", "maxSize")
+
+# Longest source excerpt kept per finding
+SNIPPET_CHARS = 120
+
+
+# =============================================================================
+# TOKENS AND SCOPES
+# =============================================================================
+
+# Token kinds; the tokenizer patterns below use these as group names
+ID, STR, ISTR, NUM, OP, NODE = "id", "str", "istr", "num", "op", "node"
+
+_SKIP = {"ws", "comment", "pre"}
+
+
+def _tokenize(pattern: re.Pattern, source: str) -> tuple[list[str], list[str], list[int]]:
+    """Split source into parallel (kind, text, line) lists, dropping whitespace,
+    comments and preprocessor lines."""
+    kinds, texts, lines = [], [], []
+    line = 1
+    for match in pattern.finditer(source):
+        group = match.lastgroup
+        text = match.group()
+        if group not in _SKIP:
+            kinds.append(group)
+            texts.append(text)
+            lines.append(line)
+        if group != "op" and group != "id":
+            line += text.count("\n")
+    return kinds, texts, lines
+
+
+class _BraceScope:
+    """Enclosing type, method and loop nesting over a brace-delimited token
+    stream (C#, JavaScript).
+
+    feed() is called for every token in order; method_name(opened) names the
+    method whose parameter list opens at that '(' index, or returns None for
+    blocks that are not method bodies. A '(' right after one of loop_calls
+    (e.g. forEach) counts as a loop for everything inside it.
+    """
+
+    def __init__(self, kinds: list[str], texts: list[str], method_name, loop_calls: frozenset = frozenset()):
+        self.kinds, self.texts, self.method_name, self.loop_calls = kinds, texts, method_name, loop_calls
+        self.methods = []          # enclosing method names
+        self.types = []            # enclosing type names
+        self.defined = set()       # (owner, method name) of every method seen
+        self.loop_depth = 0
+        self._stack = []           # (kind, loops carried) per open brace
+        self._parens = []          # (index, is loop) per open '('
+        self._matching = {}        # ')' index -> '(' index
+        self._pending = []         # brace depth of each braceless loop body still open
+        self._block_is_loop = False
+        self._type_pending = None  # name of a type whose body has not opened yet
+
+    @property
+    def owner(self) -> str:
+        """Innermost type the current token belongs to ('' outside any type)."""
+        return self._type_pending or (self.types[-1] if self.types else "")
+
+    def feed(self, i: int) -> bool:
+        """Update the scope for token i; True when it was structural punctuation."""
+        kinds, texts = self.kinds, self.texts
+        text = texts[i]
+        if kinds[i] == ID:
+            if text in TYPE_KEYWORDS and i + 1 < len(texts) and kinds[i + 1] == ID:
+                self._type_pending = texts[i + 1]
+            elif text == "do":
+                self._open_loop(i)
+            return False
+        if kinds[i] != OP:
+            return False
+
+        if text == "(":
+            previous = texts[i - 1] if i else ""
+            is_loop = previous in self.loop_calls
+            self._parens.append((i, previous in LOOP_KEYWORDS, is_loop))
+            self.loop_depth += is_loop
+        elif text == ")":
+            if self._parens:
+                opened, header, is_loop = self._parens.pop()
+                self._matching[i] = opened
+                self.loop_depth -= is_loop
+                if header:
+                    self._open_loop(i)
+        elif text == "{":
+            carried = 0
+            if self._block_is_loop:
+                carried, self._block_is_loop = 1, False
+            # A braceless loop whose body is a block: the block now carries the loop
+            if i and (texts[i - 1] == ")" or kinds[i - 1] == ID):
+                while self._pending and self._pending[-1] == len(self._stack):
+                    self._pending.pop()
+                    self.loop_depth -= 1
+                    carried += 1
+            kind = "block"
+            if self._type_pending:
+                kind = "type"
+                self.types.append(self._type_pending)
+                self._type_pending = None
+            elif i and texts[i - 1] == ")" and i - 1 in self._matching:
+                name = self.method_name(self._matching[i - 1])
+                if name is not None:
+                    kind = "method"
+                    self.methods.append(name)
+                    self.defined.add((self.owner, name))
+            self._stack.append((kind, carried))
+            self.loop_depth += carried
+        elif text == "}":
+            if self._stack:
+                kind, carried = self._stack.pop()
+                self.loop_depth -= carried
+                if kind == "method":
+                    self.methods.pop()
+                elif kind == "type":
+                    self.types.pop()
+            while self._pending and self._pending[-1] > len(self._stack):
+                self._pending.pop()
+                self.loop_depth -= 1
+        elif text == ";":
+            if not self._parens:
+                while self._pending and self._pending[-1] == len(self._stack):
+                    self._pending.pop()
+                    self.loop_depth -= 1
+                self._type_pending = None
+        else:
+            return False
+        return True
+
+    def _open_loop(self, i: int) -> None:
+        """Start the body of a loop whose header ends at token i."""
+        following = self.texts[i + 1] if i + 1 < len(self.texts) else ";"
+        if following == "{":
+            self._block_is_loop = True
+        elif following != ";":
+            self._pending.append(len(self._stack))
+            self.loop_depth += 1
+
+
+def _event_driven(texts: list[str], triggers: set, listeners: set) -> bytearray:
+    """Flag tokens that run on an input or event rather than every frame:
+    the body of an `if` whose condition calls one of triggers (GetKeyDown,
+    JustDown, ...) and the arguments of a listener registration such as
+    AddListener(...). Brace-delimited syntax; GDScript passes no triggers and
+    tracks its indented branches itself.
+    """
+    count = len(texts)
+    matching, stack = {}, []
+    for i, text in enumerate(texts):
+        if text in ("(", "[", "{"):
+            stack.append(i)
+        elif text in (")", "]", "}") and stack:
+            matching[stack.pop()] = i
+
+    flagged = bytearray(count)
+    for i, text in enumerate(texts):
+        if i + 1 >= count or texts[i + 1] != "(" or i + 1 not in matching:
+            continue
+        close = matching[i + 1]
+        if text in listeners:
+            flagged[i + 1:close + 1] = b"\x01" * (close - i)
+        elif text == "if" and any(texts[j] in triggers for j in range(i + 2, close)):
+            start = end = close + 1
+            if start < count and texts[start] == "{" and start in matching:
+                end = matching[start]
+            else:
+                # Braceless body: up to its ';', or the end of the enclosing block
+                while end < count and texts[end] != ";":
+                    if texts[end] in (")", "]", "}"):
+                        end -= 1
+                        break
+                    end = matching.get(end, end) + 1
+            flagged[start:end + 1] = b"\x01" * (min(end, count - 1) + 1 - start)
+    return flagged
+
+
+def _reachable(start: set, defined: set, calls: dict, stop: set = frozenset()) -> set:
+    """Methods of the same class reached from start through calls, not entering stop."""
+    found = set(start)
+    frontier = list(found)
+    while frontier:
+        owner, method = frontier.pop()
+        for callee in calls.get((owner, method), ()):
+            key = (owner, callee)
+            if key in defined and key not in found and key not in stop:
+                found.add(key)
+                frontier.append(key)
+    return found
+
+
+def _report(language: str, source: str, raw: list[tuple], defined: set, calls: dict, loop_calls: dict,
+            hot_methods: set, pooled: set, coroutines: set = frozenset(), **extra) -> dict:
+    """Turn candidate findings into scored findings for one file.
+
+    raw holds (rule, scope, line, owner, method, loop depth, event driven,
+    detail) tuples, where owner is the enclosing class ('' for none) and
+    scope says when the candidate matters: "any", "hot" (per frame), "loop"
+    or "hot_or_loop". Methods of the same class called (directly or
+    transitively) from a frame callback run every frame too, unless the call
+    sits behind a one-shot input check or inside an event listener; those
+    calls are left out of `calls`. Methods called from inside a loop
+    (loop_calls) run in that loop. Code reached only from the setup
+    callbacks runs once, so its loops do not count; coroutines are not
+    followed, as their loops span frames. Pool rules are dropped for classes
+    in pooled and for classes that define their own acquire/release pair.
+    """
+    hot = _reachable({key for key in defined if key[1] in hot_methods}, defined, calls)
+    looped = _reachable({(owner, callee) for (owner, _), callees in loop_calls.items() for callee in callees
+                         if (owner, callee) in defined}, defined, calls)
+    once = _reachable({key for key in defined if key[1] in SETUP_METHODS[language]} - coroutines,
+                      defined, calls, coroutines) - hot
+
+    names = {}
+    for owner, method in defined:
+        names.setdefault(owner, set()).add(method.lower())
+    pooled = pooled | {owner for owner, found in names.items()
+                       if found & POOL_ACQUIRE_METHODS and found & POOL_RELEASE_METHODS}
+
+    setup = SETUP_HOOKS[language]
+    source_lines = source.splitlines()
+    findings, seen = [], set()
+    for rule, scope, line, owner, method, loops, event_driven, detail in raw:
+        key = (owner, method)
+        per_frame = key in hot and not event_driven
+        in_loop = (loops > 0 or key in looped) and key not in once
+        if scope == "hot":
+            keep = per_frame
+        elif scope == "loop":
+            keep = in_loop
+        elif scope == "hot_or_loop":
+            keep = per_frame or in_loop
+        else:
+            keep = True
+        if not keep or (owner in pooled and rule in POOL_RULES) or (rule, line) in seen:
+            continue
+        seen.add((rule, line))
+        weight, message = RULES[rule]
+        finding = {
+            "line": line,
+            "rule": rule,
+            "score": weight * (1 + 2 * per_frame + in_loop),
+            "method": method,
+            "per_frame": per_frame,
+            "in_loop": in_loop,
+            "message": message.format(detail=detail, setup=setup),
+            "code": source_lines[line - 1].strip()[:SNIPPET_CHARS] if line <= len(source_lines) else "",
+        }
+        if rule == "allocation_per_frame":
+            finding["type"] = detail
+        findings.append(finding)
+
+    return {"language": language, **extra, "findings": findings}
+
+
+def _pool_token(text: str, markers: tuple = ()) -> bool:
+    """Whether a token references a pooling API or pool variable."""
+    return "pool" in text.lower() or text in markers
+
+
+# =============================================================================
+# C# ANALYZER
+# =============================================================================
+
+_CS_TOKEN = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<pre>\#[^\n]*)
+  | (?P<istr>\$@"(?:[^"]|"")*"|@\$"(?:[^"]|"")*"|\$"(?:[^"\\\n]|\\.)*")
+  | (?P<str>@"(?:[^"]|"")*"|"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)+')
+  | (?P<id>@?[A-Za-z_]\w*)
+  | (?P<num>\.?\d[\w.]*)
+  | (?P<op>=>|\+\+|--|\+=|-=|==|!=|<=|>=|&&|\|\||\?\?|::|.)
+""", re.S | re.X)
+
+def tokenize_csharp(source: str) -> tuple[list[str], list[str], list[int]]:
+    return _tokenize(_CS_TOKEN, source)
+
+
+def _generic_end(texts: list[str], start: int) -> int:
+    """Index of the '>' closing the type argument list opened at start, or -1."""
+    depth = 0
+    for j in range(start, min(start + 24, len(texts))):
+        text = texts[j]
+        if text == "<":
+            depth += 1
+        elif text == ">":
+            depth -= 1
+            if depth == 0:
+                return j
+        elif text not in (".", ",", "[", "]", "?") and not (text[0].isalpha() or text[0] in "_@"):
+            return -1
+    return -1
+
+
+def _generic_start(texts: list[str], end: int) -> int:
+    """Index of the '<' matching the '>' at end, or -1."""
+    depth = 0
+    for j in range(end, max(end - 24, -1), -1):
+        if texts[j] == ">":
+            depth += 1
+        elif texts[j] == "<":
+            depth -= 1
+            if depth == 0:
+                return j
+    return -1
+
+
+def analyze_csharp(source: str) -> dict:
+    """Find hot-path issues in one C# file."""
+    kinds, texts, lines = tokenize_csharp(source)
+    count = len(texts)
+    uses_linq = "Linq" in texts
+
+    def method_name(opened: int) -> Optional[str]:
+        at = opened - 1
+        if at >= 0 and texts[at] == ">":
+            at = _generic_start(texts, at) - 1
+        if at >= 0 and kinds[at] == ID and texts[at] not in CONTROL_KEYWORDS and (at == 0 or texts[at - 1] not in ("new", ".")):
+            if at and texts[at - 1] == "IEnumerator":
+                coroutines.add((scope.owner, texts[at]))
+            return texts[at]
+        return None
+
+    scope = _BraceScope(kinds, texts, method_name)
+    event_driven = _event_driven(texts, EDGE_TRIGGERS["csharp"], LISTENER_CALLS["csharp"])
+    structs, calls, loop_calls, raw, pooled, coroutines = [], {}, {}, [], set(), set()
+
+    def note(i: int, rule: str, when: str, detail: str) -> None:
+        raw.append((rule, when, lines[i], scope.owner, scope.methods[-1], scope.loop_depth, event_driven[i], detail))
+
+    for i in range(count):
+        if kinds[i] == ID and _pool_token(texts[i]):
+            pooled.add(scope.owner)
+        if scope.feed(i) or not scope.methods:
+            if kinds[i] == ID and texts[i] == "struct" and i + 1 < count and kinds[i + 1] == ID:
+                structs.append(texts[i + 1])
+            continue
+        kind, text = kinds[i], texts[i]
+        if kind == ISTR:
+            note(i, "string_concat_per_frame", "hot", "string interpolation")
+            continue
+        if kind == OP:
+            if text in ("+", "+=") and (kinds[i - 1] == STR or (i + 1 < count and kinds[i + 1] == STR)):
+                note(i, "string_concat_per_frame", "hot", "string concatenation")
+            continue
+        if kind != ID:
+            continue
+
+        if text == "new" and i + 1 < count:
+            if texts[i + 1] == "[":
+                note(i, "allocation_per_frame", "hot", "array")
+            elif kinds[i + 1] == ID:
+                j = i + 1
+                while j + 2 < count and texts[j + 1] == "." and kinds[j + 2] == ID:
+                    j += 2
+                type_ = texts[j]
+                after = texts[j + 1] if j + 1 < count else ""
+                if type_ == "GameObject" and after == "(":
+                    note(i, "instantiate_without_pool", "hot_or_loop", "new GameObject")
+                elif after == "[":
+                    note(i, "allocation_per_frame", "hot", f"{type_}[]")
+                elif type_ in YIELD_INSTRUCTIONS:
+                    note(i, "allocation_per_frame", "loop", type_)
+                elif type_ not in VALUE_TYPES and after in ("(", "{", "<"):
+                    note(i, "allocation_per_frame", "hot", type_)
+            continue
+
+        # Calls: name( or name<T>(
+        j = i + 1
+        if j < count and texts[j] == "<":
+            j = _generic_end(texts, j) + 1
+        if j <= 0 or j >= count or texts[j] != "(" or text in CONTROL_KEYWORDS:
+            continue
+        qualifier = texts[i - 2] if i >= 2 and texts[i - 1] == "." else None
+        if (qualifier is None or qualifier == "this") and not event_driven[i]:
+            calls.setdefault((scope.owner, scope.methods[-1]), set()).add(text)
+            if scope.loop_depth:
+                loop_calls.setdefault((scope.owner, scope.methods[-1]), set()).add(text)
+        if text in FIND_CALLS or (text == "Find" and qualifier in FIND_QUALIFIERS):
+            note(i, "find_in_hot_path", "hot_or_loop", text)
+        elif text in GET_COMPONENT_CALLS:
+            note(i, "get_component_in_hot_path", "hot_or_loop", text)
+        elif text == "Instantiate":
+            note(i, "instantiate_without_pool", "hot_or_loop", "Instantiate")
+        elif text in ("Destroy", "DestroyImmediate") and qualifier in (None, "Object"):
+            note(i, "destroy_without_pool", "hot_or_loop", text)
+        elif qualifier is not None and uses_linq and text in LINQ_METHODS:
+            note(i, "linq_per_frame", "hot", text)
+        elif text == "ToString" or (text in ("Format", "Concat") and qualifier in ("string", "String")):
+            note(i, "string_concat_per_frame", "hot", f"{qualifier or ''}.{text}()".lstrip("."))
+
+    return _report("csharp", source, raw, scope.defined, calls, loop_calls, HOT_METHODS, pooled, coroutines,
+                   structs=structs)
+
+
+# =============================================================================
+# GDSCRIPT ANALYZER
+# =============================================================================
+
+_GD_TOKEN = re.compile(r"""
+    (?P<ws>[ \t\r\n]+|\\\n)
+  | (?P<comment>\#[^\n]*)
+  | (?P<str>[&^]?(?:\"\"\".*?\"\"\"|'''.*?'''|"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'))
+  | (?P<node>\$(?:"[^"\n]*"|'[^'\n]*'|[A-Za-z_][\w/]*)|%[A-Za-z_]\w*)
+  | (?P<id>[A-Za-z_]\w*)
+  | (?P<num>\.?\d[\w.]*)
+  | (?P<op>->|:=|==|!=|<=|>=|\+=|-=|\*=|/=|\*\*|.)
+""", re.S | re.X)
+
+def analyze_gdscript(source: str) -> dict:
+    """Find hot-path issues in one GDScript file.
+
+    Scopes follow indentation: a func, loop or branch covers the following
+    logical lines indented deeper than its header (plus the rest of a
+    one-line header after the colon).
+    """
+    kinds, texts, lines = _tokenize(_GD_TOKEN, source)
+    count = len(texts)
+    triggers = EDGE_TRIGGERS["gdscript"]
+    listening = _event_driven(texts, set(), LISTENER_CALLS["gdscript"])
+
+    scopes = []           # (indent, kind) of open func/loop/class/input branch headers
+    methods, classes, defined, calls, loop_calls, raw, pooled = [], [], set(), {}, {}, [], set()
+
+    def note(i: int, rule: str, when: str, detail: str) -> None:
+        owner = classes[-1] if classes else ""
+        raw.append((rule, when, lines[i], owner, methods[-1], loop_depth, gated or listening[i], detail))
+
+    source_lines = source.splitlines()
+    indents = [len(line) - len(line.lstrip(" \t")) for line in source_lines]
+    # Physical lines continued from the previous one with a trailing backslash
+    continued = {n + 2 for n, line in enumerate(source_lines) if line.rstrip().endswith("\\")}
+
+    loop_depth = depth = gated = 0
+    loop_header = None    # [indent, still needs 'in'] while reading a for/while header
+    in_signature = False
+    for i in range(count):
+        kind, text = kinds[i], texts[i]
+        starts = i == 0 or (depth == 0 and lines[i] > lines[i - 1] and lines[i] not in continued)
+        if kind == OP and text in "([{":
+            depth += 1
+        elif kind == OP and text in ")]}" and depth:
+            depth -= 1
+
+        if starts:
+            indent = indents[lines[i] - 1] if lines[i] <= len(indents) else 0
+            while scopes and scopes[-1][0] >= indent:
+                _, closed = scopes.pop()
+                if closed == "func":
+                    methods.pop()
+                elif closed == "loop":
+                    loop_depth -= 1
+                elif closed == "class":
+                    classes.pop()
+                elif closed == "input":
+                    gated -= 1
+        if kind == ID and _pool_token(text):
+            pooled.add(classes[-1] if classes else "")
+        if starts:
+            head = texts[i + 1] if text == "static" and i + 1 < count else text
+            if head == "func":
+                at = i + 2 if text == "static" else i + 1
+                if at < count and kinds[at] == ID:
+                    scopes.append((indent, "func"))
+                    methods.append(texts[at])
+                    defined.add((classes[-1] if classes else "", texts[at]))
+                    in_signature = True
+                continue
+            if text in ("for", "while"):
+                loop_header = [indent, text == "for"]
+            elif text in ("if", "elif"):
+                j = i + 1
+                while j < count and lines[j] == lines[i] and texts[j] != ":" and texts[j] not in triggers:
+                    j += 1
+                if j < count and texts[j] in triggers:
+                    scopes.append((indent, "input"))
+                    gated += 1
+            elif text == "class" and i + 1 < count and kinds[i + 1] == ID:
+                scopes.append((indent, "class"))
+                classes.append(texts[i + 1])
+        if in_signature:
+            in_signature = not (text == ":" and depth == 0)
+            continue
+        if loop_header is not None and kind == ID and text == "in":
+            loop_header[1] = False
+        if loop_header is not None and text == ":" and depth == 0 and not loop_header[1]:
+            scopes.append((loop_header[0], "loop"))
+            loop_depth += 1
+            loop_header = None
+            continue
+        if not methods:
+            continue
+        method = methods[-1]
+
+        previous = texts[i - 1] if i and not starts else None
+        if kind == NODE:
+            if text[0] == "%" and previous is not None and (kinds[i - 1] in (ID, NUM, STR) or previous in (")", "]")):
+                continue
+            note(i, "find_in_hot_path", "hot_or_loop", text)
+        elif kind == OP:
+            if text in ("[", "{") and (previous is None or (kinds[i - 1] == OP and previous not in (")", "]", "}"))
+                                       or previous in GD_EXPRESSION_KEYWORDS):
+                note(i, "allocation_per_frame", "hot", "array literal" if text == "[" else "dictionary literal")
+            elif text in ("+", "+=") and (kinds[i - 1] == STR or (i + 1 < count and kinds[i + 1] == STR)):
+                note(i, "string_concat_per_frame", "hot", "string concatenation")
+            elif text == "%" and kinds[i - 1] == STR:
+                note(i, "string_concat_per_frame", "hot", "string formatting")
+        elif kind == ID and i + 1 < count and texts[i + 1] == "(":
+            qualifier = texts[i - 2] if i >= 2 and previous == "." else None
+            if (previous != "." or qualifier == "self") and not (gated or listening[i]):
+                calls.setdefault((classes[-1] if classes else "", method), set()).add(text)
+                if loop_depth:
+                    loop_calls.setdefault((classes[-1] if classes else "", method), set()).add(text)
+            if text == "new" and qualifier is not None:
+                note(i, "allocation_per_frame", "hot", qualifier)
+            elif text in GD_LOOKUP_CALLS:
+                note(i, "find_in_hot_path", "hot_or_loop", f"{text}()")
+            elif text in ("instantiate", "instance") and qualifier is not None:
+                note(i, "instantiate_without_pool", "hot_or_loop", f"{text}()")
+            elif text == "add_child":
+                note(i, "instantiate_without_pool", "hot_or_loop", "add_child()")
+            elif text in ("queue_free", "free"):
+                note(i, "destroy_without_pool", "hot_or_loop", f"{text}()")
+            elif text == "duplicate" and qualifier is not None:
+                note(i, "allocation_per_frame", "hot", "duplicate()")
+            elif (text == "str" and previous != ".") or (text == "format" and qualifier is not None):
+                note(i, "string_concat_per_frame", "hot", f"{text}()")
+
+    return _report("gdscript", source, raw, defined, calls, loop_calls, GD_HOT_FUNCS, pooled)
+
+
+# =============================================================================
+# JAVASCRIPT ANALYZER
+# =============================================================================
+
+_JS_TOKEN = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<istr>`(?:[^`\\]|\\.)*`)
+  | (?P<str>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+  | (?P<id>[A-Za-z_$][\w$]*)
+  | (?P<num>\.?\d[\w.]*)
+  | (?P<op>=>|===|!==|==|!=|<=|>=|&&|\|\||\?\?|\?\.|\+\+|--|\+=|-=|\.\.\.|.)
+""", re.S | re.X)
+
+
+def analyze_javascript(source: str) -> dict:
+    """Find hot-path issues in one JavaScript (Phaser) file."""
+    kinds, texts, lines = _tokenize(_JS_TOKEN, source)
+    count = len(texts)
+
+    def method_name(opened: int) -> Optional[str]:
+        at = opened - 1
+        if at >= 0 and texts[at] == "function":
+            # update: function () {} / this.update = function () {}
+            at = at - 2 if at >= 2 and texts[at - 1] in (":", "=") else -1
+        if at >= 0 and kinds[at] == ID and texts[at] not in JS_CONTROL_KEYWORDS and (at == 0 or texts[at - 1] != "new"):
+            return texts[at]
+        return None
+
+    scope = _BraceScope(kinds, texts, method_name, JS_LOOP_CALLS)
+    event_driven = _event_driven(texts, EDGE_TRIGGERS["javascript"], LISTENER_CALLS["javascript"])
+    calls, loop_calls, raw, pooled = {}, {}, [], set()
+
+    def note(i: int, rule: str, when: str, detail: str) -> None:
+        raw.append((rule, when, lines[i], scope.owner, scope.methods[-1], scope.loop_depth, event_driven[i], detail))
+
+    for i in range(count):
+        kind, text = kinds[i], texts[i]
+        previous = texts[i - 1] if i else None
+        if kind == ID and _pool_token(text, PHASER_POOL_MARKERS):
+            pooled.add(scope.owner)
+        # Literal braces are tracked as blocks too, so check them before feeding the scope
+        literal = kind == OP and text in ("[", "{") and bool(scope.methods) and (
+            previous is None or previous in JS_EXPRESSION_KEYWORDS
+            or (kinds[i - 1] == OP and previous not in (")", "]", "}") and not (text == "{" and previous == "=>")))
+        if scope.feed(i) and not literal:
+            continue
+        if not scope.methods:
+            continue
+        if literal:
+            note(i, "allocation_per_frame", "hot", "array literal" if text == "[" else "object literal")
+        elif kind == ISTR:
+            if "${" in text:
+                note(i, "string_concat_per_frame", "hot", "template literal")
+        elif kind == OP:
+            if text in ("+", "+=") and (kinds[i - 1] in (STR, ISTR) or (i + 1 < count and kinds[i + 1] in (STR, ISTR))):
+                note(i, "string_concat_per_frame", "hot", "string concatenation")
+        elif kind == ID and text == "new" and i + 1 < count and kinds[i + 1] == ID:
+            j = i + 1
+            while j + 2 < count and texts[j + 1] == "." and kinds[j + 2] == ID:
+                j += 2
+            note(i, "allocation_per_frame", "hot", texts[j])
+        elif kind == ID and i + 1 < count and texts[i + 1] == "(":
+            qualifier = texts[i - 2] if i >= 2 and previous in (".", "?.") else None
+            if (previous not in (".", "?.") or qualifier == "this") and not event_driven[i]:
+                calls.setdefault((scope.owner, scope.methods[-1]), set()).add(text)
+                if scope.loop_depth:
+                    loop_calls.setdefault((scope.owner, scope.methods[-1]), set()).add(text)
+            if text in JS_LOOKUP_CALLS and qualifier is not None:
+                note(i, "find_in_hot_path", "hot_or_loop", f"{text}()")
+            elif qualifier == "add" and text in PHASER_FACTORIES:
+                note(i, "instantiate_without_pool", "hot_or_loop", f"add.{text}()")
+            elif text == "destroy" and qualifier is not None:
+                note(i, "destroy_without_pool", "hot_or_loop", "destroy()")
+            elif qualifier in ("Object", "Array") and text in JS_STATIC_ALLOCATING:
+                note(i, "allocation_per_frame", "hot", f"array from {qualifier}.{text}()")
+            elif qualifier is not None and text in JS_ALLOCATING_CALLS:
+                note(i, "allocation_per_frame", "hot", f"array from .{text}()")
+            elif qualifier is not None and text in ("toFixed", "toString", "stringify", "join"):
+                note(i, "string_concat_per_frame", "hot", f"{text}()")
+
+    return _report("javascript", source, raw, scope.defined, calls, loop_calls, JS_HOT_METHODS, pooled)
+
+
+# Analyzer per source suffix
+ANALYZERS = {".cs": analyze_csharp, ".gd": analyze_gdscript, ".js": analyze_javascript}
+LANGUAGES = {"csharp": ".cs", "gdscript": ".gd", "javascript": ".js"}
+
+
+def analyze_file(path: str) -> dict:
+    """Analyze one source file; runs in a worker process."""
+    try:
+        source = Path(path).read_text(encoding="utf-8-sig", errors="replace")
+        return ANALYZERS[os.path.splitext(path)[1].lower()](source)
+    except (OSError, RecursionError) as e:
+        return {"error": str(e)}
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+def scan_sources(root: Path, paths: list[str], suffixes: set[str]) -> list[tuple[str, str, list[int]]]:
+    """(relative path, absolute path, [mtime_ns, size]) of every file with one of the suffixes."""
+    found = {}
+    for entry in paths:
+        base = root / entry
+        if base.is_file():
+            candidates = [str(base)]
+        else:
+            candidates = []
+            for directory, dirs, files in os.walk(base):
+                dirs[:] = [d for d in dirs if not d.startswith(".") and d not in SKIP_DIRS]
+                candidates.extend(os.path.join(directory, name) for name in files)
+        for path in candidates:
+            if os.path.splitext(path)[1].lower() not in suffixes or path.endswith(".min.js"):
+                continue
+            stat = os.stat(path)
+            rel = os.path.relpath(path, root).replace(os.sep, "/")
+            found[rel] = (rel, path, [stat.st_mtime_ns, stat.st_size])
+    return sorted(found.values())
+
+
+def analyze(paths: Optional[list[str]] = None, top: int = 50, rules: Optional[list[str]] = None,
+            languages: Optional[list[str]] = None, cache_file: str = DEFAULT_CACHE_FILE,
+            workers: Optional[int] = None, root: Path = PROJECT_ROOT) -> dict:
+    """Lint scripts for hot-path costs and return findings ranked by score.
+
+    Files whose mtime and size are unchanged reuse their cached findings
+    without being read; otherwise the content hash decides, so touched but
+    identical files are not re-analyzed either.
+    """
+    started = time.perf_counter()
+    paths = paths or DEFAULT_SOURCE_DIRS
+    missing = [p for p in paths if not (root / p).exists()]
+    if missing:
+        return {"success": False, "error": f"Not found: {', '.join(missing)}"}
+    unknown = [r for r in rules or [] if r not in RULES]
+    if unknown:
+        return {"success": False, "error": f"Unknown rule(s) {', '.join(unknown)}. Options: {', '.join(RULES)}"}
+    unknown = [name for name in languages or [] if name not in LANGUAGES]
+    if unknown:
+        return {"success": False, "error": f"Unknown language(s) {', '.join(unknown)}. Options: {', '.join(LANGUAGES)}"}
+    suffixes = {LANGUAGES[name] for name in languages or LANGUAGES}
+
+    cache_path = root / cache_file
+    try:
+        cache = json.loads(cache_path.read_text())
+        entries = cache.get("files", {}) if cache.get("version") == CACHE_VERSION else {}
+    except (OSError, ValueError):
+        entries = {}
+
+    results, stale, dirty = {}, [], False
+    for rel, path, stamp in scan_sources(root, paths, suffixes):
+        entry = entries.get(rel)
+        if entry and entry["stamp"] == stamp:
+            results[rel] = entry["result"]
+            continue
+        digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        if entry and entry["hash"] == digest:
+            entry["stamp"], dirty = stamp, True
+            results[rel] = entry["result"]
+        else:
+            stale.append((rel, path, stamp, digest))
+
+    if len(stale) >= POOL_MIN_FILES and (workers is None or workers > 1):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            analyzed = list(pool.map(analyze_file, [s[1] for s in stale]))
+    else:
+        analyzed = [analyze_file(s[1]) for s in stale]
+
+    errors = {}
+    for (rel, _, stamp, digest), result in zip(stale, analyzed):
+        if "error" in result:
+            errors[rel] = result["error"]
+        else:
+            results[rel] = result
+            entries[rel] = {"stamp": stamp, "hash": digest, "result": result}
+
+    if stale or dirty:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": CACHE_VERSION, "files": entries}))
+        os.replace(tmp, cache_path)
+
+    structs = set().union(*(result.get("structs", ()) for result in results.values()))
+    findings = []
+    for rel, result in results.items():
+        for finding in result["findings"]:
+            if rules and finding["rule"] not in rules:
+                continue
+            if finding.get("type") in structs:
+                continue
+            findings.append({"location": f"{rel}:{finding['line']}", "file": rel, **finding})
+    findings.sort(key=lambda f: (-f["score"], f["file"], f["line"]))
+
+    by_rule, by_file = {}, {}
+    for finding in findings:
+        by_rule[finding["rule"]] = by_rule.get(finding["rule"], 0) + 1
+        by_file[finding["file"]] = by_file.get(finding["file"], 0) + finding["score"]
+    hotspots = sorted(by_file.items(), key=lambda pair: -pair[1])[:10]
+
+    return {
+        "success": True,
+        "files": len(results),
+        "analyzed": len(stale) - len(errors),
+        "cached": len(results) - len(stale) + len(errors),
+        "errors": errors,
+        "total_findings": len(findings),
+        "by_rule": by_rule,
+        "hotspots": [{"file": rel, "score": score} for rel, score in hotspots],
+        "findings": [{k: v for k, v in f.items() if k != "file"} for f in findings[:top]],
+        "scan_time": round(time.perf_counter() - started, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", help=f"Files or folders relative to the project root (default {DEFAULT_SOURCE_DIRS[0]})")
+    parser.add_argument("--top", type=int, default=50, help="Findings to list")
+    parser.add_argument("--rule", action="append", choices=list(RULES), help="Only report these rules")
+    parser.add_argument("--language", action="append", choices=list(LANGUAGES), help="Only analyze these languages")
+    args = parser.parse_args()
+    print(json.dumps(analyze(args.paths or None, args.top, args.rule, args.language), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,12 @@ using System.Collections.Generic;
 /// </summary>
 public static class ProceduralAudio
 {
+    // Clips pre-rendered by the audio-systems skill (audio_manager.py bake) under Assets/Resources
+    private const string BakedClipFolder = "Audio/SFX/";
+
     private static Dictionary<string, AudioClip> cachedClips = new Dictionary<string, AudioClip>();
     private static bool initialized = false;
+    private static int bakedCount = 0;
 
     [RuntimeInitializeOnLoadMethod(RuntimeInitializeLoadType.BeforeSceneLoad)]
     private static void Initialize()
@@ -17,45 +21,60 @@ public static class ProceduralAudio
 
         GenerateAllSounds();
         initialized = true;
-        Debug.Log("[ProceduralAudio] Generated all procedural sound effects");
+        Debug.Log($"[ProceduralAudio] Loaded {bakedCount} baked clips, generated {cachedClips.Count - bakedCount} procedural sound effects");
+    }
+
+    /// <summary>
+    /// Registers a clip, preferring a baked file over running its generator.
+    /// </summary>
+    private static void AddClip(string name, System.Func<AudioClip> generate)
+    {
+        AudioClip baked = Resources.Load<AudioClip>(BakedClipFolder + name);
+        if (baked != null)
+        {
+            bakedCount++;
+            cachedClips[name] = baked;
+            return;
+        }
+        cachedClips[name] = generate();
     }
 
     private static void GenerateAllSounds()
     {
         // Player sounds
-        cachedClips["PlayerAttack1"] = GenerateSwishSound(0.15f, 800f, 400f);
-        cachedClips["PlayerAttack2"] = GenerateSwishSound(0.15f, 900f, 350f);
-        cachedClips["PlayerAttack3"] = GenerateSwishSound(0.2f, 1000f, 300f);
-        cachedClips["PlayerHit"] = GenerateImpactSound(0.2f, 200f, 0.8f);
-        cachedClips["PlayerDodge"] = GenerateWhooshSound(0.25f, 600f, 200f);
-        cachedClips["PlayerHurt"] = GenerateHurtSound(0.3f, 300f);
-        cachedClips["PlayerDeath"] = GenerateDeathSound(0.8f, 200f);
+        AddClip("PlayerAttack1", () => GenerateSwishSound(0.15f, 800f, 400f));
+        AddClip("PlayerAttack2", () => GenerateSwishSound(0.15f, 900f, 350f));
+        AddClip("PlayerAttack3", () => GenerateSwishSound(0.2f, 1000f, 300f));
+        AddClip("PlayerHit", () => GenerateImpactSound(0.2f, 200f, 0.8f));
+        AddClip("PlayerDodge", () => GenerateWhooshSound(0.25f, 600f, 200f));
+        AddClip("PlayerHurt", () => GenerateHurtSound(0.3f, 300f));
+        AddClip("PlayerDeath", () => GenerateDeathSound(0.8f, 200f));
 
         // Boss sounds
-        cachedClips["BossRoar"] = GenerateRoarSound(0.6f, 120f);
-        cachedClips["BossSweep"] = GenerateSwishSound(0.3f, 400f, 150f);
-        cachedClips["BossSlam"] = GenerateImpactSound(0.4f, 80f, 1f);
-        cachedClips["BossProjectile"] = GenerateProjectileSound(0.3f, 500f);
-        cachedClips["BossHurt"] = GenerateImpactSound(0.25f, 150f, 0.7f);
-        cachedClips["BossPhaseTransition"] = GeneratePhaseTransitionSound(1.2f);
-        cachedClips["BossDeath"] = GenerateExplosionSound(1.5f);
+        AddClip("BossRoar", () => GenerateRoarSound(0.6f, 120f));
+        AddClip("BossSweep", () => GenerateSwishSound(0.3f, 400f, 150f));
+        AddClip("BossSlam", () => GenerateImpactSound(0.4f, 80f, 1f));
+        AddClip("BossProjectile", () => GenerateProjectileSound(0.3f, 500f));
+        AddClip("BossHurt", () => GenerateImpactSound(0.25f, 150f, 0.7f));
+        AddClip("BossPhaseTransition", () => GeneratePhaseTransitionSound(1.2f));
+        AddClip("BossDeath", () => GenerateExplosionSound(1.5f));
 
         // Combat sounds
-        cachedClips["Parry"] = GenerateParrySound(0.3f);
-        cachedClips["CriticalHit"] = GenerateCriticalSound(0.4f);
-        cachedClips["ComboFinish"] = GenerateComboSound(0.5f);
+        AddClip("Parry", () => GenerateParrySound(0.3f));
+        AddClip("CriticalHit", () => GenerateCriticalSound(0.4f));
+        AddClip("ComboFinish", () => GenerateComboSound(0.5f));
 
         // UI sounds
-        cachedClips["UIClick"] = GenerateClickSound(0.1f);
-        cachedClips["UIHover"] = GenerateHoverSound(0.05f);
-        cachedClips["UIConfirm"] = GenerateConfirmSound(0.2f);
-        cachedClips["UICancel"] = GenerateCancelSound(0.15f);
+        AddClip("UIClick", () => GenerateClickSound(0.1f));
+        AddClip("UIHover", () => GenerateHoverSound(0.05f));
+        AddClip("UIConfirm", () => GenerateConfirmSound(0.2f));
+        AddClip("UICancel", () => GenerateCancelSound(0.15f));
 
         // Game state sounds
-        cachedClips["Victory"] = GenerateVictorySound(2f);
-        cachedClips["Defeat"] = GenerateDefeatSound(1.5f);
-        cachedClips["MenuMusic"] = GenerateMenuMusicLoop(8f);
-        cachedClips["BattleMusic"] = GenerateBattleMusicLoop(8f);
+        AddClip("Victory", () => GenerateVictorySound(2f));
+        AddClip("Defeat", () => GenerateDefeatSound(1.5f));
+        AddClip("MenuMusic", () => GenerateMenuMusicLoop(8f));
+        AddClip("BattleMusic", () => GenerateBattleMusicLoop(8f));
     }
 
     #region Sound Generation Methods
@@ -27,6 +27,13 @@ public static class RuntimeAssetLoader
     private static Dictionary<string, HeroData> heroData = new Dictionary<string, HeroData>();
     private static Dictionary<string, BossData> bossData = new Dictionary<string, BossData>();
 
+    // Sheets pre-rendered by the asset-optimization skill (sprite_baker.py) under Assets/Resources
+    private const string BakedSpriteFolder = "Sprites/Baked/";
+
+    // Sheet name -> animation name -> frames, sliced from the baked sheets
+    private static Dictionary<string, Dictionary<string, Sprite[]>> bakedFrames = new Dictionary<string, Dictionary<string, Sprite[]>>();
+    private static int bakedCount = 0;
+
     private static bool initialized = false;
 
     [RuntimeInitializeOnLoadMethod(RuntimeInitializeLoadType.BeforeSceneLoad)]
@@ -36,7 +43,8 @@ public static class RuntimeAssetLoader
 
         Debug.Log("[RuntimeAssetLoader] Generating runtime sprites and data...");
 
-        // Generate all sprites
+        // Generate all sprites, using baked frames where available
+        LoadBakedSprites();
         GenerateHeroSprites();
         GenerateBossSprites();
         GenerateEffectSprites();
@@ -52,6 +60,77 @@ public static class RuntimeAssetLoader
 
     #region Sprite Generation
 
+    [System.Serializable]
+    private class BakedManifest
+    {
+        public BakedSheet[] sheets;
+    }
+
+    [System.Serializable]
+    private class BakedSheet
+    {
+        public string name;
+        public float ppu;
+        public Vector2 pivot;
+        public BakedAnimation[] animations;
+    }
+
+    [System.Serializable]
+    private class BakedAnimation
+    {
+        public string name;
+        public BakedFrame[] frames;
+    }
+
+    [System.Serializable]
+    private class BakedFrame
+    {
+        public int x, y, w, h;
+    }
+
+    /// <summary>
+    /// Slices the baked sheets listed in the manifest into animation frames.
+    /// </summary>
+    private static void LoadBakedSprites()
+    {
+        TextAsset manifestAsset = Resources.Load<TextAsset>(BakedSpriteFolder + "manifest");
+        if (manifestAsset == null) return;
+
+        BakedManifest manifest = JsonUtility.FromJson<BakedManifest>(manifestAsset.text);
+        foreach (BakedSheet sheet in manifest.sheets)
+        {
+            Texture2D tex = Resources.Load<Texture2D>(BakedSpriteFolder + sheet.name);
+            if (tex == null) continue;
+            tex.filterMode = FilterMode.Point;
+
+            var animations = new Dictionary<string, Sprite[]>();
+            foreach (BakedAnimation animation in sheet.animations)
+            {
+                Sprite[] frames = new Sprite[animation.frames.Length];
+                for (int i = 0; i < frames.Length; i++)
+                {
+                    BakedFrame f = animation.frames[i];
+                    frames[i] = Sprite.Create(tex, new Rect(f.x, f.y, f.w, f.h), sheet.pivot, sheet.ppu);
+                }
+                animations[animation.name] = frames;
+            }
+            bakedFrames[sheet.name] = animations;
+        }
+    }
+
+    /// <summary>
+    /// Returns baked frames for a sheet's animation, falling back to the generator.
+    /// </summary>
+    private static Sprite[] LoadFrames(string sheet, string animation, System.Func<Sprite[]> generate)
+    {
+        if (bakedFrames.TryGetValue(sheet, out var animations) && animations.TryGetValue(animation, out Sprite[] frames))
+        {
+            bakedCount++;
+            return frames;
+        }
+        return generate();
+    }
+
     private static void GenerateHeroSprites()
     {
         // Bronze Warrior - warm bronze tones (Warrior type)
@@ -60,10 +139,10 @@ public static class RuntimeAssetLoader
         Color bronzeSkin = new Color(0.95f, 0.8f, 0.7f);
         Color bronzeWeapon = new Color(0.7f, 0.7f, 0.75f);
 
-        heroIdleFrames["BronzeWarrior"] = DetailedSpriteGenerator.GenerateHeroIdleFrames(bronzeBody, bronzeArmor, bronzeSkin, bronzeWeapon, DetailedSpriteGenerator.HeroType.Warrior);
-        heroAttackFrames["BronzeWarrior"] = DetailedSpriteGenerator.GenerateHeroAttackFrames(bronzeBody, bronzeArmor, bronzeSkin, bronzeWeapon, DetailedSpriteGenerator.HeroType.Warrior);
-        heroDodgeFrames["BronzeWarrior"] = DetailedSpriteGenerator.GenerateHeroDodgeFrames(bronzeBody, bronzeArmor, bronzeSkin, bronzeWeapon, DetailedSpriteGenerator.HeroType.Warrior);
-        heroHurtFrames["BronzeWarrior"] = DetailedSpriteGenerator.GenerateHeroHurtFrames(bronzeBody, bronzeArmor, bronzeSkin, bronzeWeapon, DetailedSpriteGenerator.HeroType.Warrior);
+        heroIdleFrames["BronzeWarrior"] = LoadFrames("BronzeWarrior", "idle", () => DetailedSpriteGenerator.GenerateHeroIdleFrames(bronzeBody, bronzeArmor, bronzeSkin, bronzeWeapon, DetailedSpriteGenerator.HeroType.Warrior));
+        heroAttackFrames["BronzeWarrior"] = LoadFrames("BronzeWarrior", "attack", () => DetailedSpriteGenerator.GenerateHeroAttackFrames(bronzeBody, bronzeArmor, bronzeSkin, bronzeWeapon, DetailedSpriteGenerator.HeroType.Warrior));
+        heroDodgeFrames["BronzeWarrior"] = LoadFrames("BronzeWarrior", "dodge", () => DetailedSpriteGenerator.GenerateHeroDodgeFrames(bronzeBody, bronzeArmor, bronzeSkin, bronzeWeapon, DetailedSpriteGenerator.HeroType.Warrior));
+        heroHurtFrames["BronzeWarrior"] = LoadFrames("BronzeWarrior", "hurt", () => DetailedSpriteGenerator.GenerateHeroHurtFrames(bronzeBody, bronzeArmor, bronzeSkin, bronzeWeapon, DetailedSpriteGenerator.HeroType.Warrior));
         heroSprites["BronzeWarrior"] = heroIdleFrames["BronzeWarrior"][0];
 
         // Shadow Dancer - purple/dark tones (Rogue type)
@@ -72,10 +151,10 @@ public static class RuntimeAssetLoader
         Color shadowSkin = new Color(0.85f, 0.75f, 0.85f);
         Color shadowWeapon = new Color(0.5f, 0.3f, 0.6f);
 
-        heroIdleFrames["ShadowDancer"] = DetailedSpriteGenerator.GenerateHeroIdleFrames(shadowBody, shadowArmor, shadowSkin, shadowWeapon, DetailedSpriteGenerator.HeroType.Rogue);
-        heroAttackFrames["ShadowDancer"] = DetailedSpriteGenerator.GenerateHeroAttackFrames(shadowBody, shadowArmor, shadowSkin, shadowWeapon, DetailedSpriteGenerator.HeroType.Rogue);
-        heroDodgeFrames["ShadowDancer"] = DetailedSpriteGenerator.GenerateHeroDodgeFrames(shadowBody, shadowArmor, shadowSkin, shadowWeapon, DetailedSpriteGenerator.HeroType.Rogue);
-        heroHurtFrames["ShadowDancer"] = DetailedSpriteGenerator.GenerateHeroHurtFrames(shadowBody, shadowArmor, shadowSkin, shadowWeapon, DetailedSpriteGenerator.HeroType.Rogue);
+        heroIdleFrames["ShadowDancer"] = LoadFrames("ShadowDancer", "idle", () => DetailedSpriteGenerator.GenerateHeroIdleFrames(shadowBody, shadowArmor, shadowSkin, shadowWeapon, DetailedSpriteGenerator.HeroType.Rogue));
+        heroAttackFrames["ShadowDancer"] = LoadFrames("ShadowDancer", "attack", () => DetailedSpriteGenerator.GenerateHeroAttackFrames(shadowBody, shadowArmor, shadowSkin, shadowWeapon, DetailedSpriteGenerator.HeroType.Rogue));
+        heroDodgeFrames["ShadowDancer"] = LoadFrames("ShadowDancer", "dodge", () => DetailedSpriteGenerator.GenerateHeroDodgeFrames(shadowBody, shadowArmor, shadowSkin, shadowWeapon, DetailedSpriteGenerator.HeroType.Rogue));
+        heroHurtFrames["ShadowDancer"] = LoadFrames("ShadowDancer", "hurt", () => DetailedSpriteGenerator.GenerateHeroHurtFrames(shadowBody, shadowArmor, shadowSkin, shadowWeapon, DetailedSpriteGenerator.HeroType.Rogue));
         heroSprites["ShadowDancer"] = heroIdleFrames["ShadowDancer"][0];
 
         // Flame Bearer - red/orange tones (Mage type)
@@ -84,10 +163,10 @@ public static class RuntimeAssetLoader
         Color flameSkin = new Color(0.95f, 0.85f, 0.75f);
         Color flameWeapon = new Color(1f, 0.5f, 0.2f);
 
-        heroIdleFrames["FlameBearer"] = DetailedSpriteGenerator.GenerateHeroIdleFrames(flameBody, flameArmor, flameSkin, flameWeapon, DetailedSpriteGenerator.HeroType.Mage);
-        heroAttackFrames["FlameBearer"] = DetailedSpriteGenerator.GenerateHeroAttackFrames(flameBody, flameArmor, flameSkin, flameWeapon, DetailedSpriteGenerator.HeroType.Mage);
-        heroDodgeFrames["FlameBearer"] = DetailedSpriteGenerator.GenerateHeroDodgeFrames(flameBody, flameArmor, flameSkin, flameWeapon, DetailedSpriteGenerator.HeroType.Mage);
-        heroHurtFrames["FlameBearer"] = DetailedSpriteGenerator.GenerateHeroHurtFrames(flameBody, flameArmor, flameSkin, flameWeapon, DetailedSpriteGenerator.HeroType.Mage);
+        heroIdleFrames["FlameBearer"] = LoadFrames("FlameBearer", "idle", () => DetailedSpriteGenerator.GenerateHeroIdleFrames(flameBody, flameArmor, flameSkin, flameWeapon, DetailedSpriteGenerator.HeroType.Mage));
+        heroAttackFrames["FlameBearer"] = LoadFrames("FlameBearer", "attack", () => DetailedSpriteGenerator.GenerateHeroAttackFrames(flameBody, flameArmor, flameSkin, flameWeapon, DetailedSpriteGenerator.HeroType.Mage));
+        heroDodgeFrames["FlameBearer"] = LoadFrames("FlameBearer", "dodge", () => DetailedSpriteGenerator.GenerateHeroDodgeFrames(flameBody, flameArmor, flameSkin, flameWeapon, DetailedSpriteGenerator.HeroType.Mage));
+        heroHurtFrames["FlameBearer"] = LoadFrames("FlameBearer", "hurt", () => DetailedSpriteGenerator.GenerateHeroHurtFrames(flameBody, flameArmor, flameSkin, flameWeapon, DetailedSpriteGenerator.HeroType.Mage));
         heroSprites["FlameBearer"] = heroIdleFrames["FlameBearer"][0];
 
         Debug.Log($"[RuntimeAssetLoader] Generated {heroSprites.Count} detailed hero sprites with animations");
@@ -102,10 +181,10 @@ public static class RuntimeAssetLoader
         Color bronzeGlow = new Color(1f, 0.7f, 0.3f);
         Color bronzePhase2 = new Color(0.9f, 0.2f, 0.2f);
 
-        bossIdleFrames["BronzeMask"] = DetailedSpriteGenerator.GenerateBossIdleFrames(bronzeBody, bronzeEye, bronzeAccent, bronzeGlow);
-        bossAttackFrames["BronzeMask"] = DetailedSpriteGenerator.GenerateBossAttackFrames(bronzeBody, bronzeEye, bronzeAccent, bronzeGlow);
-        bossHurtFrames["BronzeMask"] = DetailedSpriteGenerator.GenerateBossHurtFrames(bronzeBody, bronzeEye, bronzeAccent, bronzeGlow);
-        bossTransitionFrames["BronzeMask"] = DetailedSpriteGenerator.GenerateBossTransitionFrames(bronzeBody, bronzeEye, bronzeAccent, bronzeGlow, bronzePhase2);
+        bossIdleFrames["BronzeMask"] = LoadFrames("BronzeMask", "idle", () => DetailedSpriteGenerator.GenerateBossIdleFrames(bronzeBody, bronzeEye, bronzeAccent, bronzeGlow));
+        bossAttackFrames["BronzeMask"] = LoadFrames("BronzeMask", "attack", () => DetailedSpriteGenerator.GenerateBossAttackFrames(bronzeBody, bronzeEye, bronzeAccent, bronzeGlow));
+        bossHurtFrames["BronzeMask"] = LoadFrames("BronzeMask", "hurt", () => DetailedSpriteGenerator.GenerateBossHurtFrames(bronzeBody, bronzeEye, bronzeAccent, bronzeGlow));
+        bossTransitionFrames["BronzeMask"] = LoadFrames("BronzeMask", "transition", () => DetailedSpriteGenerator.GenerateBossTransitionFrames(bronzeBody, bronzeEye, bronzeAccent, bronzeGlow, bronzePhase2));
         bossSprites["BronzeMask"] = bossIdleFrames["BronzeMask"][0];
 
         // Chaos Totem - purple chaos entity
@@ -115,13 +194,13 @@ public static class RuntimeAssetLoader
         Color chaosGlow = new Color(0.8f, 0.3f, 0.6f);
         Color chaosPhase2 = new Color(0.6f, 0.1f, 0.4f);
 
-        bossIdleFrames["ChaosTotem"] = DetailedSpriteGenerator.GenerateBossIdleFrames(chaosBody, chaosEye, chaosAccent, chaosGlow);
-        bossAttackFrames["ChaosTotem"] = DetailedSpriteGenerator.GenerateBossAttackFrames(chaosBody, chaosEye, chaosAccent, chaosGlow);
-        bossHurtFrames["ChaosTotem"] = DetailedSpriteGenerator.GenerateBossHurtFrames(chaosBody, chaosEye, chaosAccent, chaosGlow);
-        bossTransitionFrames["ChaosTotem"] = DetailedSpriteGenerator.GenerateBossTransitionFrames(chaosBody, chaosEye, chaosAccent, chaosGlow, chaosPhase2);
+        bossIdleFrames["ChaosTotem"] = LoadFrames("ChaosTotem", "idle", () => DetailedSpriteGenerator.GenerateBossIdleFrames(chaosBody, chaosEye, chaosAccent, chaosGlow));
+        bossAttackFrames["ChaosTotem"] = LoadFrames("ChaosTotem", "attack", () => DetailedSpriteGenerator.GenerateBossAttackFrames(chaosBody, chaosEye, chaosAccent, chaosGlow));
+        bossHurtFrames["ChaosTotem"] = LoadFrames("ChaosTotem", "hurt", () => DetailedSpriteGenerator.GenerateBossHurtFrames(chaosBody, chaosEye, chaosAccent, chaosGlow));
+        bossTransitionFrames["ChaosTotem"] = LoadFrames("ChaosTotem", "transition", () => DetailedSpriteGenerator.GenerateBossTransitionFrames(chaosBody, chaosEye, chaosAccent, chaosGlow, chaosPhase2));
         bossSprites["ChaosTotem"] = bossIdleFrames["ChaosTotem"][0];
 
-        Debug.Log($"[RuntimeAssetLoader] Generated {bossSprites.Count} detailed boss sprites with animations");
+        Debug.Log($"[RuntimeAssetLoader] Generated {bossSprites.Count} detailed boss sprites with animations ({bakedCount} animations baked)");
     }
 
     private static void GenerateEffectSprites()